@@ -0,0 +1,52 @@
+import argparse
+import sys
+from benchmarks import suite
+
+
+def parse_arguments():
+    """
+    Parses the command line arguments of the benchmark runner.
+    """
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="Runs the headless benchmark suite.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = subparsers.add_parser("run", help="run benchmarks and store the results as JSON")
+    run_parser.add_argument("-o", "--output", default="cache/benchmarks.json", help="result file")
+    run_parser.add_argument("-k", "--filter", help="only run cases whose name contains this text")
+    run_parser.add_argument("--entities", type=lambda text: [int(value) for value in text.split(",")],
+                            help="comma separated entity counts (default: 0,50,200)")
+    run_parser.add_argument("--repetitions", type=int, default=5, help="repetitions per case")
+    run_parser.add_argument("--number", type=int, default=20, help="calls per repetition")
+
+    compare_parser = subparsers.add_parser("compare", help="compare results with a baseline")
+    compare_parser.add_argument("baseline", help="baseline result file")
+    compare_parser.add_argument("results", help="new result file")
+    compare_parser.add_argument("--tolerance", type=float, default=0.1,
+                                help="accepted relative slowdown before a case is flagged (default: 0.1)")
+    return parser.parse_args()
+
+
+def main():
+    arguments = parse_arguments()
+    if arguments.command == "run":
+        # Run the benchmarks and print the results while saving all of them.
+        parameter_values = {"entities": arguments.entities} if arguments.entities else None
+        cases = suite.get_cases(arguments.filter, parameter_values)
+        results = suite.run(suite.create_game(), cases, arguments.repetitions, arguments.number)
+        for case_name, result in results["results"].items():
+            print(f"{case_name:<45} min {result['min_us']:11.1f} us   median {result['median_us']:11.1f} us")
+        suite.save_results(results, arguments.output)
+        print(f"Results written to {arguments.output}")
+    else:
+        # Compare the results and fail if any case has become slower than accepted.
+        comparison = suite.compare(suite.load_results(arguments.baseline), suite.load_results(arguments.results),
+                                   arguments.tolerance)
+        for case_name, baseline_time, new_time, ratio, regression in comparison:
+            flag = "REGRESSION" if regression else ""
+            print(f"{case_name:<45} {baseline_time:11.1f} us -> {new_time:11.1f} us  {ratio:5.2f}x  {flag}")
+        if any(regression for *_, regression in comparison):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
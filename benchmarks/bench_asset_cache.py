@@ -0,0 +1,32 @@
+import shutil
+import tempfile
+from benchmarks.common import BenchmarkAssets, init_display, time_load_assets
+
+
+def main(repetitions=5):
+    """
+    Compares loading the assets without cache, with a cold cache and with a warm cache.
+    """
+    init_display()
+    cache_folder = tempfile.mkdtemp(prefix="asset_cache_")
+    BenchmarkAssets.config_overrides = {"cache_path": cache_folder, "asset_cache": False}
+    try:
+        assets = BenchmarkAssets()
+        uncached = time_load_assets(assets, repetitions)
+
+        BenchmarkAssets.config_overrides["asset_cache"] = True
+        cold = []
+        for _ in range(repetitions):
+            shutil.rmtree(cache_folder, ignore_errors=True)
+            cold.append(time_load_assets(assets, 1))
+        warm = time_load_assets(assets, repetitions)
+    finally:
+        shutil.rmtree(cache_folder, ignore_errors=True)
+
+    print(f"load_assets without cache: {uncached:8.2f} ms")
+    print(f"load_assets cold cache:    {min(cold):8.2f} ms")
+    print(f"load_assets warm cache:    {warm:8.2f} ms (speedup {uncached / warm:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
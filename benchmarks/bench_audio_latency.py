@@ -0,0 +1,40 @@
+import subprocess
+import sys
+from benchmarks.common import init_display
+
+import pygame
+from src.assets import Assets
+from src.audio import configure_mixer, probe_latency
+
+
+def measure(buffer):
+    """
+    Initializes the mixer with the given buffer size and prints nominal and measured output latency.
+
+    Args:
+        buffer (int): The mixer buffer size in samples.
+    """
+    audio_config = Assets.read_config()["audio"]
+    audio_config["buffer"] = buffer
+    configure_mixer(audio_config)
+    init_display((100, 100))
+    latency = probe_latency(audio_config)
+    print(f"buffer {buffer:5d}: one buffer {latency['buffer']:6.2f} ms, processing granularity "
+          f"{latency['granularity']:6.2f} ms, effective latency {latency['effective']:6.2f} ms")
+
+
+def main(buffers=(256, 512, 1024, 2048, 4096)):
+    """
+    Compares the output latency of different buffer sizes. Each buffer size runs in a fresh process, because the
+    mixer can only be configured before it is initialized.
+    """
+    print(f"Configured buffer: {Assets.read_config()['audio']['buffer']}")
+    for buffer in buffers:
+        subprocess.run([sys.executable, "-m", "benchmarks.bench_audio_latency", str(buffer)], check=True)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        measure(int(sys.argv[1]))
+    else:
+        main()
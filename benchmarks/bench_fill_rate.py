@@ -0,0 +1,65 @@
+import argparse
+import shutil
+import statistics
+import tempfile
+import time
+from benchmarks.common import BenchmarkAssets, init_display
+from benchmarks.suite import create_game, populate
+
+from src.assets import Assets
+
+
+def measure(scale, presentation, entities, frames):
+    """
+    Renders frames at an internal resolution and returns the median render time.
+
+    Args:
+        scale (float): The scale of the internal resolution.
+        presentation (str): How the canvas is scaled to the window ("scale" or "smoothscale").
+        entities (int): Number of entities on the screen.
+        frames (int): Number of measured frames.
+
+    Returns:
+        The median time of Game.render in milliseconds.
+    """
+    # Reload the playfield images for the internal resolution (the game and its entities use the same instance).
+    BenchmarkAssets.config_overrides["internal_resolution"] = {"scale": scale, "presentation": presentation}
+    Assets._instance.load_assets()
+    game = create_game()
+    populate(game, entities)
+
+    timings = []
+    for _ in range(frames):
+        start = time.perf_counter()
+        game.render()
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.bench_fill_rate",
+                                     description="Compares the render time at different internal resolutions.")
+    parser.add_argument("--scales", type=lambda text: [float(value) for value in text.split(",")],
+                        default=[1, 0.75, 0.5], help="comma separated scales (default: 1,0.75,0.5)")
+    parser.add_argument("--entities", type=int, default=200, help="entities on the screen (default: 200)")
+    parser.add_argument("--frames", type=int, default=200, help="measured frames per case (default: 200)")
+    arguments = parser.parse_args()
+
+    init_display()
+    # Use a temporary asset cache, so that the scaled images do not end up in the cache of the game.
+    cache_folder = tempfile.mkdtemp(prefix="asset_cache_")
+    BenchmarkAssets.config_overrides = {"cache_path": cache_folder}
+    Assets._instance = BenchmarkAssets()
+    try:
+        baseline = None
+        for scale in arguments.scales:
+            for presentation in ("scale", "smoothscale") if scale != 1 else ("scale",):
+                median = measure(scale, presentation, arguments.entities, arguments.frames)
+                baseline = baseline or median
+                print(f"scale {scale:<5} {presentation:<12} median {median:7.3f} ms  ({baseline / median:.2f}x)")
+    finally:
+        shutil.rmtree(cache_folder, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
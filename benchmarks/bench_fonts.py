@@ -0,0 +1,48 @@
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+import pygame
+from src.fonts import FontRegistry
+
+SIZES = (40, 30, 22)
+
+
+def measure(mode, cache_file, label):
+    """
+    Creates the comicsans fonts of the game in the given mode and prints the needed time.
+
+    Args:
+        mode (str): "sysfont" for pygame.font.SysFont, "registry" for the font registry.
+        cache_file (str): The cache file of the font registry.
+        label (str): The label of the measurement.
+    """
+    pygame.font.init()
+    start = time.perf_counter()
+    if mode == "sysfont":
+        [pygame.font.SysFont("comicsans", size) for size in SIZES]
+    else:
+        fonts = FontRegistry("assets/fonts", cache_file)
+        [fonts.get_font("comicsans", size) for size in SIZES]
+    print(f"{label:>16}: {(time.perf_counter() - start) * 1000:8.2f} ms")
+
+
+def main():
+    """
+    Compares SysFont with a cold and a warm font registry. Each measurement runs in a fresh process, because pygame
+    caches the system font list per process.
+    """
+    cache_file = os.path.join(tempfile.mkdtemp(prefix="font_cache_"), "fonts.json")
+    for mode, label in [("sysfont", "sysfont"), ("registry", "registry (cold)"), ("registry", "registry (warm)")]:
+        subprocess.run([sys.executable, "-W", "ignore", "-m", "benchmarks.bench_fonts", mode, cache_file, label],
+                       check=True, env={**os.environ, "PYGAME_HIDE_SUPPORT_PROMPT": "1"})
+    os.remove(cache_file)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        measure(*sys.argv[1:4])
+    else:
+        main()
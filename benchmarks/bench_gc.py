@@ -0,0 +1,85 @@
+import gc
+import math
+import random
+import subprocess
+import sys
+import time
+from benchmarks.common import init_display
+
+import pygame
+
+# Garbage collector policies compared by the benchmark.
+POLICIES = {
+    "off": {"enabled": False},
+    "thresholds": {"playing_mode": "thresholds"},
+    "disable": {"playing_mode": "disable"}
+}
+
+
+def measure(policy, frames=3000, spawn_interval=20):
+    """
+    Plays the game headless with the given garbage collector policy and prints frame time statistics.
+
+    Args:
+        policy (str): The name of the policy in POLICIES.
+        frames (int): Number of measured frames.
+        spawn_interval (int): Number of frames between two spawn events.
+    """
+    from src.enums import GameState
+    from src.game import Game
+    from src.gc_policy import GCPolicy
+
+    init_display()
+    random.seed(0)
+    game = Game([1344, 768], headless=True)
+    game.gc_policy = GCPolicy(**POLICIES[policy])
+    game.gc_policy.finish_startup()
+
+    # The player must survive the whole benchmark.
+    game.handle_player_collision = lambda: None
+    game.current_state = GameState.PLAYING
+    spawn_events = [game.obstacle_timer, game.enemy_timer, game.power_up_timer]
+
+    # Measure the time spent in collections.
+    gc_time = {"total": 0.0, "start": 0.0}
+
+    def track_gc(phase, info):
+        if phase == "start":
+            gc_time["start"] = time.perf_counter()
+        else:
+            gc_time["total"] += time.perf_counter() - gc_time["start"]
+    gc.callbacks.append(track_gc)
+    collections_before = sum(stats["collections"] for stats in gc.get_stats())
+
+    frame_times = []
+    for frame in range(frames):
+        start = time.perf_counter()
+        if frame % spawn_interval == 0:
+            event_type = spawn_events[frame // spawn_interval % len(spawn_events)]
+            game.handle_states_and_events(pygame.event.Event(event_type))
+        game.gc_policy.update(game.current_state)
+        game.update(game.timestep.step)
+        game.render()
+        frame_times.append((time.perf_counter() - start) * 1000)
+
+    collections = sum(stats["collections"] for stats in gc.get_stats()) - collections_before
+    frame_times.sort()
+    p99 = frame_times[math.ceil(0.99 * len(frame_times)) - 1]
+    print(f"{policy:>10}: avg {sum(frame_times) / len(frame_times):6.2f} ms, p99 {p99:6.2f} ms, "
+          f"max {frame_times[-1]:6.2f} ms, {collections:4d} collections taking {gc_time['total'] * 1000:7.2f} ms")
+
+
+def main():
+    """
+    Compares frame times while playing with different garbage collector policies. Each policy runs in a fresh
+    process.
+    """
+    for policy in POLICIES:
+        subprocess.run([sys.executable, "-m", "benchmarks.bench_gc", policy], check=True)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        measure(sys.argv[1])
+    else:
+        main()
@@ -0,0 +1,60 @@
+import subprocess
+import sys
+
+
+def parse_import_time(stderr):
+    """
+    Parses the output of "python -X importtime".
+
+    Args:
+        stderr (str): The standard error output of the interpreter.
+
+    Returns:
+        A list of (module, self time, cumulative time) tuples in microseconds. Nested imports keep their
+        indentation.
+    """
+    imports = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_time, cumulative_time, module = line[len("import time:"):].split("|")
+        imports.append((module.rstrip()[1:], int(self_time), int(cumulative_time)))
+    return imports
+
+
+def measure_import_time(module):
+    """
+    Imports a module in a fresh interpreter and measures the import time of all modules it loads.
+
+    Args:
+        module (str): The module to be imported.
+
+    Returns:
+        A list of (module, self time, cumulative time) tuples in microseconds.
+    """
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"], capture_output=True,
+                            text=True, check=True)
+    return parse_import_time(result.stderr)
+
+
+def main(module="main", top=15):
+    """
+    Prints the total import time of the game and the modules that take the longest to import.
+    """
+    imports = measure_import_time(module)
+    # Top-level imports are not indented by the import time output.
+    top_level = [entry for entry in imports if not entry[0].startswith(" ")]
+    total = sum(cumulative_time for _, _, cumulative_time in top_level)
+    loaded = {name.strip() for name, _, _ in imports}
+
+    print(f"Import of '{module}': {total / 1000:8.2f} ms for {len(imports)} modules")
+    # Note that numpy is also imported by pygame itself (pygame.surfarray) when it is installed.
+    for heavy_module in ["pandas", "numpy", "tkinter"]:
+        print(f"  {heavy_module} loaded: {heavy_module in loaded}")
+    print("Slowest modules (self time):")
+    for name, self_time, _ in sorted(imports, key=lambda entry: -entry[1])[:top]:
+        print(f"  {self_time / 1000:8.2f} ms  {name.strip()}")
+
+
+if __name__ == "__main__":
+    main(*sys.argv[1:2])
@@ -0,0 +1,43 @@
+import os
+import subprocess
+import sys
+import time
+from benchmarks.common import get_resident_memory
+
+import pygame
+
+
+def measure(mode):
+    """
+    Loads the background music in the given mode and prints load time and resident memory growth.
+
+    Args:
+        mode (str): "sound" for decoding into a pygame.mixer.Sound, "stream" for pygame.mixer.music.
+    """
+    pygame.mixer.init()
+    path = os.path.join("assets", "audio", "music.mp3")
+    memory_before = get_resident_memory()
+    start = time.perf_counter()
+    if mode == "sound":
+        music = pygame.mixer.Sound(path)
+    else:
+        pygame.mixer.music.load(path)
+    load_time = (time.perf_counter() - start) * 1000
+    memory_after = get_resident_memory()
+    memory = f"{memory_after - memory_before:7.2f} MB" if memory_before is not None else "n/a"
+    print(f"{mode:>6}: load {load_time:8.2f} ms, resident memory +{memory}")
+
+
+def main():
+    """
+    Compares decoding the music into a Sound with streaming it. Each mode runs in a fresh process.
+    """
+    for mode in ["sound", "stream"]:
+        subprocess.run([sys.executable, "-m", "benchmarks.bench_music", mode], check=True)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        measure(sys.argv[1])
+    else:
+        main()
@@ -0,0 +1,49 @@
+import argparse
+import time
+from benchmarks.common import init_display
+
+from src.pacing import FramePacer
+
+
+def measure(mode, fps, frames, work_ms):
+    """
+    Paces frames with a simulated workload and returns the jitter statistics.
+
+    Args:
+        mode (str): The frame pacing mode.
+        fps (int): The target frame rate.
+        frames (int): Number of measured frames.
+        work_ms (float): Simulated work per frame in milliseconds.
+
+    Returns:
+        The jitter statistics of the mode.
+    """
+    frame_pacer = FramePacer(fps, mode, history=frames)
+    frame_pacer.tick()
+    for _ in range(frames):
+        # Simulate the update and render work of a frame.
+        end = time.perf_counter() + work_ms / 1000
+        while time.perf_counter() < end:
+            pass
+        frame_pacer.tick()
+    return frame_pacer.get_jitter_statistics()
+
+
+def main():
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.bench_pacing",
+                                     description="Compares the frame time jitter of the frame pacing modes.")
+    parser.add_argument("--fps", type=int, default=120, help="target frame rate (default: 120)")
+    parser.add_argument("--frames", type=int, default=300, help="measured frames per mode (default: 300)")
+    parser.add_argument("--work-ms", type=float, default=3.0, help="simulated work per frame (default: 3 ms)")
+    arguments = parser.parse_args()
+
+    init_display((100, 100))
+    print(f"Deviation from {1000 / arguments.fps:.2f} ms per frame with {arguments.work_ms} ms of work:")
+    for mode in FramePacer.CALIBRATED_MODES:
+        statistics = measure(mode, arguments.fps, arguments.frames, arguments.work_ms)
+        print(f"  {mode:<7} mean {statistics['mean_ms']:6.3f} ms  p99 {statistics['p99_ms']:6.3f} ms  "
+              f"{FramePacer.format_histogram(statistics)}")
+
+
+if __name__ == "__main__":
+    main()
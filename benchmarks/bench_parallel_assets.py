@@ -0,0 +1,23 @@
+import os
+from benchmarks.common import BenchmarkAssets, init_display, time_load_assets
+
+
+def main(repetitions=3, thread_counts=(1, 2, 4, 8)):
+    """
+    Compares cold loading of the assets (no cache) with different numbers of loader threads.
+    """
+    init_display()
+    BenchmarkAssets.config_overrides = {"asset_cache": False, "asset_loader_threads": 1}
+    assets = BenchmarkAssets()
+
+    print(f"Available cores: {os.cpu_count()}")
+    serial = None
+    for threads in thread_counts:
+        BenchmarkAssets.config_overrides["asset_loader_threads"] = threads
+        timing = time_load_assets(assets, repetitions)
+        serial = serial or timing
+        print(f"load_assets cold, {threads} thread(s): {timing:8.2f} ms (speedup {serial / timing:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+import argparse
+import time
+from benchmarks.common import init_display
+
+import pygame
+from src.assets import Assets
+
+
+def measure(target, image, blits):
+    """
+    Blits an image repeatedly and returns the throughput.
+
+    Args:
+        target (pygame.Surface): The surface to draw on.
+        image (pygame.Surface): The image.
+        blits (int): Number of blits.
+
+    Returns:
+        The number of blits per second.
+    """
+    positions = [((index * 37) % max(1, target.get_width() - image.get_width()),
+                  (index * 53) % max(1, target.get_height() - image.get_height())) for index in range(blits)]
+    start = time.perf_counter()
+    target.blits([(image, position) for position in positions], doreturn=False)
+    return blits / (time.perf_counter() - start)
+
+
+def create_variants(image):
+    """
+    Converts an image into every surface format that keeps its transparency (and alpha for comparison).
+
+    Args:
+        image (pygame.Surface): The image with per-pixel alpha.
+
+    Returns:
+        A dictionary that maps the name of each variant to the converted image.
+    """
+    surface_format = Assets.get_surface_format(image)
+    variants = {"convert_alpha": image.convert_alpha()}
+    if surface_format == "opaque":
+        variants["convert"] = image.convert()
+    if surface_format in ("opaque", "colorkey"):
+        colorkey_image = Assets.convert_image(image, "colorkey")
+        variants["colorkey + RLEACCEL"] = colorkey_image
+        variants["colorkey"] = colorkey_image.copy()
+        variants["colorkey"].set_colorkey(colorkey_image.get_colorkey())
+    return variants
+
+
+def main():
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.bench_surface_formats",
+                                     description="Compares the blit throughput of the surface formats.")
+    parser.add_argument("--blits", type=int, default=2000, help="blits per image and format (default: 2000)")
+    arguments = parser.parse_args()
+
+    screen = init_display()
+    assets = Assets()
+    # The choice of the asset pipeline for every image.
+    print("Surface formats chosen by the asset pipeline:")
+    for name in assets.startup_image_names:
+        entry = getattr(assets, name)
+        image = entry[0] if isinstance(entry, list) else entry
+        surface_format = "colorkey" if image.get_colorkey() else (
+            "alpha" if image.get_flags() & pygame.SRCALPHA else "opaque")
+        print(f"  {name:<35} {surface_format}")
+
+    # Blit throughput of an opaque, a binary transparent and a translucent image in every possible format.
+    print("Blit throughput:")
+    for name in ("background_image", "robot_images", "meteor_images"):
+        entry = getattr(assets, name)
+        image = (entry[0] if isinstance(entry, list) else entry).convert_alpha()
+        blits = arguments.blits if image.get_width() < screen.get_width() else arguments.blits // 20
+        for variant, converted_image in create_variants(image).items():
+            rate = measure(screen, converted_image, blits)
+            print(f"  {name:<20} {variant:<20} {rate:12.0f} blits/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+import os
+import time
+
+# Benchmarks run headless.
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+from src.assets import Assets
+
+
+class BenchmarkAssets(Assets):
+    """
+    Assets whose configuration can be overridden by benchmarks (e.g. a temporary cache folder, so that the cache of
+    the game is not touched).
+    """
+    config_overrides = {}
+
+    def load_config(self):
+        super().load_config()
+        self.config.update(self.config_overrides)
+
+
+def init_display(size=(1344, 768)):
+    """
+    Initializes pygame with a (headless) display, which is required for converting images.
+    """
+    pygame.init()
+    return pygame.display.set_mode(size)
+
+
+def time_load_assets(assets, repetitions):
+    """
+    Measures the time needed for loading all assets.
+
+    Args:
+        assets (Assets): The assets instance.
+        repetitions (int): Number of measurements.
+
+    Returns:
+        The best measured time in milliseconds.
+    """
+    timings = []
+    for _ in range(repetitions):
+        start = time.perf_counter()
+        assets.load_assets()
+        timings.append((time.perf_counter() - start) * 1000)
+    return min(timings)
+
+
+def get_resident_memory():
+    """
+    Gets the resident memory of the current process.
+
+    Returns:
+        The resident memory in megabytes or None if it cannot be determined on this platform.
+    """
+    try:
+        with open("/proc/self/statm", "r") as file:
+            resident_pages = int(file.read().split()[1])
+        return resident_pages * os.sysconf("SC_PAGE_SIZE") / 1024 ** 2
+    except (OSError, ValueError, AttributeError):
+        return None
@@ -0,0 +1,198 @@
+import argparse
+import math
+import random
+import time
+from benchmarks import suite
+
+from src.frame_profiler import FrameProfiler
+
+# Sections of a frame whose scaling is reported (in addition to the whole frame), as measured by the frame profiler.
+SECTIONS = tuple(section for sections in FrameProfiler.SECTIONS.values() for section in sections)
+# A section is reported as non-linear when its time grows faster than this power of the entity count.
+NON_LINEAR_EXPONENT = 1.25
+# Sections taking less than this many milliseconds are ignored when looking for non-linear growth (noise).
+MIN_SECTION_MS = 0.5
+
+
+def parse_list(text, value_type=int):
+    """
+    Parses a comma separated list.
+
+    Args:
+        text (str): The comma separated values.
+        value_type (type): The type of the values.
+
+    Returns:
+        The list of values.
+    """
+    return [value_type(value) for value in text.split(",")]
+
+
+def parse_arguments():
+    """
+    Parses the command line arguments of the stress mode.
+    """
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.stress",
+                                     description="Spawns growing numbers of entities to find the scaling limits.")
+    parser.add_argument("--kinds", type=lambda text: parse_list(text, str), default=list(suite.ENTITY_KINDS),
+                        help="entity kinds to sweep (default: all)")
+    parser.add_argument("--counts", type=parse_list, default=[10, 100, 1000, 10000, 100000],
+                        help="entity counts of the count sweep (default: 10,100,1000,10000,100000)")
+    parser.add_argument("--rates", type=parse_list, default=[1, 10, 100, 1000],
+                        help="entities spawned per frame in the spawn rate sweep (default: 1,10,100,1000)")
+    parser.add_argument("--frames", type=int, default=60, help="measured frames per step (default: 60)")
+    parser.add_argument("--max-step-seconds", type=float, default=5.0,
+                        help="a step ends after this time even if not all frames are measured (default: 5)")
+    parser.add_argument("--max-frame-ms", type=float, default=1000.0,
+                        help="a sweep ends once the average frame takes longer than this (default: 1000)")
+    parser.add_argument("-o", "--output", default="cache/stress.json", help="result file")
+    return parser.parse_args()
+
+
+def measure_step(game, frames, max_step_seconds, spawn=None):
+    """
+    Runs frames of the game and measures the time of the frame and its sections.
+
+    Args:
+        game (Game): The headless game.
+        frames (int): Number of measured frames.
+        max_step_seconds (float): Time after which the step ends (at least three frames are measured).
+        spawn (callable): Called at the start of every frame to spawn new entities or None.
+
+    Returns:
+        A dictionary with the average entity count, the average and 99th percentile frame time and the average time
+        of all sections (in milliseconds).
+    """
+    frame_profiler = game.frame_profiler
+    frame_profiler.reset()
+    entity_counts = []
+    step_start = time.perf_counter()
+    for frame in range(frames):
+        frame_profiler.begin_frame()
+        # Spawning happens during the event handling in the game.
+        if spawn:
+            spawn()
+        frame_profiler.mark("events")
+        game.update(game.timestep.step)
+        game.render()
+        frame_profiler.end_frame()
+        entity_counts.append(sum(game.count_entities().values()))
+        if frame >= 2 and time.perf_counter() - step_start > max_step_seconds:
+            break
+
+    _, average, percentile = frame_profiler.get_statistics(frame_profiler.frame_times)
+    return {
+        "frames": len(frame_profiler.frame_times),
+        "entities": sum(entity_counts) / len(entity_counts),
+        "frame_avg_ms": average,
+        "frame_p99_ms": percentile,
+        "sections_ms": {section: frame_profiler.get_statistics(frame_profiler.section_times[section])[1]
+                        for section in SECTIONS}
+    }
+
+
+def run_sweep(game, kind, counts, rates, arguments):
+    """
+    Runs the count and the spawn rate sweep for one kind of entity.
+
+    Args:
+        game (Game): The headless game.
+        kind (str): The kind of entity.
+        counts (list): The entity counts of the count sweep.
+        rates (list): The entities spawned per frame in the spawn rate sweep.
+        arguments (argparse.Namespace): The command line arguments.
+
+    Returns:
+        A dictionary with the steps of both sweeps.
+    """
+    sweeps = {"count": [], "rate": []}
+
+    # Count sweep: a fixed population of entities placed on the screen.
+    for count in counts:
+        suite.populate(game, count, (kind,))
+        step = dict(count=count, **measure_step(game, arguments.frames, arguments.max_step_seconds))
+        sweeps["count"].append(step)
+        print_step(kind, f"count {count}", step)
+        if step["frame_avg_ms"] > arguments.max_frame_ms:
+            break
+
+    # Spawn rate sweep: new entities appear near the right edge every frame and leave the screen again.
+    for rate in rates:
+        suite.populate(game, 0)
+
+        def spawn():
+            for _ in range(rate):
+                suite.spawn_entity(game, kind, game.width - random.randint(50, 250))
+        step = dict(rate=rate, **measure_step(game, arguments.frames, arguments.max_step_seconds, spawn))
+        sweeps["rate"].append(step)
+        print_step(kind, f"rate {rate}/frame", step)
+        if step["frame_avg_ms"] > arguments.max_frame_ms:
+            break
+    return sweeps
+
+
+def print_step(kind, label, step):
+    """
+    Prints the results of a step.
+
+    Args:
+        kind (str): The kind of entity.
+        label (str): Describes the step (count or spawn rate).
+        step (dict): The results of the step.
+    """
+    sections = " ".join(f"{section} {time_ms:8.2f}" for section, time_ms in step["sections_ms"].items())
+    print(f"{kind:<10} {label:<16} entities {step['entities']:9.0f}  frame avg {step['frame_avg_ms']:9.2f} ms  "
+          f"p99 {step['frame_p99_ms']:9.2f} ms | {sections}")
+
+
+def find_non_linear_growth(steps):
+    """
+    Finds the first section whose time grows faster than linearly with the number of entities.
+
+    Args:
+        steps (list): The steps of a sweep.
+
+    Returns:
+        A tuple (section, entities before, entities after, exponent) or None if everything scales linearly.
+    """
+    for previous, current in zip(steps, steps[1:]):
+        if previous["entities"] < 1 or current["entities"] <= previous["entities"]:
+            continue
+        for section, time_ms in current["sections_ms"].items():
+            previous_time_ms = previous["sections_ms"][section]
+            if time_ms < MIN_SECTION_MS or previous_time_ms <= 0:
+                continue
+            exponent = math.log(time_ms / previous_time_ms) / math.log(current["entities"] / previous["entities"])
+            if exponent > NON_LINEAR_EXPONENT:
+                return section, previous["entities"], current["entities"], exponent
+    return None
+
+
+def main():
+    arguments = parse_arguments()
+    game = suite.create_game()
+    # Record the frame and section times with the frame profiler, but without drawing its overlay.
+    game.frame_profiler.toggle()
+    game.frame_profiler.refresh_interval = None
+
+    # Sweep every kind of entity and report the first subsystem that does not scale linearly.
+    results = {"arguments": vars(arguments), "sweeps": {}}
+    for kind in arguments.kinds:
+        results["sweeps"][kind] = run_sweep(game, kind, arguments.counts, arguments.rates, arguments)
+
+    print()
+    for kind, sweeps in results["sweeps"].items():
+        for sweep, steps in sweeps.items():
+            growth = find_non_linear_growth(steps)
+            if growth:
+                section, entities_before, entities_after, exponent = growth
+                print(f"{kind} ({sweep} sweep): {section} grows with exponent {exponent:.2f} between "
+                      f"{entities_before:.0f} and {entities_after:.0f} entities")
+            else:
+                print(f"{kind} ({sweep} sweep): all sections scale linearly")
+    suite.save_results(results, arguments.output)
+    print(f"Scaling curves written to {arguments.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,345 @@
+import json
+import os
+import platform
+import random
+import statistics
+import tempfile
+import time
+from benchmarks.common import init_display
+
+import pygame
+
+# Default numbers of entities for benchmarks depending on the amount of entities.
+ENTITY_COUNTS = (0, 50, 200)
+# Kinds of entities that can be spawned.
+ENTITY_KINDS = ("obstacle", "enemy", "power_up", "projectile")
+# Default number of runs in the run history of the save data benchmark.
+HISTORY_LENGTH = 10000
+
+# Registered benchmarks: name -> (function, parameter name, parameter values).
+BENCHMARKS = {}
+
+
+def register(name, parameter=None, values=(None,)):
+    """
+    Registers a benchmark. The benchmark function gets the game and a parameter value and returns a function
+    preparing a measurement (or None) and the function to be measured.
+
+    Args:
+        name (str): The name of the benchmark.
+        parameter (str): The name of the parameter (e.g. "entities") or None.
+        values (tuple): The default parameter values, a case is run for each value.
+    """
+    def decorator(function):
+        BENCHMARKS[name] = (function, parameter, values)
+        return function
+    return decorator
+
+
+def create_game():
+    """
+    Creates a headless game in the playing state in which the player cannot die.
+
+    Returns:
+        The game.
+    """
+    from src.enums import GameState
+    from src.game import Game
+
+    init_display()
+    game = Game([1344, 768], headless=True)
+    game.handle_player_collision = lambda: None
+    game.current_state = GameState.PLAYING
+    return game
+
+
+def spawn_entity(game, kind, x):
+    """
+    Spawns an entity of the given kind at a random height.
+
+    Args:
+        game (Game): The game.
+        kind (str): "obstacle", "enemy", "power_up" or "projectile".
+        x (int): The horizontal position.
+    """
+    from src.enemy import Enemy
+    from src.enums import EnemyType, PowerUpType
+    from src.obstacle import Obstacle
+    from src.powerup import PowerUp
+    from src.projectile import Projectile
+
+    if kind == "obstacle":
+        game.obstacles.add(Obstacle([x, 585], game.assets.meteor_images, "meteor", 0, game))
+    elif kind == "enemy":
+        game.enemies.add(Enemy([x, random.choice([100, 512])], random.choice(list(EnemyType)), game))
+    elif kind == "power_up":
+        game.power_ups.add(PowerUp([x, random.randint(0, 400)], random.choice(list(PowerUpType)), game))
+    else:
+        game.projectiles.add(Projectile([x, random.randint(100, 600)], [random.choice([-5, 5]), 0],
+                                        [game.assets.projectile_image], game, "enemy"))
+
+
+def populate(game, entity_count, kinds=ENTITY_KINDS):
+    """
+    Replaces all entities by the given number of entities, spread over the screen at reproducible positions.
+
+    Args:
+        game (Game): The game.
+        entity_count (int): The total number of entities.
+        kinds (tuple): The kinds of entities, which are spawned in turns.
+    """
+    random.seed(entity_count)
+    for group in (game.obstacles, game.enemies, game.power_ups, game.projectiles):
+        group.empty()
+    game.player.sprite.reset()
+
+    for index in range(entity_count):
+        spawn_entity(game, kinds[index % len(kinds)], random.randint(300, game.width - 100))
+
+
+@register("game.update", "entities", ENTITY_COUNTS)
+def game_update(game, entities):
+    """Updates all game objects."""
+    return lambda: populate(game, entities), lambda: game.update(game.timestep.step)
+
+
+@register("game.render", "entities", ENTITY_COUNTS)
+def game_render(game, entities):
+    """Renders all game objects."""
+    return lambda: populate(game, entities), game.render
+
+
+@register("render.group_draw", "entities", (200, 2000, 10000))
+def render_group_draw(game, entities):
+    """Draws all entity groups with one Group.draw call per group (one blit per sprite)."""
+    def draw_groups():
+        for group in (game.obstacles, game.enemies, game.power_ups, game.projectiles):
+            group.draw(game.screen)
+    return lambda: populate(game, entities), draw_groups
+
+
+@register("render.render_queue", "entities", (200, 2000, 10000))
+def render_render_queue(game, entities):
+    """Draws all entity groups with the render queue (one blits call for all sprites)."""
+    def draw_queue():
+        for group in (game.obstacles, game.enemies, game.power_ups, game.projectiles):
+            game.render_queue.add_group("sprites", group)
+        game.render_queue.flush(game.screen, "sprites")
+    return lambda: populate(game, entities), draw_queue
+
+
+@register("render.parallax", "layers", (1, 3))
+def render_parallax(game, layers):
+    """Draws the given number of full screen parallax layers at a fractional scroll position."""
+    from src.parallax import ParallaxBackground
+
+    layer_configs = [{"image": "background_image", "scroll_factor": (index + 1) / layers} for index in range(layers)]
+    background = ParallaxBackground.from_config(layer_configs, game.assets, game.width)
+    background.scroll(123.4)
+
+    def draw_layers():
+        background.queue(game.render_queue, 0.5)
+        game.render_queue.flush(game.screen, "background")
+    return None, draw_layers
+
+
+@register("game.check_collision", "entities", ENTITY_COUNTS)
+def game_check_collision(game, entities):
+    """Checks the player against all entities and all enemies against the projectiles (as in Game.update)."""
+    def check_collisions():
+        for group in (game.obstacles, game.enemies, game.projectiles, game.power_ups):
+            game.check_collision(game.player.sprite, group)
+        for enemy in game.enemies:
+            game.check_collision(enemy, game.projectiles)
+    return lambda: populate(game, entities), check_collisions
+
+
+@register("player.update_animation")
+def player_update_animation(game, _):
+    """Updates the player animation while walking left, which flips the animation images."""
+    from src.enums import PlayerState
+
+    def prepare():
+        game.player.sprite.reset()
+        game.player.sprite.current_state = PlayerState.WALKING_LEFT
+    return prepare, lambda: game.player.sprite.update_animation(game.timestep.step)
+
+
+@register("entity.update", "entities", ENTITY_COUNTS)
+def entity_update(game, entities):
+    """Updates the rects of all entities via the shared Entity.update."""
+    from src.entity import Entity
+
+    def update_entities():
+        for group in (game.obstacles, game.enemies, game.power_ups, game.projectiles):
+            for entity in group:
+                Entity.update(entity)
+    return lambda: populate(game, entities), update_entities
+
+
+@register("assets.load_assets")
+def assets_load_assets(game, _):
+    """Loads all assets (with the asset cache of the game)."""
+    return None, game.assets.load_assets
+
+
+@register("startup.import_time", "module", ("src.game",))
+def startup_import_time(game, module):
+    """Imports a module in a fresh interpreter (the time includes the constant startup of the interpreter)."""
+    from benchmarks.bench_import_time import measure_import_time
+
+    return None, lambda: measure_import_time(module)
+
+
+@register("menu.display", "menu", ("main_menu", "settings_menu", "shop_menu", "stats_menu", "game_over_menu",
+                                   "pause_menu", "controls_menu"))
+def menu_display(game, menu):
+    """Displays a menu."""
+    return None, getattr(game, menu).display
+
+
+@register("save_load.save_game_data", "history", (HISTORY_LENGTH,))
+def save_game_data(game, history):
+    """Appends a run to a large run history, as done after every run."""
+    from src.manager import SaveLoadSystem
+
+    save_folder = tempfile.mkdtemp()
+    save_load_manager = SaveLoadSystem(".data", save_folder)
+
+    def prepare():
+        save_load_manager.save_data([random.randint(0, 5000) for _ in range(2 * history)], "run_distance")
+    return prepare, lambda: save_load_manager.save_game_data([[1, 1000]], ["run_distance"], ["ab"])
+
+
+@register("save_load.load_game_data", "history", (HISTORY_LENGTH,))
+def load_game_data(game, history):
+    """Loads a large run history."""
+    from src.manager import SaveLoadSystem
+
+    save_load_manager = SaveLoadSystem(".data", tempfile.mkdtemp())
+    save_load_manager.save_data([random.randint(0, 5000) for _ in range(2 * history)], "run_distance")
+    return None, lambda: save_load_manager.load_game_data(["run_distance"], [[0, 0]])
+
+
+def get_cases(name_filter=None, parameter_values=None):
+    """
+    Gets all benchmark cases.
+
+    Args:
+        name_filter (str): Only cases whose name contains this text are returned.
+        parameter_values (dict): Overrides the default values of parameters (e.g. {"entities": [10, 1000]}).
+
+    Returns:
+        A list of (case name, benchmark function, parameter value) tuples.
+    """
+    cases = []
+    for name, (function, parameter, values) in BENCHMARKS.items():
+        values = (parameter_values or {}).get(parameter, values)
+        for value in values:
+            case_name = f"{name}[{parameter}={value}]" if parameter else name
+            if not name_filter or name_filter in case_name:
+                cases.append((case_name, function, value))
+    return cases
+
+
+def measure(prepare, function, repetitions=5, number=20):
+    """
+    Measures a function. The preparation runs before every repetition and is not measured. A first call before
+    the measurement warms up caches (e.g. rendered texts or lazily loaded images).
+
+    Args:
+        prepare (callable): Prepares a repetition or None.
+        function (callable): The function to be measured.
+        repetitions (int): Number of repetitions.
+        number (int): Number of calls per repetition.
+
+    Returns:
+        A dictionary with minimum, median and mean time per call in microseconds.
+    """
+    if prepare:
+        prepare()
+    function()
+
+    timings = []
+    for _ in range(repetitions):
+        if prepare:
+            prepare()
+        start = time.perf_counter()
+        for _ in range(number):
+            function()
+        timings.append((time.perf_counter() - start) / number * 1e6)
+    return {"min_us": min(timings), "median_us": statistics.median(timings), "mean_us": statistics.mean(timings),
+            "repetitions": repetitions, "number": number}
+
+
+def run(game, cases, repetitions=5, number=20):
+    """
+    Runs benchmark cases.
+
+    Args:
+        game (Game): The headless game.
+        cases (list): The cases from get_cases.
+        repetitions (int): Number of repetitions per case.
+        number (int): Number of calls per repetition.
+
+    Returns:
+        The results including information about the environment.
+    """
+    results = {}
+    for case_name, function, value in cases:
+        prepare, measured_function = function(game, value)
+        results[case_name] = measure(prepare, measured_function, repetitions, number)
+    return {
+        "environment": {"platform": platform.platform(), "python": platform.python_version(),
+                        "pygame": pygame.version.ver, "cpu_count": os.cpu_count(), "timestamp": time.time()},
+        "results": results
+    }
+
+
+def compare(baseline, results, tolerance=0.1):
+    """
+    Compares results with a baseline based on the minimum time per call (the most stable statistic).
+
+    Args:
+        baseline (dict): The baseline results.
+        results (dict): The new results.
+        tolerance (float): Relative slowdown that is still accepted (0.1 = 10 %).
+
+    Returns:
+        A list of (case name, baseline time, new time, ratio, regression flag) tuples for all cases in both results.
+    """
+    comparison = []
+    for case_name, result in results["results"].items():
+        if case_name not in baseline["results"]:
+            continue
+        baseline_time = baseline["results"][case_name]["min_us"]
+        ratio = result["min_us"] / baseline_time if baseline_time else 1.0
+        comparison.append((case_name, baseline_time, result["min_us"], ratio, ratio > 1 + tolerance))
+    return comparison
+
+
+def load_results(path):
+    """
+    Loads benchmark results.
+
+    Args:
+        path (str): The JSON file.
+
+    Returns:
+        The results.
+    """
+    with open(path, "r") as file:
+        return json.load(file)
+
+
+def save_results(results, path):
+    """
+    Saves benchmark results.
+
+    Args:
+        results (dict): The results.
+        path (str): The JSON file.
+    """
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "w") as file:
+        json.dump(results, file, indent=2)
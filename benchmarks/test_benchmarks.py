@@ -0,0 +1,76 @@
+import argparse
+import os
+import pytest
+from unittest import mock
+from benchmarks import stress, suite
+
+# Optional baseline (e.g. from "python -m benchmarks run") against which every case is checked.
+BASELINE = os.environ.get("BENCHMARK_BASELINE")
+TOLERANCE = float(os.environ.get("BENCHMARK_TOLERANCE", "0.1"))
+
+
+@pytest.fixture(scope="module")
+def game():
+    """Creates the headless game shared by all benchmarks."""
+    return suite.create_game()
+
+@pytest.fixture(scope="module")
+def baseline():
+    """Loads the baseline results if one is configured."""
+    return suite.load_results(BASELINE) if BASELINE else None
+
+@pytest.mark.parametrize("case_name, function, value", suite.get_cases(), ids=[case[0] for case in suite.get_cases()])
+def test_benchmark(game, baseline, case_name, function, value):
+    """Runs a benchmark case and checks it against the baseline (if any)."""
+    prepare, measured_function = function(game, value)
+    result = suite.measure(prepare, measured_function, repetitions=3, number=10)
+    print(f"{case_name}: min {result['min_us']:.1f} us")
+
+    assert result["min_us"] > 0
+    if baseline and case_name in baseline["results"]:
+        baseline_time = baseline["results"][case_name]["min_us"]
+        assert result["min_us"] <= baseline_time * (1 + TOLERANCE), \
+            f"{case_name} regressed from {baseline_time:.1f} us to {result['min_us']:.1f} us!"
+
+def stress_step(entities, **sections_ms):
+    """Creates a synthetic step of a stress sweep."""
+    return {"entities": entities, "sections_ms": sections_ms}
+
+def test_parse_list():
+    """Tests if comma separated command line values are converted to their type."""
+    assert stress.parse_list("10,100,1000") == [10, 100, 1000]
+    assert stress.parse_list("obstacle,enemy", str) == ["obstacle", "enemy"]
+
+def test_stress_sections_match_frame_profiler():
+    """Tests if the stress mode reports every section of the frame profiler (including presenting the canvas)."""
+    assert stress.SECTIONS == ("events", "player", "groups", "collisions", "background", "sprites", "present", "hud",
+                               "flip")
+
+def test_find_non_linear_growth():
+    """Tests if the first section growing faster than linearly is found with its exponent."""
+    steps = [stress_step(100, sprites=1.0, collisions=1.0),
+             stress_step(1000, sprites=10.0, collisions=10.0),  # Both linear
+             stress_step(10000, sprites=100.0, collisions=1000.0)]  # Collisions quadratic
+    section, entities_before, entities_after, exponent = stress.find_non_linear_growth(steps)
+
+    assert (section, entities_before, entities_after) == ("collisions", 1000, 10000)
+    assert exponent == pytest.approx(2)
+
+def test_find_non_linear_growth_linear_and_noise():
+    """Tests if linear growth and sections below the noise threshold are not reported."""
+    steps = [stress_step(10, sprites=1.0, hud=0.01), stress_step(100, sprites=10.0, hud=0.4),
+             stress_step(100, sprites=50.0, hud=0.4)]  # No more entities
+    assert stress.find_non_linear_growth(steps) is None
+
+def test_run_sweep_stops_at_max_frame_time():
+    """Tests if both sweeps end after the first step whose average frame time exceeds the limit."""
+    arguments = argparse.Namespace(frames=5, max_step_seconds=1.0, max_frame_ms=10.0)
+    frame_times = iter([2.0, 20.0, 3.0, 30.0])
+    with mock.patch.object(suite, "populate"), mock.patch.object(stress, "print_step"), \
+            mock.patch.object(stress, "measure_step",
+                              side_effect=lambda *args: {"frame_avg_ms": next(frame_times)}) as mock_measure_step:
+        sweeps = stress.run_sweep(mock.Mock(), "enemy", [10, 100, 1000], [1, 10, 100], arguments)
+
+    assert [step["count"] for step in sweeps["count"]] == [10, 100]
+    assert [step["rate"] for step in sweeps["rate"]] == [1, 10]
+    assert mock_measure_step.call_count == 4
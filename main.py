@@ -1,9 +1,44 @@
-from src.game import Game
+import argparse
+import os
+from src.startup import StartupReport
+
+
+def parse_arguments():
+    """
+    Parses the command line arguments.
+    """
+    parser = argparse.ArgumentParser(description="Run the Cybernetic City: Endless Dash")
+    parser.add_argument("--headless", action="store_true",
+                        help="run without window and audio (e.g. for benchmarks)")
+    parser.add_argument("--startup-report", action="store_true",
+                        help="print the duration of all startup phases until the first frame")
+    parser.add_argument("--profile", choices=["cprofile", "sample"],
+                        help="profile the game with cProfile (.prof file) or a sampling profiler (collapsed stacks)")
+    parser.add_argument("--profile-scope", choices=["session", "playing"], default="session",
+                        help="profile the whole session or only the playing state (default: session)")
+    parser.add_argument("--profile-output", help="output file of the profile (default: cache/profile.prof or "
+                                                 "cache/profile.folded)")
+    return parser.parse_args()
 
 
 def main():
+    arguments = parse_arguments()
+    startup_report = StartupReport(arguments.startup_report)
+    if arguments.headless:
+        os.environ["SDL_VIDEODRIVER"] = "dummy"
+
+    # The game is imported here, so that the startup report also covers the imports.
+    from src.game import Game
+    from src.profiling import create_profiler
+    startup_report.mark("imports")
+
+    # Create the profiler if requested.
+    profiler = None
+    if arguments.profile:
+        profiler = create_profiler(arguments.profile, arguments.profile_output, arguments.profile_scope)
+
     # Create an instance of the Game class.
-    game = Game([1344, 768])
+    game = Game([1344, 768], arguments.headless, startup_report, profiler)
 
     # Start the game.
     game.start_game()
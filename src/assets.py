@@ -1,12 +1,19 @@
 import json
 import os
 import pygame
+from concurrent.futures import ThreadPoolExecutor
+from src.audio import MusicPlayer, SilentSound, SoundEffects
+from src.cache import AssetCache
+from src.fonts import FontRegistry
+from src.instrumentation import instrumentation
 
 
 class Assets(object):
     """
     Singleton class for managing game assets.
     """
+    # Candidates for the colorkey of images with binary transparency.
+    COLORKEYS = ((255, 0, 255), (0, 255, 255), (1, 2, 3))
     # Class attribute to store the singleton instance.
     _instance = None
 
@@ -22,6 +29,7 @@ class Assets(object):
         # Return the existing or newly created instance.
         return cls._instance
 
+    @instrumentation.timer("assets.load_assets")
     def load_assets(self):
         """
         Load game assets.
@@ -30,127 +38,290 @@ class Assets(object):
         self.load_config()
         audio_path = self.config["audio_path"]
         font_path = self.config["font_path"]
-        image_path = self.config["image_path"]
-
-        # Load all images required for the game.
-        # Images for background and pause button.
-        self.background_image = pygame.image.load(os.path.join(image_path, "background.png")).convert_alpha()
-        self.pause_button_image = pygame.transform.scale_by(
-            pygame.image.load(os.path.join(image_path, "icons/pause_button.png")).convert_alpha(), 0.25)
-
-        # Images for player.
-        self.player_idle = [pygame.transform.scale_by(
-            pygame.image.load(os.path.join(image_path, f"player/idle/idle{i}.png")).convert_alpha(), 4) for i in
-            range(1, 5)]
-        self.player_walk = [pygame.transform.scale_by(
-            pygame.image.load(os.path.join(image_path, f"player/walk/walk{i}.png")).convert_alpha(), 4) for i in
-            range(1, 7)]
-        self.player_jump = [pygame.transform.scale_by(
-            pygame.image.load(os.path.join(image_path, f"player/jump/jump{i}.png")).convert_alpha(), 4) for i in
-            range(1, 5)]
-        self.player_slide = [pygame.transform.scale_by(
-            pygame.image.load(os.path.join(image_path, f"player/slide/slide{i}.png")).convert_alpha(), 4) for i in
-            range(1, 2)]
-
-        # Images for obstacles.
-        self.car_images = [
-            pygame.transform.scale_by(pygame.image.load(os.path.join(image_path, "obstacles/car.png")).convert_alpha(),
-                                      1.5)]
-        self.meteor_images = [
-            pygame.transform.scale_by(
-                pygame.image.load(os.path.join(image_path, "obstacles/meteor.png")).convert_alpha(), 0.25)]
-
-        # Images for enemies.
-        self.drone_images = [pygame.transform.scale_by(
-            pygame.image.load(os.path.join(image_path, f"enemies/drone/idle/idle{i}.png")).convert_alpha(), 3) for i in
-            range(1, 5)]
-        self.capsule_image = pygame.transform.scale_by(
-            pygame.image.load(os.path.join(image_path, "bullets/capsule.png")).convert_alpha(),
-            1.5)
-        self.robot_images = [pygame.transform.scale_by(
-            pygame.image.load(os.path.join(image_path, f"enemies/robot/idle/idle{i}.png")).convert_alpha(), 3) for i in
-            range(1, 5)]
-        self.projectile_image = pygame.transform.scale_by(
-            pygame.image.load(os.path.join(image_path, "bullets/projectile.png")).convert_alpha(),
-            1.5)
-
-        # Images for menus.
-        self.menu_background = pygame.transform.scale(
-            pygame.image.load(os.path.join(image_path, "menu.png")).convert_alpha(),
-            (1344, 768))
-        self.game_over_image = pygame.transform.scale_by(
-            pygame.image.load(os.path.join(image_path, "game_over.png")).convert_alpha(), 0.5)
-        self.pause_image = pygame.transform.scale_by(
-            pygame.image.load(os.path.join(image_path, "pause.png")).convert_alpha(), 0.15)
-        self.settings_icon_big = pygame.transform.scale_by(
-            pygame.image.load(os.path.join(image_path, "icons/settings.png")).convert_alpha(), 0.6)
-        self.settings_icon_small = pygame.transform.scale_by(self.settings_icon_big, 0.5)
-        self.quit_icon = pygame.transform.scale_by(
-            pygame.image.load(os.path.join(image_path, "icons/quit.png")).convert_alpha(), 0.15)
-        self.stats_icon = pygame.transform.scale_by(
-            pygame.image.load(os.path.join(image_path, "icons/statistics.png")).convert_alpha(),
-            0.2)
-        self.shop_icon = pygame.transform.scale_by(
-            pygame.image.load(os.path.join(image_path, "icons/shopping_cart.png")).convert_alpha(),
-            0.05)
-        self.heart_icon = pygame.transform.scale_by(
-            pygame.image.load(os.path.join(image_path, "icons/heart.png")).convert_alpha(),
-            0.03)
-        self.weapon_icon = pygame.transform.scale_by(
-            pygame.image.load(os.path.join(image_path, "player/weapon/weapon2_right.png")).convert_alpha(), 5)
-
-        # Images for power ups.
-        self.invincible_powerup = [
-            pygame.transform.scale(
-                pygame.image.load(os.path.join(image_path, "power_ups/invincible.png")).convert_alpha(),
-                (56, 56))]
-        self.invincible_powerup_inactive = [
-            pygame.transform.scale(
-                pygame.image.load(os.path.join(image_path, "power_ups/invincible_inactive.png")).convert_alpha(),
-                (56, 56))]
-        self.freeze_powerup = [
-            pygame.transform.scale(pygame.image.load(os.path.join(image_path, "power_ups/freeze.png")).convert_alpha(),
-                                   (56, 56))]
-        self.freeze_powerup_inactive = [
-            pygame.transform.scale(
-                pygame.image.load(os.path.join(image_path, "power_ups/freeze_inactive.png")).convert_alpha(),
-                (56, 56))]
-        self.multiple_shots_power_up = [pygame.transform.scale(
-            pygame.image.load(os.path.join(image_path, "power_ups/multiple_shots.png")).convert_alpha(), (56, 56))]
-        self.multiple_shots_power_up_inactive = [pygame.transform.scale(
-            pygame.image.load(os.path.join(image_path, "power_ups/multiple_shots_inactive.png")).convert_alpha(),
-            (56, 56))]
-
-        # Images for weapon.
-        self.default_weapon_bullet = pygame.transform.scale_by(
-            pygame.image.load(os.path.join(image_path, "bullets/default_weapon.png")).convert_alpha(), 3)
-        self.default_weapon_images = [pygame.transform.scale_by(
-            pygame.image.load(os.path.join(image_path, "player/weapon/weapon1_right.png")).convert_alpha(), 2.5),
-            pygame.transform.scale_by(
-                pygame.image.load(os.path.join(image_path, "player/weapon/weapon1_left.png")).convert_alpha(), 2.5)]
-        self.upgrade_weapon_bullet = pygame.transform.scale_by(
-            pygame.image.load(os.path.join(image_path, "bullets/upgrade_weapon.png")).convert_alpha(), 3)
-        self.upgrade_weapon_images = [pygame.transform.scale_by(
-            pygame.image.load(os.path.join(image_path, "player/weapon/weapon2_right.png")).convert_alpha(), 2.5),
-            pygame.transform.scale_by(
-                pygame.image.load(os.path.join(image_path, "player/weapon/weapon2_left.png")).convert_alpha(), 2.5)]
-
-        # Load all audio data required for the game.
-        self.music = pygame.mixer.Sound(os.path.join(audio_path, "music.mp3"))
-        self.sounds = {
-            "click": pygame.mixer.Sound(os.path.join(audio_path, "click.mp3")),
-            "jump": pygame.mixer.Sound(os.path.join(audio_path, "jump.mp3")),
-            "shoot": pygame.mixer.Sound(os.path.join(audio_path, "shoot.mp3"))
-        }
-
-        # Load all fonts required for the game.
-        self.font_big = pygame.font.Font(os.path.join(font_path, "stacker.ttf"), 100)
-        self.font_middle = pygame.font.Font(os.path.join(font_path, "stacker.ttf"), 60)
-        self.font_small = pygame.font.Font(os.path.join(font_path, "stacker.ttf"), 30)
-        self.font_comicsans_big = pygame.font.SysFont("comicsans", 40)
-        self.font_comicsans_middle = pygame.font.SysFont("comicsans", 30)
-        self.font_comicsans_small = pygame.font.SysFont("comicsans", 22)
+
+        # Scale of the internal resolution at which the playfield is rendered.
+        self.render_scale = self.config["internal_resolution"]["scale"]
+
+        # Load all images required for the game (except lazy ones) as declared in the asset manifest.
+        # Preprocessed images are taken from the asset cache if possible.
+        self.cache = AssetCache(self.config["cache_path"], self.config["asset_cache"])
+        startup_images, self.lazy_images = self.load_manifest()
+        self.load_images(startup_images)
+        self.startup_image_names = list(startup_images)
+
+        # Load all audio data required for the game. Music is streamed, so it is not decoded at startup. Without a
+        # mixer (e.g. when running headless) silent sounds are used instead.
+        self.music = MusicPlayer(audio_path, self.config["music_playlist"], self.config["music_fade_in"])
+        self.sounds = {name: self.load_sound(os.path.join(audio_path, f"{name}.mp3"))
+                       for name in ("click", "jump", "shoot")}
+        self.sound_effects = SoundEffects(self.sounds, self.config["audio"]["reserved_channels"])
+
+        # Load all fonts required for the game. Font families are resolved once and cached between launches.
+        self.fonts = FontRegistry(font_path, os.path.join(self.config["cache_path"], "fonts.json"))
+        self.font_big = self.fonts.get_font("stacker", 100)
+        self.font_middle = self.fonts.get_font("stacker", 60)
+        self.font_small = self.fonts.get_font("stacker", 30)
+        self.font_comicsans_big = self.fonts.get_font("comicsans", 40)
+        self.font_comicsans_middle = self.fonts.get_font("comicsans", 30)
+        self.font_comicsans_small = self.fonts.get_font("comicsans", 22)
+
+    def __getattr__(self, name):
+        """
+        Loads images of the lazy tier on first access.
+
+        Args:
+            name (str): The name of the accessed attribute.
+
+        Returns:
+            The loaded image or list of images.
+        """
+        lazy_images = self.__dict__.get("lazy_images", {})
+        if name not in lazy_images:
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+        self.load_images({name: lazy_images.pop(name)})
+        return self.__dict__[name]
+
+    def load_manifest(self):
+        """
+        Loads the asset manifest and translates its entries into image jobs.
+
+        Returns:
+            startup_images (dict): Maps attribute names to a job (file, transform) or to a list of jobs.
+            lazy_images (dict): Same as startup_images, but for images that are only loaded on first access.
+        """
+        with open(self.config["manifest_path"], "r") as file:
+            manifest = json.load(file)
+
+        # Playfield images are scaled to the internal resolution at which the playfield is rendered.
+        render_scale = self.config["internal_resolution"]["scale"]
+        startup_images = {}
+        lazy_images = {}
+        for group in manifest["groups"].values():
+            for name, entry in group["images"].items():
+                # Transform applied to all files of the entry.
+                if "scale_by" in entry:
+                    transform = ("scale_by", entry["scale_by"])
+                elif "size" in entry:
+                    transform = ("size", tuple(entry["size"]))
+                else:
+                    transform = None
+                if group.get("playfield") and render_scale != 1:
+                    transform = self.scale_transform(transform, render_scale)
+
+                # An entry is either a single file, a list of files or a numbered frame pattern (animations).
+                if "file" in entry:
+                    jobs = (entry["file"], transform)
+                elif "files" in entry:
+                    jobs = [(file, transform) for file in entry["files"]]
+                else:
+                    frames = entry["frames"]
+                    jobs = [(frames["pattern"].format(i), transform) for i in
+                            range(frames["first"], frames["first"] + frames["count"])]
+
+                tier = entry.get("tier", group.get("tier", "startup"))
+                (lazy_images if tier == "lazy" else startup_images)[name] = jobs
+        return startup_images, lazy_images
+
+    @staticmethod
+    def scale_transform(transform, scale):
+        """
+        Combines a transform with an additional scale factor.
+
+        Args:
+            transform (tuple): The transform ("scale_by", factor), ("size", (width, height)) or None.
+            scale (float): The additional scale factor.
+
+        Returns:
+            The combined transform.
+        """
+        if transform is None:
+            return "scale_by", scale
+        if transform[0] == "size":
+            return "size", (round(transform[1][0] * scale), round(transform[1][1] * scale))
+        return "scale_by", transform[1] * scale
+
+    def load_images(self, image_manifest):
+        """
+        Loads all images of a manifest. Every source file is decoded only once (in parallel by a thread pool, pygame
+        releases the GIL for most of this work) and identical (file, transform) pairs share the same surface. Only
+        the conversion to the display format is done on the main thread.
+
+        Args:
+            image_manifest (dict): Maps attribute names to a job (file, transform) or to a list of jobs.
+        """
+        # Collect the distinct transforms needed for each source file.
+        transforms_per_file = {}
+        for entry in image_manifest.values():
+            for file, transform in entry if isinstance(entry, list) else [entry]:
+                transforms = transforms_per_file.setdefault(file, [])
+                if transform not in transforms:
+                    transforms.append(transform)
+
+        # Decode and scale images (in parallel if more than one thread is configured).
+        threads = self.config["asset_loader_threads"]
+        if threads > 1:
+            with ThreadPoolExecutor(max_workers=threads) as executor:
+                results = list(executor.map(lambda item: self.decode_images(*item), transforms_per_file.items()))
+        else:
+            results = [self.decode_images(file, transforms) for file, transforms in transforms_per_file.items()]
+
+        # Convert images on the main thread into the cheapest surface format that keeps their transparency.
+        images = {}
+        for (file, transforms), decoded_images in zip(transforms_per_file.items(), results):
+            for transform, (image, surface_format) in zip(transforms, decoded_images):
+                images[(file, transform)] = self.convert_image(image, surface_format)
+
+        # Assign images to their attributes.
+        for name, entry in image_manifest.items():
+            if isinstance(entry, list):
+                setattr(self, name, [images[job] for job in entry])
+            else:
+                setattr(self, name, images[entry])
+
+        # All cached images have been converted, so their memory maps are not needed anymore.
+        self.cache.release()
+
+    def decode_images(self, file, transforms):
+        """
+        Decodes an image and applies one or more transforms to it. Safe to be called from worker threads.
+
+        Args:
+            file (str): The path of the image relative to the image folder.
+            transforms (list): Transforms ("scale_by", factor), ("size", (width, height)) or None.
+
+        Returns:
+            A list with one tuple per transform of the pygame.Surface (not yet converted to the display format) and
+            its surface format.
+        """
+        path = os.path.join(self.config["image_path"], file)
+        decoded_image = None
+        images = []
+        for transform in transforms:
+            if transform is None:
+                transform_key = "none"
+            elif transform[0] == "size":
+                transform_key = f"size={transform[1][0]}x{transform[1][1]}"
+            else:
+                transform_key = f"{transform[0]}={transform[1]}"
+
+            # Decoding, scaling and inspecting the pixels is skipped if there is a valid entry in the cache.
+            cached = self.cache.load(path, transform_key)
+            if cached is None:
+                if decoded_image is None:
+                    decoded_image = self.decode_image(path)
+                image = decoded_image
+                if transform is not None and transform[0] == "scale_by":
+                    image = pygame.transform.scale_by(decoded_image, transform[1])
+                elif transform is not None and transform[0] == "size":
+                    image = pygame.transform.scale(decoded_image, transform[1])
+                cached = image, self.get_surface_format(image)
+                self.cache.store(path, transform_key, *cached)
+            images.append(cached)
+        return images
+
+    @staticmethod
+    def get_surface_format(image):
+        """
+        Inspects the transparency of an image.
+
+        Args:
+            image (pygame.Surface): The image (not yet converted).
+
+        Returns:
+            "opaque" if all pixels are opaque, "colorkey" if every pixel is either opaque or fully transparent and
+            "alpha" if there are translucent pixels.
+        """
+        opaque_pixels = pygame.mask.from_surface(image, 254).count()
+        if opaque_pixels == image.get_width() * image.get_height():
+            return "opaque"
+        if pygame.mask.from_surface(image, 0).count() == opaque_pixels:
+            return "colorkey"
+        return "alpha"
+
+    @classmethod
+    def convert_image(cls, image, surface_format):
+        """
+        Converts an image to the display format. Opaque images lose their alpha channel, images with binary
+        transparency get a run-length encoded colorkey instead (both are blitted without blending every pixel) and
+        only translucent images keep per-pixel alpha.
+
+        Args:
+            image (pygame.Surface): The image.
+            surface_format (str): "opaque", "colorkey" or "alpha" (see get_surface_format).
+
+        Returns:
+            The converted image.
+        """
+        if surface_format == "opaque":
+            return image.convert()
+        if surface_format == "colorkey":
+            # The colorkey must not appear among the opaque pixels (transparent pixels do not match, as their alpha
+            # differs by 255).
+            for colorkey in cls.COLORKEYS:
+                if not pygame.mask.from_threshold(image, (*colorkey, 255), (1, 1, 1, 255)).count():
+                    converted_image = pygame.Surface(image.get_size()).convert()
+                    converted_image.fill(colorkey)
+                    converted_image.blit(image, (0, 0))
+                    converted_image.set_colorkey(colorkey, pygame.RLEACCEL)
+                    return converted_image
+        return image.convert_alpha()
+
+    def upload_textures(self, backend):
+        """
+        Uploads all images of the startup tier to textures, so that no image is uploaded while playing.
+
+        Args:
+            backend (TextureBackend): The texture backend, which keeps the textures.
+        """
+        for name in self.startup_image_names:
+            entry = getattr(self, name)
+            for image in entry if isinstance(entry, list) else [entry]:
+                backend.get_texture(image)
+
+    @staticmethod
+    def decode_image(path):
+        """
+        Decodes an image file.
+
+        Args:
+            path (str): The path of the image.
+
+        Returns:
+            The decoded image as pygame.Surface.
+        """
+        # Palette images are brought into a 32 bit format, so that their colorkey becomes transparent pixels.
+        image = pygame.image.load(path)
+        if image.get_bitsize() == 8 or image.get_colorkey() is not None:
+            decoded_image = image
+            image = pygame.Surface(decoded_image.get_size(), pygame.SRCALPHA, 32)
+            image.blit(decoded_image, (0, 0))
+        return image
+
+    @staticmethod
+    def load_sound(path):
+        """
+        Loads a sound effect.
+
+        Args:
+            path (str): The path of the sound file.
+
+        Returns:
+            The sound as pygame.mixer.Sound or a SilentSound if the mixer is not initialized.
+        """
+        if not pygame.mixer.get_init():
+            return SilentSound()
+        return pygame.mixer.Sound(path)
 
     def load_config(self):
+        self.config = self.read_config()
+
+    @staticmethod
+    def read_config():
+        """
+        Reads the configuration file (also usable before pygame and the assets are initialized).
+
+        Returns:
+            The configuration as dictionary.
+        """
         with open('config.json', 'r') as file:
-            self.config = json.load(file)
+            return json.load(file)
@@ -0,0 +1,202 @@
+import os
+import random
+import time
+import pygame
+
+
+class MusicPlayer:
+    """
+    Plays background music by streaming it from disk with pygame.mixer.music instead of decoding it into memory.
+    """
+    # Event that is posted by pygame when a track has ended.
+    END_EVENT = pygame.USEREVENT + 5
+
+    def __init__(self, audio_path, playlist, fade_in):
+        """
+        Initializes the music player. No track is loaded until the music is played.
+
+        Args:
+            audio_path (str): The folder containing the music files.
+            playlist (list): File names of the tracks to be played one after another.
+            fade_in (int): Duration in milliseconds for fading in the next track of the playlist. The music stream plays
+                one track at a time, so tracks cannot overlap.
+        """
+        self.playlist = [os.path.join(audio_path, track) for track in playlist]
+        self.fade_in = fade_in
+        self.current_track = 0
+        self.volume = 1.0
+
+    def play(self):
+        """
+        Starts streaming the current track. A single track is looped, otherwise the playlist is played in order.
+        Nothing is played if the mixer is not initialized (e.g. when running headless).
+        """
+        if not pygame.mixer.get_init():
+            return
+        pygame.mixer.music.load(self.playlist[self.current_track])
+        pygame.mixer.music.set_volume(self.volume)
+        if len(self.playlist) == 1:
+            pygame.mixer.music.play(-1)
+        else:
+            pygame.mixer.music.set_endevent(self.END_EVENT)
+            pygame.mixer.music.play(fade_ms=self.fade_in)
+
+    def handle_end_event(self):
+        """
+        Advances the playlist and fades in the next track. Must be called when END_EVENT is received.
+        """
+        self.current_track = (self.current_track + 1) % len(self.playlist)
+        self.play()
+
+    def get_volume(self):
+        """
+        Gets the music volume.
+
+        Returns:
+            The volume between 0.0 and 1.0.
+        """
+        return self.volume
+
+    def set_volume(self, volume):
+        """
+        Sets the music volume (also before the music has been started).
+
+        Args:
+            volume (float): The volume between 0.0 and 1.0.
+        """
+        self.volume = volume
+        if pygame.mixer.get_init():
+            pygame.mixer.music.set_volume(volume)
+
+
+class SilentSound:
+    """
+    Replacement for pygame.mixer.Sound that is used when the mixer is not initialized. It only keeps its volume, so
+    the volume settings still work.
+    """
+
+    def __init__(self):
+        """
+        Initializes the silent sound.
+        """
+        self.volume = 1.0
+
+    def play(self):
+        """
+        Does nothing, as there is no mixer to play the sound.
+        """
+
+    def get_volume(self):
+        """
+        Gets the volume of the sound.
+
+        Returns:
+            The volume between 0.0 and 1.0.
+        """
+        return self.volume
+
+    def set_volume(self, volume):
+        """
+        Sets the volume of the sound.
+
+        Args:
+            volume (float): The volume between 0.0 and 1.0.
+        """
+        self.volume = volume
+
+
+class SoundEffects:
+    """
+    Plays sound effects on a fixed pool of reserved channels per effect. Rapid-fire effects cycle through their own
+    channels instead of stealing arbitrary channels from other effects.
+    """
+
+    def __init__(self, sounds, reserved_channels):
+        """
+        Initializes the sound effects and reserves the mixer channels of their pools.
+
+        Args:
+            sounds (dict): Maps effect names to pygame.mixer.Sound objects.
+            reserved_channels (dict): Maps effect names to the number of channels reserved for the effect.
+        """
+        self.sounds = sounds
+        self.channel_pools = {}
+        self.next_channel = {}
+
+        # Without a mixer (e.g. when running headless) there are no channels to reserve.
+        if not pygame.mixer.get_init():
+            return
+
+        # Reserved channels are never picked by pygame for other sounds.
+        pygame.mixer.set_reserved(sum(reserved_channels.values()))
+        channel_id = 0
+        for name, channel_count in reserved_channels.items():
+            self.channel_pools[name] = [pygame.mixer.Channel(channel_id + i) for i in range(channel_count)]
+            self.next_channel[name] = 0
+            channel_id += channel_count
+
+    def play(self, name):
+        """
+        Plays a sound effect on the next channel of its pool (round robin).
+
+        Args:
+            name (str): The name of the sound effect.
+        """
+        pool = self.channel_pools.get(name)
+        if not pool:
+            self.sounds[name].play()
+            return
+        pool[self.next_channel[name]].play(self.sounds[name])
+        self.next_channel[name] = (self.next_channel[name] + 1) % len(pool)
+
+
+def configure_mixer(audio_config):
+    """
+    Configures the mixer for low latency. Must be called before pygame (or the mixer) is initialized.
+
+    Args:
+        audio_config (dict): Sample rate, sample size, channel count and buffer size of the mixer.
+    """
+    pygame.mixer.pre_init(frequency=audio_config["frequency"], size=audio_config["size"],
+                          channels=audio_config["channels"], buffer=audio_config["buffer"])
+
+
+def probe_latency(audio_config, trials=10, probe_length=50):
+    """
+    Measures the effective output latency of the mixer. A short silent probe sound is played several times (with a
+    random phase) and the delay of its end event compared to its length is measured. The mixer processes whole
+    buffers, so the spread of these delays shows how long a new sound may wait until it is processed. A processed
+    buffer then still has to be played by the audio device, which adds the nominal buffer latency.
+
+    Args:
+        audio_config (dict): The audio configuration (used for the nominal buffer latency).
+        trials (int): Number of probe sounds.
+        probe_length (int): Length of the probe sound in milliseconds.
+
+    Returns:
+        A dictionary with the nominal buffer latency, the measured processing granularity and the resulting
+        effective latency (all in milliseconds).
+    """
+    frequency, size, channels = pygame.mixer.get_init()
+    buffer_latency = audio_config["buffer"] / frequency * 1000
+
+    sample_bytes = abs(size) // 8 * channels
+    probe = pygame.mixer.Sound(buffer=bytes(int(frequency * probe_length / 1000) * sample_bytes))
+    channel = pygame.mixer.find_channel(True)
+    end_event = pygame.USEREVENT + 6
+    channel.set_endevent(end_event)
+
+    delays = []
+    for _ in range(trials):
+        # Start the probe at a random point of the mixer cycle.
+        pygame.time.wait(random.randint(0, int(buffer_latency) + 1))
+        pygame.event.clear(end_event)
+        start = time.perf_counter()
+        channel.play(probe)
+        while not pygame.event.peek(end_event):
+            pygame.time.wait(1)
+        delays.append((time.perf_counter() - start) * 1000 - probe_length)
+    channel.set_endevent()
+
+    granularity = max(delays) - min(delays)
+    return {"buffer": buffer_latency, "granularity": granularity, "effective": buffer_latency + granularity}
@@ -0,0 +1,214 @@
+import warnings
+import weakref
+import pygame
+from pygame._sdl2 import video
+from src.pacing import create_display
+
+
+def create_backend(name, size, title, vsync=False):
+    """
+    Creates the render backend and the display.
+
+    Args:
+        name (str): "software" or "texture". The texture backend falls back to the software backend when no hardware
+            accelerated renderer is available.
+        size (tuple): The size (width, height) of the window.
+        title (str): The title of the window.
+        vsync (bool): Whether presenting a frame waits for the monitor.
+
+    Returns:
+        The render backend.
+    """
+    if name == "texture":
+        try:
+            return TextureBackend(size, title, vsync)
+        except pygame.error as error:
+            warnings.warn(f"Accelerated rendering is not available ({error}), the software backend is used instead.")
+    elif name != "software":
+        raise ValueError(f"Unknown render backend '{name}'!")
+    return SoftwareBackend(size, title, vsync)
+
+
+class SoftwareBackend:
+    """
+    Draws everything with blits onto the display surface.
+    """
+    # Whether frames are drawn with textures (otherwise the display surface is the target of all drawing).
+    uses_textures = False
+
+    def __init__(self, size, title, vsync=False):
+        """
+        Creates the display.
+
+        Args:
+            size (tuple): The size (width, height) of the window.
+            title (str): The title of the window.
+            vsync (bool): Whether vsync is requested.
+        """
+        self.screen, self.vsync = create_display(size, vsync)
+        pygame.display.set_caption(title)
+
+    def present(self):
+        """
+        Shows the frame drawn onto the display surface.
+        """
+        pygame.display.flip()
+
+    def present_screen(self):
+        """
+        Shows the display surface (the target of the menus).
+        """
+        pygame.display.flip()
+
+    def capture_frame(self):
+        """
+        Copies the last frame into the display surface, so that menus can be drawn on top of it. The software backend
+        has drawn the frame there already.
+        """
+
+
+class TextureBackend:
+    """
+    Draws frames with the GPU: images are uploaded to textures once and drawn as textured quads, mirrored sprites are
+    flipped while drawing instead of keeping flipped copies.
+
+    The window is created by pygame._sdl2, a hidden display surface is kept for converting images and as the target
+    of the menus, which are drawn in software and uploaded as a whole.
+    """
+    uses_textures = True
+
+    def __init__(self, size, title, vsync=False, accelerated=True):
+        """
+        Creates the window, the renderer and the hidden display surface.
+
+        Args:
+            size (tuple): The size (width, height) of the window.
+            title (str): The title of the window.
+            vsync (bool): Whether presenting a frame waits for the monitor.
+            accelerated (bool): Whether a hardware accelerated renderer is required (otherwise the software renderer
+                of SDL may be used).
+        """
+        self.window = video.Window(title, size)
+        try:
+            self.renderer = video.Renderer(self.window, accelerated=1 if accelerated else 0, vsync=vsync)
+        except pygame.error:
+            self.window.destroy()
+            raise
+        self.vsync = vsync
+        self.screen = pygame.display.set_mode(size, pygame.HIDDEN)
+        # Frames are drawn into a target texture, so that the last frame is still available when a menu is shown.
+        self.frame = video.Texture(self.renderer, size, target=True)
+        self.screen_texture = video.Texture(self.renderer, size, streaming=True)
+        self.renderer.target = self.frame
+        # Textures of all surfaces drawn so far (released together with their surface).
+        self.textures = weakref.WeakKeyDictionary()
+
+    def get_texture(self, surface):
+        """
+        Gets the texture of a surface and uploads the surface the first time.
+
+        Args:
+            surface (pygame.Surface): The surface.
+
+        Returns:
+            The texture.
+        """
+        texture = self.textures.get(surface)
+        if texture is None:
+            texture = self.textures[surface] = video.Texture.from_surface(self.renderer, surface)
+        return texture
+
+    def get_target(self, scale=1):
+        """
+        Creates a target for the render queue that draws onto the current frame.
+
+        Args:
+            scale (float): Scale of the drawn surfaces relative to world coordinates (textures are stretched to their
+                size in world coordinates).
+
+        Returns:
+            The render target.
+        """
+        return TextureTarget(self, scale)
+
+    def present(self):
+        """
+        Shows the frame drawn into the frame texture.
+        """
+        self.renderer.target = None
+        self.frame.draw()
+        self.renderer.present()
+        self.renderer.target = self.frame
+
+    def present_screen(self):
+        """
+        Uploads the display surface (the target of the menus) and shows it.
+        """
+        self.screen_texture.update(self.screen)
+        self.renderer.target = None
+        self.screen_texture.draw()
+        self.renderer.present()
+        self.renderer.target = self.frame
+
+    def capture_frame(self):
+        """
+        Copies the last frame into the display surface, so that menus can be drawn on top of it.
+        """
+        self.renderer.to_surface(self.screen)
+
+
+class TextureTarget:
+    """
+    Render target of the texture backend, which draws queued surfaces with their textures.
+    """
+
+    def __init__(self, backend, scale=1):
+        """
+        Initializes the render target.
+
+        Args:
+            backend (TextureBackend): The texture backend.
+            scale (float): Scale of the drawn surfaces relative to world coordinates.
+        """
+        self.backend = backend
+        self.scale = scale
+
+    def blits(self, blit_sequence, doreturn=False):
+        """
+        Draws a sequence of surfaces (like Surface.blits).
+
+        Args:
+            blit_sequence (list): Items (surface, destination), (surface, destination, area) or (surface, destination,
+                area, flip_x) with an optional area of the surface (None for the whole surface).
+            doreturn (bool): Only for compatibility with Surface.blits, nothing is returned.
+        """
+        get_texture = self.backend.get_texture
+        scale = self.scale
+        for item in blit_sequence:
+            surface, destination = item[0], item[1]
+            area = item[2] if len(item) > 2 else None
+            width, height = area.size if area else surface.get_size()
+            # Empty surfaces (like empty texts) have no texture.
+            if not width or not height:
+                continue
+            if scale != 1:
+                width, height = width / scale, height / scale
+            get_texture(surface).draw(srcrect=area, dstrect=(destination[0], destination[1], width, height),
+                                      flip_x=len(item) > 3 and item[3])
+
+    def blit(self, surface, destination):
+        """
+        Draws a single surface (like Surface.blit).
+
+        Args:
+            surface (pygame.Surface): The surface.
+            destination (tuple | pygame.Rect): The position of the surface.
+        """
+        self.blits(((surface, destination),))
+
+    def get_height(self):
+        """
+        Returns:
+            The height of the window.
+        """
+        return self.backend.screen.get_height()
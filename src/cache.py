@@ -0,0 +1,129 @@
+import glob
+import hashlib
+import mmap
+import os
+import struct
+import pygame
+
+
+class AssetCache:
+    """
+    On-disk cache for preprocessed (decoded and transformed) images.
+
+    Every entry is a raw, uncompressed file with a small header followed by the pixel data, so it can be memory
+    mapped and handed to pygame without decoding. Entries are keyed by the hash of the source file, the transform
+    and the pixel format, which means that a changed source file automatically results in a cache miss. The header
+    also records the surface format chosen for the image, so that the pixels do not have to be inspected again.
+    """
+    # Header of a cache file: magic bytes, width, height and surface format (16 bytes in total).
+    HEADER = struct.Struct("<4sIII")
+    MAGIC = b"PSEC"
+    PIXEL_FORMAT = "RGBA"
+    # Surface formats stored in the header (as index + 1, 0 marks entries written without a surface format).
+    SURFACE_FORMATS = ("opaque", "colorkey", "alpha")
+
+    def __init__(self, cache_folder, enabled=True):
+        """
+        Initializes the asset cache.
+
+        Args:
+            cache_folder (str): The folder where cache files will be stored.
+            enabled (bool): Whether the cache is used at all.
+        """
+        self.cache_folder = cache_folder
+        self.enabled = enabled
+        # Memory maps backing surfaces that have been loaded from the cache.
+        self.mapped_files = []
+        if self.enabled:
+            os.makedirs(self.cache_folder, exist_ok=True)
+
+    def get_entry_paths(self, source_path, transform):
+        """
+        Gets the file name prefix of all entries for a source file and transform and the path of the current entry.
+
+        Args:
+            source_path (str): The path of the source image.
+            transform (str): A string describing the transform applied to the source image.
+
+        Returns:
+            prefix (str): The path prefix shared by all (also outdated) entries of the source file and transform.
+            entry_path (str): The path of the entry matching the current content of the source file.
+        """
+        # Hash the content of the source file together with transform and pixel format.
+        with open(source_path, "rb") as file:
+            content_hash = hashlib.sha1(file.read())
+        content_hash.update(f"{transform}:{self.PIXEL_FORMAT}".encode())
+        name_hash = hashlib.sha1(f"{source_path}:{transform}".encode())
+
+        prefix = os.path.join(self.cache_folder, name_hash.hexdigest()[:16])
+        return prefix, f"{prefix}-{content_hash.hexdigest()[:16]}.raw"
+
+    def load(self, source_path, transform):
+        """
+        Loads a preprocessed image from the cache.
+
+        Args:
+            source_path (str): The path of the source image.
+            transform (str): A string describing the transform applied to the source image.
+
+        Returns:
+            A tuple of the cached image as pygame.Surface (not yet converted) and its surface format or None if there
+            is no valid entry.
+        """
+        if not self.enabled:
+            return None
+        _, entry_path = self.get_entry_paths(source_path, transform)
+        if not os.path.exists(entry_path):
+            return None
+
+        # Remove empty or truncated entries (e.g. left behind by a crash), which cannot be mapped or have no header.
+        if os.path.getsize(entry_path) < self.HEADER.size:
+            os.remove(entry_path)
+            return None
+
+        with open(entry_path, "rb") as file:
+            mapped_file = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, width, height, surface_format = self.HEADER.unpack_from(mapped_file)
+        if magic != self.MAGIC or len(mapped_file) != self.HEADER.size + width * height * 4 or \
+                not 0 < surface_format <= len(self.SURFACE_FORMATS):
+            mapped_file.close()
+            os.remove(entry_path)
+            return None
+
+        # The surface directly uses the mapped pixel data, so the map must be kept alive until it is released.
+        self.mapped_files.append(mapped_file)
+        return (pygame.image.frombuffer(memoryview(mapped_file)[self.HEADER.size:], (width, height),
+                                        self.PIXEL_FORMAT), self.SURFACE_FORMATS[surface_format - 1])
+
+    def store(self, source_path, transform, surface, surface_format):
+        """
+        Stores a preprocessed image in the cache and removes outdated entries of the same source and transform.
+
+        Args:
+            source_path (str): The path of the source image.
+            transform (str): A string describing the transform applied to the source image.
+            surface (pygame.Surface): The preprocessed image.
+            surface_format (str): The surface format chosen for the image ("opaque", "colorkey" or "alpha").
+        """
+        if not self.enabled:
+            return
+        prefix, entry_path = self.get_entry_paths(source_path, transform)
+
+        # Remove entries created from an older version of the source file.
+        for outdated_path in glob.glob(f"{glob.escape(prefix)}-*.raw"):
+            if outdated_path != entry_path:
+                os.remove(outdated_path)
+
+        # Write to a temporary file first so that an interrupted write never leaves a broken entry.
+        width, height = surface.get_size()
+        temporary_path = f"{entry_path}.tmp"
+        with open(temporary_path, "wb") as file:
+            file.write(self.HEADER.pack(self.MAGIC, width, height, self.SURFACE_FORMATS.index(surface_format) + 1))
+            file.write(pygame.image.tobytes(surface, self.PIXEL_FORMAT))
+        os.replace(temporary_path, entry_path)
+
+    def release(self):
+        """
+        Releases the memory maps of loaded entries. Must only be called after the surfaces have been converted.
+        """
+        self.mapped_files = []
@@ -30,55 +30,68 @@ class Enemy(Entity):
         else:
             self.image_list = self.assets.robot_images
             self.projectile_image = self.assets.projectile_image
-        # Set enemy speed based on type.
+        # Set enemy speed (in pixels per second) based on type.
         self.speed = self.assets.config["drone_speed"] if self.type == EnemyType.ROBOT else self.assets.config[
             "robot_speed"]
 
         super().__init__(position, self.image_list, EnemyState.IDLE, game)
         self.attack_timer = 0
 
-    def handle_movement(self):
+    def handle_movement(self, dt):
         """
         Handles enemy movement logic.
+
+        Args:
+            dt (float): The duration of the simulation step in seconds.
         """
         # If the enemy type is a drone, it constantly moves from right to left and vice versa.
         if self.type == EnemyType.DRONE:
             if not self.current_state == EnemyState.WALKING_LEFT and \
                     self.position[0] < self.game.width - self.rect.width:
-                self.move_right()
+                self.move_right(dt)
             else:
                 if self.position[0] > 0:
-                    self.move_left()
+                    self.move_left(dt)
                 else:
                     self.current_state = EnemyState.WALKING_RIGHT
         # If the enemy type is a robot, it constantly moves in the player's direction.
         elif self.type == EnemyType.ROBOT:
             if self.position[0] > self.game.player.sprite.position[0]:
-                self.move_left()
+                self.move_left(dt)
             elif self.position[0] < self.game.player.sprite.position[0]:
-                self.move_right()
+                self.move_right(dt)
 
-    def move_left(self):
+    def move_left(self, dt):
         """
         Handles the movement of an enemy to the left.
+
+        Args:
+            dt (float): The duration of the simulation step in seconds.
         """
         self.current_state = EnemyState.WALKING_LEFT
-        self.position[0] -= (self.speed + self.game.scrolling_bg_speed)
+        self.position[0] -= (self.speed + self.game.scrolling_bg_speed) * dt
 
-    def move_right(self):
+    def move_right(self, dt):
         """
         Handles the movement of an enemy to the right.
+
+        Args:
+            dt (float): The duration of the simulation step in seconds.
         """
         self.current_state = EnemyState.WALKING_RIGHT
-        self.position[0] += self.speed
+        self.position[0] += self.speed * dt
 
-    def attack(self):
+    def attack(self, dt):
         """
         Handles enemy attack logic.
+
+        Args:
+            dt (float): The duration of the simulation step in seconds.
         """
         # The attacks are executed every second with a random probability.
-        self.attack_timer += 1
-        if self.attack_timer % (self.assets.config["attack_timer"] * self.assets.config["fps"]) == 0:
+        self.attack_timer += dt
+        if self.attack_timer >= self.assets.config["attack_timer"]:
+            self.attack_timer -= self.assets.config["attack_timer"]
             if random.random() < self.assets.config["attack_probability"]:
                 # Position, size and image of projectile depends on enemy type.
                 if self.type == EnemyType.DRONE:
@@ -88,7 +101,7 @@ class Enemy(Entity):
                                    [self.projectile_image], self.game, "enemy"))
                 elif self.type == EnemyType.ROBOT:
                     if self.game.player.sprite.position[0] < self.position[0]:
-                        projectile_position = [self.position[0] - self.projectile_image.get_width(),
+                        projectile_position = [self.position[0] - self.projectile_image.get_width() / self.render_scale,
                                                self.position[1] + 40]
                         self.game.projectiles.add(
                             Projectile(projectile_position,
@@ -100,10 +113,13 @@ class Enemy(Entity):
                             Projectile(projectile_position, [self.assets.config["projectile_velocity"], 0],
                                        [self.projectile_image], self.game, "enemy"))
 
-    def update(self):
+    def update(self, dt):
         """
         Updates enemy's position and calls attack function.
+
+        Args:
+            dt (float): The duration of the simulation step in seconds.
         """
-        self.handle_movement()
-        self.attack()
+        self.handle_movement(dt)
+        self.attack(dt)
         super().update()
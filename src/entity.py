@@ -1,4 +1,6 @@
 import pygame
+from src.assets import Assets
+from src.memory import live_objects
 
 
 class Entity(pygame.sprite.Sprite):
@@ -21,17 +23,38 @@ class Entity(pygame.sprite.Sprite):
         self.image_list = image_list
         self.game = game
         self.current_state = current_state
+        # Scale of the playfield images relative to the world coordinates (the internal render resolution).
+        self.render_scale = Assets().render_scale
 
         # The current image to be displayed.
         self.image = self.image_list[0]
-        self.rect = self.image.get_rect()
+        self.rect = self.get_world_rect()
+        # Whether the image is drawn mirrored horizontally (mirroring happens while drawing).
+        self.flip_x = False
         # Initial position of the image.
         self.rect.topleft = (self.position[0], self.position[1])
+        # Position in the previous simulation step, used to interpolate the position while rendering.
+        self.previous_topleft = self.rect.topleft
+        # Count the entity as live object (only if memory tracking is enabled).
+        live_objects.track(self)
 
     def update(self):
         """
         Update logic that is the same for all entities.
         """
         # Update the position of the rect based on the entity's position.
-        self.rect = self.image.get_rect()
+        self.rect = self.get_world_rect()
         self.rect.topleft = (self.position[0], self.position[1])
+
+    def get_world_rect(self):
+        """
+        Creates a rect with the size of the current image in world coordinates. The playfield images are scaled to the
+        internal render resolution, the world (positions, speeds and collisions) keeps the size of the window.
+
+        Returns:
+            The rect at position (0, 0).
+        """
+        if self.render_scale == 1:
+            return self.image.get_rect()
+        width, height = self.image.get_size()
+        return pygame.Rect(0, 0, round(width / self.render_scale), round(height / self.render_scale))
@@ -0,0 +1,86 @@
+import json
+import os
+import warnings
+import pygame
+
+
+class FontRegistry:
+    """
+    Resolves font families to font files once and caches the resolved paths between launches, so that the system
+    font lookup (which may scan all installed fonts) is only needed on the first start.
+    """
+
+    def __init__(self, font_path, cache_file):
+        """
+        Initializes the font registry and loads previously resolved font paths.
+
+        Args:
+            font_path (str): The folder containing bundled font files, which are preferred over system fonts.
+            cache_file (str): The file in which resolved font paths are cached.
+        """
+        self.font_path = font_path
+        self.cache_file = cache_file
+        self.resolved_paths = {}
+        if os.path.exists(self.cache_file):
+            with open(self.cache_file, "r") as file:
+                self.resolved_paths = {family: path for family, path in json.load(file).items() if path is not None}
+        # Families that are not available. They are only remembered for this launch, so that a font installed or
+        # bundled later is found on the next start.
+        self.missing_families = set()
+
+    def resolve(self, family):
+        """
+        Resolves a font family to a font file.
+
+        Args:
+            family (str): The name of the font family (e.g. "comicsans").
+
+        Returns:
+            The path of the font file or None if the font is not available (pygame's default font is used then).
+        """
+        # Use the cached path as long as the file still exists.
+        if family in self.resolved_paths:
+            path = self.resolved_paths[family]
+            if os.path.exists(path):
+                return path
+        if family in self.missing_families:
+            return None
+
+        # Prefer a bundled font file, otherwise search the system fonts.
+        path = None
+        for file in sorted(os.listdir(self.font_path)):
+            name, extension = os.path.splitext(file)
+            if name.lower() == family.lower() and extension.lower() in (".ttf", ".otf"):
+                path = os.path.join(self.font_path, file)
+                break
+        else:
+            path = pygame.font.match_font(family)
+        if path is None:
+            warnings.warn(f"Font '{family}' is not available, the default font is used instead.")
+            self.missing_families.add(family)
+            return None
+
+        self.resolved_paths[family] = path
+        self.save()
+        return path
+
+    def get_font(self, family, size):
+        """
+        Creates a font of the given family and size. All sizes of a family share one path lookup.
+
+        Args:
+            family (str): The name of the font family.
+            size (int): The font size.
+
+        Returns:
+            The font as pygame.font.Font.
+        """
+        return pygame.font.Font(self.resolve(family), size)
+
+    def save(self):
+        """
+        Saves the resolved font paths to the cache file.
+        """
+        os.makedirs(os.path.dirname(self.cache_file) or ".", exist_ok=True)
+        with open(self.cache_file, "w") as file:
+            json.dump(self.resolved_paths, file, indent=2)
@@ -0,0 +1,170 @@
+import math
+import time
+from collections import deque
+import pygame
+
+
+class FrameProfiler:
+    """
+    In-game overlay showing rolling frame times, split into event handling, update and render sections.
+
+    The main loop marks the end of every section of a frame. The durations of the last frames are kept in fixed-size
+    ring buffers. The overlay surface (statistics and sparkline) is only rebuilt every few frames and otherwise just
+    blitted, so that drawing the overlay barely distorts the measured frame times.
+    """
+    # Sections of a frame grouped by the part of the main loop they belong to.
+    SECTIONS = {
+        "events": ["events"],
+        "update": ["player", "groups", "collisions"],
+        "render": ["background", "sprites", "present", "hud", "flip"]
+    }
+
+    def __init__(self, font, fps, history=240, refresh_interval=15):
+        """
+        Initializes the frame profiler. It is hidden and does not measure anything until it is toggled.
+
+        Args:
+            font (pygame.font.Font): The font of the overlay texts.
+            fps (int): The target frame rate. Its frame time budget is shown as line in the sparkline.
+            history (int): Number of frames kept in the ring buffers.
+            refresh_interval (int): Number of frames after which the overlay surface is rebuilt (None to only record
+                frame times without an overlay).
+        """
+        self.font = font
+        self.budget = 1000 / fps
+        self.history = history
+        self.refresh_interval = refresh_interval
+        self.visible = False
+        self.sections = [section for sections in self.SECTIONS.values() for section in sections]
+        self.reset()
+
+    def reset(self):
+        """
+        Clears all recorded frame times.
+        """
+        self.frame_times = deque(maxlen=self.history)
+        self.section_times = {section: deque(maxlen=self.history) for section in self.sections}
+        self.current_times = dict.fromkeys(self.sections, 0.0)
+        self.frame_start = self.last_mark = 0.0
+        self.frames_until_refresh = 0
+        self.overlay = None
+
+    def toggle(self):
+        """
+        Shows or hides the overlay. Measuring starts from scratch whenever the overlay is shown.
+        """
+        self.visible = not self.visible
+        self.reset()
+
+    def begin_frame(self):
+        """
+        Starts measuring a new frame.
+        """
+        if not self.visible:
+            return
+        self.frame_start = self.last_mark = time.perf_counter()
+
+    def mark(self, section):
+        """
+        Adds the time since the previous mark to a section. A section may be marked several times per frame.
+
+        Args:
+            section (str): The name of the section that has just been completed.
+        """
+        if not self.visible:
+            return
+        now = time.perf_counter()
+        self.current_times[section] += now - self.last_mark
+        self.last_mark = now
+
+    def end_frame(self):
+        """
+        Stores the times of the current frame in the ring buffers and rebuilds the overlay if necessary.
+        """
+        if not self.visible:
+            return
+        self.frame_times.append((time.perf_counter() - self.frame_start) * 1000)
+        for section in self.sections:
+            self.section_times[section].append(self.current_times[section] * 1000)
+            self.current_times[section] = 0.0
+
+        # Rebuild the overlay only every few frames.
+        self.frames_until_refresh -= 1
+        if self.refresh_interval and self.frames_until_refresh <= 0:
+            self.frames_until_refresh = self.refresh_interval
+            self.overlay = self.build_overlay()
+
+    @staticmethod
+    def get_statistics(times):
+        """
+        Calculates the statistics of recorded times.
+
+        Args:
+            times (iterable): The recorded times in milliseconds.
+
+        Returns:
+            Minimum, average and 99th percentile of the times (all 0.0 if there are no times).
+        """
+        times = sorted(times)
+        if not times:
+            return 0.0, 0.0, 0.0
+        return times[0], sum(times) / len(times), times[math.ceil(0.99 * len(times)) - 1]
+
+    def build_overlay(self):
+        """
+        Renders the statistics of all sections and the sparkline of the frame times.
+
+        Returns:
+            The overlay as pygame.Surface.
+        """
+        line_height = self.font.get_linesize()
+        width, sparkline_height = 360, 60
+
+        # Create one text line for the whole frame and every group and section.
+        lines = [("frame", self.frame_times, "white")]
+        for group, sections in self.SECTIONS.items():
+            group_times = [sum(times) for times in zip(*(self.section_times[section] for section in sections))]
+            lines.append((group, group_times, "yellow"))
+            lines.extend((f"  {section}", self.section_times[section], "cyan") for section in sections)
+
+        overlay = pygame.Surface((width, line_height * (len(lines) + 1) + sparkline_height + 10), pygame.SRCALPHA)
+        overlay.fill((0, 0, 0, 180))
+        self.blit_row(overlay, 0, ["ms", "min", "avg", "p99"], "white")
+        for row, (name, times, color) in enumerate(lines, start=1):
+            statistics = [f"{value:.2f}" for value in self.get_statistics(times)]
+            self.blit_row(overlay, row * line_height, [name] + statistics, color)
+
+        # Draw the sparkline of the frame times (one bar per frame) with the frame budget as reference line.
+        bottom = overlay.get_height() - 5
+        scale = sparkline_height / max(2 * self.budget, max(self.frame_times, default=0))
+        for x, frame_time in enumerate(self.frame_times, start=width - 5 - len(self.frame_times)):
+            color = "green" if frame_time <= self.budget else "red"
+            pygame.draw.line(overlay, color, (x, bottom), (x, bottom - frame_time * scale))
+        budget_y = bottom - self.budget * scale
+        pygame.draw.line(overlay, "white", (5, budget_y), (width - 5, budget_y))
+        return overlay
+
+    def blit_row(self, overlay, y, columns, color):
+        """
+        Renders a row of the statistics table. The name is left-aligned, the values are right-aligned in columns.
+
+        Args:
+            overlay (pygame.Surface): The overlay surface.
+            y (int): The vertical position of the row.
+            columns (list): The name followed by the minimum, average and 99th percentile.
+            color (str): The text color.
+        """
+        overlay.blit(self.font.render(columns[0], True, color), (5, y))
+        for right, text in zip((200, 280, 355), columns[1:]):
+            text_surface = self.font.render(text, True, color)
+            overlay.blit(text_surface, text_surface.get_rect(topright=(right, y)))
+
+    def draw(self, screen):
+        """
+        Draws the cached overlay in the bottom left corner of the screen.
+
+        Args:
+            screen (pygame.Surface): The surface to draw on.
+        """
+        if self.visible and self.overlay:
+            screen.blit(self.overlay, self.overlay.get_rect(bottomleft=(0, screen.get_height())))
@@ -1,43 +1,88 @@
+import os
 import pygame
 import sys
 import random
-from tkinter import messagebox
+import warnings
 from src.assets import Assets
+from src.audio import MusicPlayer, configure_mixer
+from src.backend import create_backend
+from src.frame_profiler import FrameProfiler
+from src.gc_policy import GCPolicy
+from src.governor import FrameGovernor
+from src.instrumentation import instrumentation
 from src.enums import GameState, EnemyType, WeaponType, PowerUpType
 from src.menu import GameOverMenu, PauseMenu, SettingsMenu, MainMenu, StatsMenu, ShopMenu, ControlsMenu
 from src.manager import SaveLoadSystem
+from src.memory import MemoryTracker
+from src.pacing import FramePacer
+from src.parallax import ParallaxBackground
 from src.player import Player
 from src.obstacle import Obstacle
 from src.enemy import Enemy
 from src.weapon import Weapon
 from src.powerup import PowerUp
 from src.projectile import Projectile
+from src.render import RenderQueue
+from src.startup import StartupReport
+from src.timestep import FixedTimestep
+from src.watchdog import HitchDetector
 
 
 class Game:
     """
     The main class representing the endless runner game.
     """
+    # Functions that scale the canvas rendered at internal resolution to the window.
+    PRESENTATIONS = {"scale": pygame.transform.scale, "smoothscale": pygame.transform.smoothscale}
 
-    def __init__(self, size):
+    def __init__(self, size, headless=False, startup_report=None, profiler=None):
         """
         Initializes the Game object.
 
         This method sets up the Pygame environment, display, data, variables, menus, audio, timers and sprite groups.
         Args:
             size (list): The size of the game window ([width, height]).
-        """
-        # Initialize Pygame.
-        pygame.init()
-
-        # Set up the display.
+            headless (bool): Whether the game runs without window and audio.
+            startup_report (StartupReport): Report for the durations of the startup phases.
+            profiler (Profiler): Optional profiler that is updated every frame and finished when the game ends.
+        """
+        self.startup_report = startup_report or StartupReport()
+        self.profiler = profiler
+        self.headless = headless or os.environ.get("SDL_VIDEODRIVER") == "dummy"
+
+        # Initialize only the required Pygame modules. The mixer is configured for low latency and skipped when
+        # running headless. Without an audio device, the game runs silently.
+        pygame.display.init()
+        pygame.font.init()
+        if not self.headless:
+            configure_mixer(Assets.read_config()["audio"])
+            try:
+                pygame.mixer.init()
+            except pygame.error as error:
+                warnings.warn(f"Audio is not available ({error}), the game runs without sound.")
+        self.startup_report.mark("pygame initialization")
+
+        # Set up the display and the render backend (synchronized with the monitor if the frame pacer uses vsync).
+        # The screen is the surface the menus are drawn on.
         self.width = size[0]
         self.height = size[1]
-        self.screen = pygame.display.set_mode((self.width, self.height))
-        pygame.display.set_caption("Run the Cybernetic City: Endless Dash")
-
-        # Load assets.
+        config = Assets.read_config()
+        # Configure the instrumentation before the assets are loaded, so that loading is measured as well.
+        instrumentation.configure(**config.get("instrumentation", {}))
+        self.backend = create_backend(config["render_backend"], (self.width, self.height),
+                                      "Run the Cybernetic City: Endless Dash", config["frame_pacing"]["mode"] == "vsync")
+        self.screen = self.backend.screen
+        self.vsync = self.backend.vsync
+        self.startup_report.mark("display")
+
+        # Load assets (and upload them to textures once if frames are drawn with textures).
         self.assets = Assets()
+        if self.backend.uses_textures:
+            self.assets.upload_textures(self.backend)
+        self.startup_report.mark("assets")
+
+        # Initialize the optional memory tracker for runs (before any sprite is created).
+        self.memory_tracker = MemoryTracker(**self.assets.config["memory_tracker"])
 
         # Initialize save load manager.
         self.save_load_manager = SaveLoadSystem(".save", "data")
@@ -49,6 +94,7 @@ class Game:
         self.assets.music.set_volume(self.save_load_manager.load_game_data(["volume"], [(0.1, 0.3)])[0])
         [sound.set_volume(self.save_load_manager.load_game_data(["volume"], [(0.1, 0.3)])[1]) for sound in
          self.assets.sounds.values()]
+        self.startup_report.mark("save data")
 
         # Initialize different menus and define pause button.
         self.main_menu = MainMenu(self)
@@ -61,14 +107,78 @@ class Game:
         self.pause_button_rect = self.assets.pause_button_image.get_rect(
             topright=(self.width - 10, 10))
         self.pause_button_clicked = False
+        self.startup_report.mark("menus")
 
-        # Initialize background position and scrolling speed.
-        self.background_x = 0
+        # Initialize background scrolling speed.
         self.scrolling_bg_speed = self.assets.config["scrolling_bg_speed"]
 
-        # Set fps for game.
+        # Set fps for game (the simulation rate, speeds and timers are given per second independent of it).
         self.fps = self.assets.config["fps"]
 
+        # Initialize the fixed timestep, which decouples the simulation rate from the rendered frame rate.
+        timestep_config = self.assets.config["timestep"]
+        self.render_fps = timestep_config["render_fps"]
+        self.timestep = FixedTimestep(self.fps, timestep_config["max_updates_per_frame"])
+
+        # Initialize the frame pacer, which limits the rendered frame rate. Without vsync support, the best mode is
+        # chosen automatically instead.
+        pacing_config = self.assets.config["frame_pacing"]
+        pacing_mode = "auto" if pacing_config["mode"] == "vsync" and not self.vsync else pacing_config["mode"]
+        self.frame_pacer = FramePacer(self.render_fps, pacing_mode, pacing_config["spin_ms"],
+                                      pacing_config["calibration_frames"], pacing_config["cache_file"])
+
+        # Initialize the internal resolution. With a scale below 1, background and sprites are drawn on a smaller
+        # canvas, which is scaled to the window once per frame, while the HUD is drawn at full resolution on top.
+        self.render_scale = self.assets.render_scale
+        presentation = self.assets.config["internal_resolution"]["presentation"]
+        if presentation not in self.PRESENTATIONS:
+            raise ValueError(f"Unknown presentation '{presentation}'!")
+        self.present_canvas = None
+        if self.backend.uses_textures:
+            # Textures are stretched to their size in world coordinates while drawing, so the GPU scales the playfield
+            # and the canvas uses world coordinates.
+            self.canvas_scale = 1
+            self.canvas = self.backend.get_target(self.render_scale)
+            self.hud = self.backend.get_target()
+        else:
+            self.canvas_scale = self.render_scale
+            self.canvas = self.screen
+            self.hud = self.screen
+            if self.render_scale != 1:
+                self.canvas = pygame.Surface((round(self.width * self.render_scale),
+                                              round(self.height * self.render_scale))).convert()
+                self.present_canvas = self.PRESENTATIONS[presentation]
+        # Playfield images shown on the HUD, scaled back to full resolution.
+        self.hud_images = {}
+
+        # Initialize the parallax background. Its layer images have the internal resolution, the scale converts their
+        # pixels to the coordinates of the canvas.
+        self.parallax = ParallaxBackground.from_config(self.assets.config["parallax_layers"], self.assets, self.width,
+                                                       self.render_scale)
+        self.parallax_scale = self.canvas_scale / self.render_scale
+
+        # Initialize the render queue, which draws each layer of a frame with a single call. The texture backend
+        # mirrors sprites while drawing.
+        self.render_queue = RenderQueue(scale=self.canvas_scale, flip_at_draw=self.backend.uses_textures)
+
+        # Initialize the governor that degrades visuals and skips rendering when rendering is over budget. Rendered
+        # HUD texts are kept as (text, surface) per HUD element.
+        self.frame_governor = FrameGovernor(**self.assets.config["frame_governor"])
+        self.hud_texts = {}
+
+        # Initialize frame profiler overlay (hidden until toggled).
+        profiler_config = self.assets.config["frame_profiler"]
+        self.frame_profiler = FrameProfiler(self.assets.fonts.get_font("comicsans", profiler_config["font_size"]),
+                                            self.render_fps, profiler_config["history"],
+                                            profiler_config["refresh_interval"])
+        self.frame_profiler_key = pygame.key.key_code(profiler_config["key"])
+
+        # Initialize watchdog for frames exceeding the frame time budget.
+        self.hitch_detector = HitchDetector(**self.assets.config["hitch_detector"])
+
+        # Initialize the policy that keeps garbage collector pauses out of the gameplay.
+        self.gc_policy = GCPolicy(**self.assets.config["gc_policy"])
+
         # Set variables for current run.
         self.set_up_run()
 
@@ -92,6 +202,10 @@ class Game:
         self.enemies = pygame.sprite.Group()
         self.power_ups = pygame.sprite.Group()
         self.projectiles = pygame.sprite.Group()
+        self.startup_report.mark("timers and sprites")
+
+        # Start flushing instrumentation data in the background (only if instrumentation is enabled).
+        instrumentation.start()
 
     def set_up_run(self, startup=True):
         """
@@ -102,10 +216,11 @@ class Game:
         """
         # Initialize distance and background speed for current run.
         self.distance = 0
+        self.run_time = 0
         self.scrolling_bg_speed = self.assets.config["scrolling_bg_speed"]
         # Variables for freeze power up.
         self.freeze = False
-        self.freeze_time = self.fps * self.assets.config["freeze_time"]
+        self.freeze_time = self.assets.config["freeze_time"]
         # Flag whether data has already been updated for current run.
         self.updated_data = False
         # The main menu should only be shown on startup.
@@ -115,31 +230,71 @@ class Game:
         """
         Starts the main game loop in which the game logic takes place.
         """
-        # Create a clock object to control the frame rate.
-        clock = pygame.time.Clock()
-
         # Play background music.
-        self.assets.music.play(-1)
+        self.assets.music.play()
+        self.startup_report.mark("music")
+        first_frame = True
+        elapsed = 0.0
+        playing = False
+        self.hitch_detector.start()
+
+        # Freeze everything created during startup, so that the garbage collector no longer traverses it.
+        self.gc_policy.finish_startup()
+        self.memory_tracker.start()
 
         # Main Game loop.
         while True:
+            self.hitch_detector.begin_frame()
+            self.frame_profiler.begin_frame()
+
             # Loop over events from queue.
             for event in pygame.event.get():
                 # Handle different GameStates and events.
                 self.handle_states_and_events(event)
+            self.frame_profiler.mark("events")
+
+            # Apply the garbage collector policy of the current state and take memory snapshots.
+            self.gc_policy.update(self.current_state)
+            self.memory_tracker.update(self.current_state)
+
+            # Start or stop the profiler when the state has changed (it may only cover the playing state).
+            if self.profiler:
+                self.profiler.update(self.current_state == GameState.PLAYING)
 
-            # Update and render all game objects when game state is playing.
+            # Update all game objects at the fixed simulation rate when game state is playing. Under load several
+            # updates run before the next frame is rendered, so the simulation stays on schedule.
             if self.current_state == GameState.PLAYING:
-                self.update()
-                self.render()
+                # Start from an empty accumulator and without interpolation when the run starts or resumes.
+                if not playing:
+                    playing = True
+                    self.timestep.reset()
+                    self.store_previous_positions()
+                self.run_simulation_steps(elapsed)
+                # Render the positions interpolated between the last two simulation steps, unless the run has ended
+                # during the steps or the governor skips the frame because rendering is over budget.
+                if self.current_state == GameState.PLAYING and self.frame_governor.should_render():
+                    self.frame_governor.begin_render()
+                    self.render(self.timestep.alpha)
+                    self.frame_governor.end_render()
+            else:
+                playing = False
 
             # Update and save data of run and how game over screen when game state is game over.
-            elif self.current_state == GameState.GAME_OVER:
+            if self.current_state == GameState.GAME_OVER:
                 self.update_and_save_run_data()
                 self.game_over_menu.display()
 
-            # Cap the frame rate to defined fps.
-            clock.tick(self.fps)
+            # Print the startup report once the first frame is done.
+            if first_frame:
+                first_frame = False
+                self.startup_report.mark("first frame")
+                self.startup_report.print_report()
+
+            self.frame_profiler.end_frame()
+            self.hitch_detector.end_frame(self.current_state, self.count_entities)
+
+            # Pace the rendered frames and measure the real time of the frame.
+            elapsed = self.frame_pacer.tick()
 
     def handle_states_and_events(self, event):
         """
@@ -151,6 +306,12 @@ class Game:
         # Handle quitting game (via ESC key or close button).
         if event.type == pygame.QUIT or (event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE):
             self.end_game()
+        # Show or hide the frame profiler overlay.
+        if event.type == pygame.KEYDOWN and event.key == self.frame_profiler_key:
+            self.frame_profiler.toggle()
+        # Continue with the next track of the playlist when the current one has ended.
+        if event.type == MusicPlayer.END_EVENT:
+            self.assets.music.handle_end_event()
         # Handle game over state, display menu and check which button player clicks (restart, main_menu, quit).
         if self.current_state == GameState.GAME_OVER:
             if event.type == pygame.KEYDOWN and event.key == pygame.K_SPACE:
@@ -193,59 +354,84 @@ class Game:
                      self.pause_button_rect.collidepoint(mouse_x, mouse_y)) and self.pause_button_clicked):
                 self.pause_button_clicked = False
                 self.current_state = GameState.PAUSED
+                # The pause menu is drawn on top of the last frame.
+                self.backend.capture_frame()
             # Only add obstacles and enemies when game is not frozen.
             if not self.freeze:
                 # Check obstacle timer and add car or meteor to obstacles.
                 if event.type == self.obstacle_timer:
-                    self.obstacles.add(random.choice([Obstacle([self.width + random.randint(200, 500), 480],
-                                                               [pygame.transform.flip(image, True, False) for image
-                                                                in self.assets.car_images], 'car', 5, self),
-                                                      Obstacle([self.width + random.randint(200, 500), 585],
-                                                               self.assets.meteor_images, 'meteor', 0, self)]))
+                    with instrumentation.timer("game.spawn_obstacle"):
+                        self.obstacles.add(random.choice([Obstacle([self.width + random.randint(200, 500), 480],
+                                                                   self.assets.car_images, 'car',
+                                                                   self.assets.config["car_speed"], self, True),
+                                                          Obstacle([self.width + random.randint(200, 500), 585],
+                                                                   self.assets.meteor_images, 'meteor', 0, self)]))
                 # Check enemy timer and add drone or robot to enemies.
                 elif event.type == self.enemy_timer:
-                    enemy_choice = random.choice([EnemyType.DRONE, EnemyType.ROBOT])
-                    if not any(enemy.type == enemy_choice for enemy in self.enemies):
-                        enemy_position = [1500, 100] if enemy_choice == EnemyType.DRONE else [1500, 512]
-                        self.enemies.add(Enemy(enemy_position, enemy_choice, self))
+                    with instrumentation.timer("game.spawn_enemy"):
+                        enemy_choice = random.choice([EnemyType.DRONE, EnemyType.ROBOT])
+                        if not any(enemy.type == enemy_choice for enemy in self.enemies):
+                            enemy_position = [1500, 100] if enemy_choice == EnemyType.DRONE else [1500, 512]
+                            self.enemies.add(Enemy(enemy_position, enemy_choice, self))
                 # Check powerup timer and add a random powerup object to powerups.
                 elif event.type == self.power_up_timer:
-                    # Multiple_shots are only added to the random selection if the player has not collected them yet.
-                    power_up_list = [PowerUpType.INVINCIBILITY, PowerUpType.FREEZE]
-                    if not self.player.sprite.weapon.max_shots == self.assets.config["multiple_shots"]:
-                        power_up_list.append(PowerUpType.MULTIPLE_SHOTS)
-                    power_up_choice = random.choice(power_up_list)
-                    self.power_ups.add(PowerUp([1500, 0], power_up_choice, self))
+                    with instrumentation.timer("game.spawn_power_up"):
+                        # Multiple_shots are only added to the random selection if the player has not collected them
+                        # yet.
+                        power_up_list = [PowerUpType.INVINCIBILITY, PowerUpType.FREEZE]
+                        if not self.player.sprite.weapon.max_shots == self.assets.config["multiple_shots"]:
+                            power_up_list.append(PowerUpType.MULTIPLE_SHOTS)
+                        power_up_choice = random.choice(power_up_list)
+                        self.power_ups.add(PowerUp([1500, 0], power_up_choice, self))
                 # Check background speed timer and increase scrolling background speed.
                 elif event.type == self.background_speed_timer:
                     self.scrolling_bg_speed += self.assets.config["bg_speed_increase"]
 
-    def update(self):
+    def run_simulation_steps(self, elapsed):
+        """
+        Runs the simulation steps that are due after the real time of a frame. The remaining steps are dropped as soon
+        as one of them ends the run (e.g. by a collision) or leaves the playing state.
+
+        Args:
+            elapsed (float): The real time since the previous frame in seconds.
+        """
+        for _ in range(self.timestep.advance(elapsed)):
+            self.update(self.timestep.step)
+            if self.current_state != GameState.PLAYING:
+                break
+
+    @instrumentation.timer("game.update")
+    def update(self, dt):
         """
-        Updates all game objects.
+        Updates all game objects by one simulation step.
+
+        Args:
+            dt (float): The duration of the simulation step in seconds.
         """
+        # Keep the positions of the previous step for interpolation.
+        self.store_previous_positions()
+
         # Update player.
-        self.player.update()
+        self.player.update(dt)
+        self.frame_profiler.mark("player")
 
         # Check whether freeze powerup was collected and game is frozen.
         if self.freeze:
             if self.freeze_time > 0:
-                self.freeze_time -= 1
+                self.freeze_time -= dt
             else:
                 self.freeze = False
-                self.freeze_time = self.fps * self.assets.config["freeze_time"]
+                self.freeze_time = self.assets.config["freeze_time"]
         else:
             # Update all objects in every sprite group (obstacles, enemies, power ups, projectiles).
-            self.obstacles.update()
-            self.enemies.update()
-            self.projectiles.update()
-            self.power_ups.update()
+            self.obstacles.update(dt)
+            self.enemies.update(dt)
+            self.projectiles.update(dt)
+            self.power_ups.update(dt)
 
-            # Scroll background to the left.
-            self.background_x -= self.scrolling_bg_speed
-            # Check if the background has scrolled off the screen and reset position.
-            if self.background_x <= -self.width:
-                self.background_x = 0
+            # Scroll the background layers to the left (in pixels of the layer images).
+            self.parallax.scroll(self.scrolling_bg_speed * dt * self.render_scale)
+        self.frame_profiler.mark("groups")
 
         # Check for collisions between different game objects and handle them accordingly.
         self.check_collision(self.player.sprite, self.obstacles)
@@ -253,49 +439,119 @@ class Game:
         self.check_collision(self.player.sprite, self.projectiles)
         [self.check_collision(enemy, self.projectiles) for enemy in self.enemies]
         self.check_collision(self.player.sprite, self.power_ups)
+        self.frame_profiler.mark("collisions")
 
-        # Update distance.
-        self.distance += 1
+        # Update distance based on the time of the run.
+        self.run_time += dt
+        self.distance = int(self.run_time * self.assets.config["score_per_second"])
 
-    def render(self):
+    @instrumentation.timer("game.render")
+    def render(self, alpha=1.0):
         """
         Renders all game objects to the screen.
+
+        Args:
+            alpha (float): The fraction of the simulation step that has passed since the last update. Moving objects
+                are drawn between their previous and their current position accordingly.
         """
-        # Draw the background image with scroll position.
-        self.screen.blit(self.assets.background_image, (self.background_x, 0))
-        # Create seamless scrolling effect.
-        self.screen.blit(self.assets.background_image, (self.background_x + self.width, 0))
+        # Queue the visible part of every background layer (or only the back layer without scrolling when rendering
+        # is over budget).
+        if self.frame_governor.is_active("static_background"):
+            self.parallax.queue_static(self.render_queue, self.parallax_scale)
+        else:
+            self.parallax.queue(self.render_queue, alpha, self.parallax_scale)
+        self.render_queue.flush(self.canvas, "background")
+        self.frame_profiler.mark("background")
+
+        # Queue player, weapon and all sprites in the sprite groups (obstacles, enemies, power ups, projectiles).
+        self.render_queue.add_group("sprites", self.player, alpha)
+        self.render_queue.add_group("sprites", (self.player.sprite.weapon,), alpha)
+        for group in (self.obstacles, self.enemies, self.power_ups, self.projectiles):
+            self.render_queue.add_group("sprites", group, alpha)
+        self.render_queue.flush(self.canvas, "sprites")
+        self.frame_profiler.mark("sprites")
+
+        # Scale the canvas with the playfield to the window.
+        if self.present_canvas:
+            self.present_canvas(self.canvas, (self.width, self.height), self.screen)
+            self.frame_profiler.mark("present")
+
+        # Queue current score and pause button in the top right corner.
+        self.render_queue.add("hud", self.render_hud_text("score", self.assets.font_comicsans_big,
+                                                          f"Score: {self.distance}", "green"), (10, 10))
+        self.render_queue.add("hud", self.assets.pause_button_image, self.pause_button_rect)
+
+        # Queue number of player lifes.
+        self.render_queue.add("hud", self.render_hud_text("lifes", self.assets.font_comicsans_big,
+                                                          f"Lifes: {self.player.sprite.health}", "cyan"), (10, 60))
+
+        # Queue icons for power ups.
+        self.display_power_ups()
 
-        # Display current score on screen.
-        distance_surface = self.assets.font_comicsans_big.render(f"Score: {self.distance}", True, "green")
-        self.screen.blit(distance_surface, (10, 10))
+        # Queue slide cooldown time.
+        self.render_queue.add("hud", self.render_hud_text(
+            "slide_cooldown", self.assets.font_comicsans_small,
+            f"Slide Cooldown: {round(self.player.sprite.slide_cooldown, 1)}", "cyan"), (self.width - 220, 80))
+        self.render_queue.flush(self.hud, "hud")
 
-        # Display pause button in the top right corner.
-        self.screen.blit(self.assets.pause_button_image, self.pause_button_rect)
+        # Draw the frame profiler overlay (counted as part of the HUD).
+        self.frame_profiler.draw(self.hud)
+        self.frame_profiler.mark("hud")
 
-        # Draw player and weapon.
-        self.player.draw(self.screen)
-        self.screen.blit(self.player.sprite.weapon.image, self.player.sprite.weapon.position)
+        # Show the frame.
+        self.backend.present()
+        self.frame_profiler.mark("flip")
 
-        # Draw all sprites in the sprite groups (obstacles, enemies, power ups, projectiles).
-        self.obstacles.draw(self.screen)
-        self.enemies.draw(self.screen)
-        self.power_ups.draw(self.screen)
-        self.projectiles.draw(self.screen)
+    def render_hud_text(self, name, font, text, color):
+        """
+        Renders a HUD text. The surface of the previous frame is reused if the text has not changed or if the governor
+        has reduced the HUD refresh rate.
 
-        # Display number of player lifes.
-        self.screen.blit(self.assets.font_comicsans_big.render(f"Lifes: {self.player.sprite.health}", True, "cyan"),
-                         (10, 60))
+        Args:
+            name (str): The name of the HUD element.
+            font (pygame.font.Font): The font.
+            text (str): The text.
+            color (str): The text color.
 
-        # Draw icons for power ups on the screen.
-        self.display_power_ups()
+        Returns:
+            The rendered text.
+        """
+        previous = self.hud_texts.get(name)
+        if previous and (previous[0] == text or not self.frame_governor.refresh_hud()):
+            return previous[1]
+        surface = font.render(text, True, color)
+        self.hud_texts[name] = (text, surface)
+        return surface
+
+    def get_hud_image(self, image):
+        """
+        Returns a playfield image in the full resolution of the HUD. Images scaled to the internal resolution are
+        scaled back once and cached.
 
-        # Display slide cooldown time on the screen.
-        self.screen.blit(self.assets.font_comicsans_small.render(
-            f"Slide Cooldown: {round(self.player.sprite.slide_cooldown / self.fps, 1)}", True, "cyan"), (self.width - 220, 80))
+        Args:
+            image (pygame.Surface): The playfield image.
+
+        Returns:
+            The image in full resolution.
+        """
+        if self.render_scale == 1:
+            return image
+        if image not in self.hud_images:
+            # Smooth scaling would blend the colorkey into the edges, so colorkey images are scaled with alpha.
+            source = image.convert_alpha() if image.get_colorkey() else image
+            self.hud_images[image] = pygame.transform.smoothscale_by(source, 1 / self.render_scale)
+        return self.hud_images[image]
 
-        # Update the full display Surface to the screen.
-        pygame.display.flip()
+    def store_previous_positions(self):
+        """
+        Stores the current positions of the background and all sprites as their previous positions.
+        """
+        self.parallax.store_previous_offsets()
+        for group in (self.player, self.obstacles, self.enemies, self.power_ups, self.projectiles):
+            for sprite in group:
+                sprite.previous_topleft = sprite.rect.topleft
+        weapon = self.player.sprite.weapon
+        weapon.previous_topleft = weapon.rect.topleft
 
     def update_and_save_run_data(self):
         """
@@ -329,10 +585,30 @@ class Game:
             [(self.assets.music.get_volume(), self.assets.sounds["shoot"].get_volume()), self.highscore, self.coins],
             ["volume", "highscore", "coins"], ["wb", "wb", "wb"])
 
+        # Report the frame governor if it had to degrade any frame and write the remaining hitches, instrumentation
+        # data and the profile.
+        if self.frame_governor.has_degraded():
+            print(self.frame_governor.get_report())
+        self.hitch_detector.stop()
+        self.memory_tracker.stop()
+        instrumentation.stop()
+        if self.profiler:
+            self.profiler.finish()
+
         # Close game and window.
         pygame.quit()
         sys.exit()
 
+    def count_entities(self):
+        """
+        Counts the entities of all sprite groups.
+
+        Returns:
+            A dictionary with the number of entities per sprite group.
+        """
+        return {"obstacles": len(self.obstacles), "enemies": len(self.enemies), "power_ups": len(self.power_ups),
+                "projectiles": len(self.projectiles)}
+
     def reset_timers(self):
         """
         Resets timers for obstacles, enemies, and power-ups.
@@ -404,6 +680,7 @@ class Game:
         elif result == "quit_button":
             self.end_game()
 
+    @instrumentation.timer("game.check_collision")
     def check_collision(self, sprite, sprite_group):
         """
         Checks for collision between a single sprite and a sprite group.
@@ -444,8 +721,9 @@ class Game:
             self.player.sprite.health -= 1
             # Check whether player has no lives.
             if self.player.sprite.health == 0:
-                # Set game state to game over.
+                # Set game state to game over (the game over menu is drawn on top of the last frame).
                 self.current_state = GameState.GAME_OVER
+                self.backend.capture_frame()
             else:
                 # Kill obstacles, enemies and projectiles and let player continue run.
                 [obstacle.kill() for obstacle in self.obstacles]
@@ -462,7 +740,7 @@ class Game:
         """
         # Display insufficient_coins message when user has not enough coins.
         if self.coins < item_costs:
-            messagebox.showinfo(title="Shop-Warning", message=self.shop_menu.shop_warning_insufficient_coins)
+            self.show_shop_warning(self.shop_menu.shop_warning_insufficient_coins)
         else:
             # Process purchase of the clicked item.
             if item_name == "extra_life":
@@ -487,7 +765,7 @@ class Game:
             self.player.sprite.health = 2
         else:
             # Show warning message.
-            messagebox.showinfo(title="Shop-Warning", message=self.shop_menu.shop_warning_already_bought)
+            self.show_shop_warning(self.shop_menu.shop_warning_already_bought)
 
     def handle_weapon_upgrade_purchase(self, item_costs):
         """
@@ -507,11 +785,23 @@ class Game:
                 WeaponType.UPGRADE, self, self.player.sprite)
         else:
             # Show warning message.
-            messagebox.showinfo(title="Shop-Warning", message=self.shop_menu.shop_warning_already_bought)
+            self.show_shop_warning(self.shop_menu.shop_warning_already_bought)
+
+    @staticmethod
+    def show_shop_warning(message):
+        """
+        Shows a warning message box in the shop. tkinter is only imported when a warning is actually shown, so that
+        it does not slow down the start of the game.
+
+        Args:
+            message (str): The warning message.
+        """
+        from tkinter import messagebox
+        messagebox.showinfo(title="Shop-Warning", message=message)
 
     def display_power_ups(self):
         """
-        Displays power ups on screen. If they are grey, they are not active.
+        Queues the power up icons on the HUD layer of the render queue. If they are grey, they are not active.
         """
         for power_up_type in PowerUpType:
             time_left = ""
@@ -525,17 +815,17 @@ class Game:
             if power_up_type == PowerUpType.FREEZE:
                 if self.freeze:
                     image = self.assets.freeze_powerup
-                    time_left = round(self.freeze_time / self.fps, 1)
+                    time_left = round(self.freeze_time, 1)
                 else:
                     image = self.assets.freeze_powerup_inactive
                 height = 190
             if power_up_type == PowerUpType.INVINCIBILITY:
                 if self.player.sprite.invincible:
                     image = self.assets.invincible_powerup
-                    time_left = round(self.player.sprite.invincible_time / self.fps, 1)
+                    time_left = round(self.player.sprite.invincible_time, 1)
                 else:
                     image = self.assets.invincible_powerup_inactive
                 height = 260
-            self.screen.blit(image[0], (self.width - 70, height))
-            self.screen.blit(self.assets.font_comicsans_small.render(str(time_left), True, "cyan"),
-                             (self.width - 105, height + 15))
+            self.render_queue.add("hud", self.get_hud_image(image[0]), (self.width - 70, height))
+            self.render_queue.add("hud", self.render_hud_text(power_up_type.name, self.assets.font_comicsans_small,
+                                                              str(time_left), "cyan"), (self.width - 105, height + 15))
@@ -0,0 +1,79 @@
+import gc
+from src.enums import GameState
+
+
+class GCPolicy:
+    """
+    Manages the cyclic garbage collector so that its pauses do not cause frame spikes while playing.
+
+    Long-lived objects created at startup (assets, menus) are frozen, so collections no longer have to traverse
+    them. While playing, automatic collection is either disabled or its thresholds are raised. Leaving the playing
+    state (pause, game over, main menu) is a safe point to catch up with an explicit collection.
+    """
+
+    def __init__(self, enabled=True, freeze_after_startup=True, playing_mode="thresholds",
+                 playing_thresholds=(50000, 50, 100), max_pending_allocations=200000):
+        """
+        Initializes the garbage collector policy.
+
+        Args:
+            enabled (bool): Whether the policy changes the garbage collector at all.
+            freeze_after_startup (bool): Whether objects existing after startup are moved to the permanent generation.
+            playing_mode (str): "disable" to disable automatic collection while playing, "thresholds" to raise the
+                thresholds or "default" to keep the default behaviour.
+            playing_thresholds (list): The collection thresholds of the three generations while playing.
+            max_pending_allocations (int): With automatic collection disabled, the youngest generation is collected
+                when this many allocations are pending, so that memory cannot grow without bounds.
+        """
+        self.enabled = enabled
+        self.freeze_after_startup = freeze_after_startup
+        self.playing_mode = playing_mode
+        self.playing_thresholds = tuple(playing_thresholds)
+        self.max_pending_allocations = max_pending_allocations
+        self.default_thresholds = gc.get_threshold()
+        self.playing = False
+
+    def finish_startup(self):
+        """
+        Collects the garbage of the startup and freezes all remaining objects. Must be called once after startup.
+        """
+        if not self.enabled or not self.freeze_after_startup:
+            return
+        gc.collect()
+        gc.freeze()
+
+    def update(self, game_state):
+        """
+        Applies the policy of the current game state. Must be called once per frame.
+
+        Args:
+            game_state (GameState): The current state of the game.
+        """
+        if not self.enabled:
+            return
+        playing = game_state == GameState.PLAYING
+        if playing and not self.playing:
+            self.enter_playing()
+        elif not playing and self.playing:
+            self.leave_playing()
+        elif playing and self.playing_mode == "disable" and gc.get_count()[0] > self.max_pending_allocations:
+            gc.collect(0)
+
+    def enter_playing(self):
+        """
+        Disables automatic collection or raises its thresholds when the game starts or resumes.
+        """
+        self.playing = True
+        if self.playing_mode == "disable":
+            gc.disable()
+        elif self.playing_mode == "thresholds":
+            gc.set_threshold(*self.playing_thresholds)
+
+    def leave_playing(self):
+        """
+        Restores the default behaviour and collects the garbage created while playing.
+        """
+        self.playing = False
+        gc.set_threshold(*self.default_thresholds)
+        gc.enable()
+        gc.collect()
@@ -0,0 +1,137 @@
+import time
+from collections import deque
+
+
+class FrameGovernor:
+    """
+    Protects the simulation when rendering cannot keep up.
+
+    The governor measures the cost of rendering. When the average cost exceeds the budget, it activates the next
+    degradation step, when it falls clearly below the budget, it deactivates the last one again. The steps are:
+    - "hud_refresh": HUD texts are only rendered again every few frames.
+    - "static_background": the background is drawn with a single blit without scrolling.
+    - "frame_skip": render() is skipped on some frames, while the simulation keeps its cadence.
+    """
+    STEPS = ("hud_refresh", "static_background", "frame_skip")
+
+    def __init__(self, enabled=True, budget_ms=8, degradation_order=STEPS, window=30, recover_ratio=0.6,
+                 hud_refresh_interval=10, skipped_frames=1):
+        """
+        Initializes the frame governor without any active degradation.
+
+        Args:
+            enabled (bool): Whether visuals are degraded at all (render costs are always measured).
+            budget_ms (float): The time rendering may take per frame (in milliseconds).
+            degradation_order (list): The degradation steps in the order in which they are activated.
+            window (int): Number of rendered frames whose average cost decides about the next step. The level is
+                changed at most once per window, so that the effect of a change is measured before the next one.
+            recover_ratio (float): A step is deactivated when the average cost falls below this part of the budget.
+            hud_refresh_interval (int): With reduced HUD refresh rate, HUD texts are rendered every this many frames.
+            skipped_frames (int): Number of frames skipped after every rendered frame while frames are skipped.
+        """
+        for step in degradation_order:
+            if step not in self.STEPS:
+                raise ValueError(f"Unknown degradation step '{step}'!")
+        self.enabled = enabled
+        self.budget = budget_ms / 1000
+        self.degradation_order = list(degradation_order)
+        self.recover_ratio = recover_ratio
+        self.hud_refresh_interval = hud_refresh_interval
+        self.skipped_frames = skipped_frames
+        self.render_times = deque(maxlen=window)
+        # Number of active degradation steps (the first ones of the degradation order).
+        self.level = 0
+        self.render_start = None
+        self.rendered_frames = 0
+        self.frames_since_render = 0
+        # Statistics for the report.
+        self.frames = 0
+        self.skipped_renders = 0
+        self.active_frames = {step: 0 for step in self.degradation_order}
+
+    def is_active(self, step):
+        """
+        Checks whether a degradation step is active.
+
+        Args:
+            step (str): The degradation step.
+
+        Returns:
+            True if the step is active, otherwise False.
+        """
+        return step in self.degradation_order[:self.level]
+
+    def should_render(self):
+        """
+        Decides whether the current frame is rendered. Must be called once per frame while playing.
+
+        Returns:
+            True if the frame is rendered, False if it is skipped.
+        """
+        self.frames += 1
+        for step in self.degradation_order[:self.level]:
+            self.active_frames[step] += 1
+        if self.is_active("frame_skip") and self.frames_since_render < self.skipped_frames:
+            self.frames_since_render += 1
+            self.skipped_renders += 1
+            return False
+        self.frames_since_render = 0
+        return True
+
+    def refresh_hud(self):
+        """
+        Checks whether the HUD texts are rendered again in the current frame.
+
+        Returns:
+            False if the HUD refresh rate is reduced and the previous texts are reused, otherwise True.
+        """
+        return not self.is_active("hud_refresh") or self.rendered_frames % self.hud_refresh_interval == 0
+
+    def begin_render(self):
+        """
+        Starts measuring the cost of rendering a frame.
+        """
+        self.render_start = time.perf_counter()
+
+    def end_render(self):
+        """
+        Ends measuring the cost of rendering a frame and adjusts the degradation level once per window.
+        """
+        self.render_times.append(time.perf_counter() - self.render_start)
+        self.rendered_frames += 1
+        if not self.enabled or len(self.render_times) < self.render_times.maxlen:
+            return
+
+        average = sum(self.render_times) / len(self.render_times)
+        if average > self.budget and self.level < len(self.degradation_order):
+            self.level += 1
+        elif average < self.budget * self.recover_ratio and self.level > 0:
+            self.level -= 1
+        else:
+            return
+        # Measure the new level from scratch.
+        self.render_times.clear()
+
+    def has_degraded(self):
+        """
+        Checks whether any degradation step has been active so far.
+
+        Returns:
+            True if the governor is enabled and has degraded at least one frame, otherwise False.
+        """
+        return self.enabled and any(self.active_frames.values())
+
+    def get_report(self):
+        """
+        Creates a report of how often each degradation step was active.
+
+        Returns:
+            The report as string.
+        """
+        if not self.frames:
+            return "Frame governor: no frames played."
+        lines = [f"Frame governor: {self.frames} frames played, {self.skipped_renders} renders skipped "
+                 f"({self.skipped_renders / self.frames * 100:.1f} %)"]
+        for step, frames in self.active_frames.items():
+            lines.append(f"  {step:<18} active in {frames:7d} frames ({frames / self.frames * 100:5.1f} %)")
+        return "\n".join(lines)
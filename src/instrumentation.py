@@ -0,0 +1,320 @@
+import functools
+import json
+import os
+import platform
+import sys
+import threading
+import time
+import pygame
+
+
+class Disabled:
+    """
+    Timer or counter returned while instrumentation is disabled. As context manager it does nothing. As decorator it
+    returns the function unchanged, so a disabled decorator costs nothing per call, and records the function, so that
+    it can be replaced by its measured version when instrumentation is enabled later.
+    """
+    __slots__ = ("instrumentation", "name", "kind")
+
+    def __init__(self, instrumentation, name, kind):
+        """
+        Initializes the disabled timer or counter.
+
+        Args:
+            instrumentation (Instrumentation): The instrumentation.
+            name (str): The name of the timer or counter.
+            kind (type): Timer or Counter, used once instrumentation is enabled.
+        """
+        self.instrumentation = instrumentation
+        self.name = name
+        self.kind = kind
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return False
+
+    def __call__(self, function):
+        self.instrumentation.decorated_functions.append((function, self.name, self.kind))
+        return function
+
+
+class Timer:
+    """
+    Measures the duration of a code block (context manager) or of every call of a function (decorator).
+    """
+    __slots__ = ("instrumentation", "name", "start")
+
+    def __init__(self, instrumentation, name):
+        """
+        Initializes the timer.
+
+        Args:
+            instrumentation (Instrumentation): The instrumentation collecting the measured durations.
+            name (str): The name of the timer.
+        """
+        self.instrumentation = instrumentation
+        self.name = name
+        self.start = 0.0
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.instrumentation.add_time(self.name, time.perf_counter() - self.start)
+        return False
+
+    def __call__(self, function):
+        instrumentation, name = self.instrumentation, self.name
+
+        @functools.wraps(function)
+        def timed_function(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                instrumentation.add_time(name, time.perf_counter() - start)
+        return timed_function
+
+
+class Counter:
+    """
+    Counts how often a code block is entered (context manager) or a function is called (decorator).
+    """
+    __slots__ = ("instrumentation", "name")
+
+    def __init__(self, instrumentation, name):
+        """
+        Initializes the counter.
+
+        Args:
+            instrumentation (Instrumentation): The instrumentation collecting the counts.
+            name (str): The name of the counter.
+        """
+        self.instrumentation = instrumentation
+        self.name = name
+
+    def __enter__(self):
+        self.instrumentation.add_count(self.name)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return False
+
+    def __call__(self, function):
+        instrumentation, name = self.instrumentation, self.name
+
+        @functools.wraps(function)
+        def counted_function(*args, **kwargs):
+            instrumentation.add_count(name)
+            return function(*args, **kwargs)
+        return counted_function
+
+
+class Instrumentation:
+    """
+    Collects named timers and counters and periodically appends their aggregated statistics to a JSON lines file.
+
+    Instrumentation is disabled until it is enabled by configure. Timers and counters requested from a disabled
+    instance do nothing, and decorated functions stay untouched until configure replaces them by measured versions.
+    """
+
+    def __init__(self, enabled=False, output_path="cache/instrumentation.jsonl", flush_interval=10.0,
+                 build_label=None):
+        """
+        Initializes the instrumentation.
+
+        Args:
+            enabled (bool): Whether timers and counters are recorded at all.
+            output_path (str): The JSON lines file the statistics are appended to.
+            flush_interval (float): Seconds between two flushes of the background thread.
+            build_label (str): Label of the build written to every record, so that builds can be compared.
+        """
+        self.enabled = enabled
+        self.output_path = output_path
+        self.flush_interval = flush_interval
+        self.build_label = build_label
+        self.session = f"{int(time.time())}-{os.getpid()}"
+        self.timers = {}
+        self.counters = {}
+        self.lock = threading.Lock()
+        self.interval_start = time.time()
+        self.stop_event = threading.Event()
+        self.flush_thread = None
+        # Functions decorated while instrumentation was disabled: (function, name, Timer or Counter).
+        self.decorated_functions = []
+
+    def configure(self, enabled=False, output_path="cache/instrumentation.jsonl", flush_interval=10.0,
+                  build_label=None):
+        """
+        Changes the settings of the instrumentation (before it is started). Functions decorated while instrumentation
+        was disabled are replaced by their measured versions in their class or module (and restored when it is
+        disabled again).
+
+        Args:
+            enabled (bool): Whether timers and counters are recorded at all.
+            output_path (str): The JSON lines file the statistics are appended to.
+            flush_interval (float): Seconds between two flushes of the background thread.
+            build_label (str): Label of the build written to every record, so that builds can be compared.
+        """
+        self.enabled = enabled
+        self.output_path = output_path
+        self.flush_interval = flush_interval
+        self.build_label = build_label
+
+        for function, name, kind in self.decorated_functions:
+            owner, attribute = self.find_owner(function)
+            if owner is not None:
+                setattr(owner, attribute, kind(self, name)(function) if enabled else function)
+
+    @staticmethod
+    def find_owner(function):
+        """
+        Finds the class or module that holds a decorated function.
+
+        Args:
+            function (function): The undecorated function.
+
+        Returns:
+            The class or module and the attribute name of the function, or (None, None) if the function cannot be
+            replaced (e.g. a local function).
+        """
+        owner = sys.modules.get(function.__module__)
+        *path, attribute = function.__qualname__.split(".")
+        for part in path:
+            owner = getattr(owner, part, None)
+        # The attribute holds the function itself or its measured version (which wraps the function).
+        current = vars(owner).get(attribute) if owner is not None else None
+        if current is not function and getattr(current, "__wrapped__", None) is not function:
+            return None, None
+        return owner, attribute
+
+    def timer(self, name):
+        """
+        Gets a timer usable as context manager or decorator.
+
+        Args:
+            name (str): The name of the timer.
+
+        Returns:
+            The timer (doing nothing while instrumentation is disabled).
+        """
+        if not self.enabled:
+            return Disabled(self, name, Timer)
+        return Timer(self, name)
+
+    def counter(self, name):
+        """
+        Gets a counter usable as context manager or decorator.
+
+        Args:
+            name (str): The name of the counter.
+
+        Returns:
+            The counter (doing nothing while instrumentation is disabled).
+        """
+        if not self.enabled:
+            return Disabled(self, name, Counter)
+        return Counter(self, name)
+
+    def add_time(self, name, duration):
+        """
+        Adds a measured duration to the statistics of a timer.
+
+        Args:
+            name (str): The name of the timer.
+            duration (float): The duration in seconds.
+        """
+        with self.lock:
+            statistics = self.timers.get(name)
+            if statistics is None:
+                self.timers[name] = [1, duration, duration, duration]
+            else:
+                statistics[0] += 1
+                statistics[1] += duration
+                statistics[2] = min(statistics[2], duration)
+                statistics[3] = max(statistics[3], duration)
+
+    def add_count(self, name, amount=1):
+        """
+        Increases a counter.
+
+        Args:
+            name (str): The name of the counter.
+            amount (int): The amount to add.
+        """
+        with self.lock:
+            self.counters[name] = self.counters.get(name, 0) + amount
+
+    def collect(self):
+        """
+        Takes the statistics since the last collection and resets them.
+
+        Returns:
+            A dictionary with the statistics of all timers (in milliseconds) and counters of the interval.
+        """
+        with self.lock:
+            timers, self.timers = self.timers, {}
+            counters, self.counters = self.counters, {}
+            interval_start, self.interval_start = self.interval_start, time.time()
+        return {
+            "session": self.session,
+            "build": self.build_label,
+            "platform": platform.platform(),
+            "python": platform.python_version(),
+            "pygame": pygame.version.ver,
+            "start": interval_start,
+            "end": self.interval_start,
+            "timers": {name: {"count": count, "total_ms": total * 1000, "avg_ms": total / count * 1000,
+                              "min_ms": minimum * 1000, "max_ms": maximum * 1000}
+                       for name, (count, total, minimum, maximum) in timers.items()},
+            "counters": counters
+        }
+
+    def flush(self):
+        """
+        Appends the statistics since the last flush to the output file (nothing is written for an empty interval).
+        """
+        record = self.collect()
+        if not record["timers"] and not record["counters"]:
+            return
+        os.makedirs(os.path.dirname(self.output_path) or ".", exist_ok=True)
+        with open(self.output_path, "a") as file:
+            file.write(json.dumps(record) + "\n")
+
+    def run_flush_loop(self):
+        """
+        Flushes the statistics periodically until the instrumentation is stopped.
+        """
+        while not self.stop_event.wait(self.flush_interval):
+            try:
+                self.flush()
+            except OSError as error:
+                print(f"Instrumentation could not be written: {error}", file=sys.stderr)
+
+    def start(self):
+        """
+        Starts the background thread that flushes the statistics (only if instrumentation is enabled).
+        """
+        if not self.enabled or self.flush_thread:
+            return
+        self.stop_event.clear()
+        self.flush_thread = threading.Thread(target=self.run_flush_loop, name="instrumentation", daemon=True)
+        self.flush_thread.start()
+
+    def stop(self):
+        """
+        Stops the background thread and flushes the remaining statistics.
+        """
+        if not self.flush_thread:
+            return
+        self.stop_event.set()
+        self.flush_thread.join()
+        self.flush_thread = None
+        self.flush()
+
+
+# Instrumentation used by the game. It is disabled until the game configures it from the configuration file.
+instrumentation = Instrumentation()
@@ -1,5 +1,6 @@
 import pickle
 import os
+from src.instrumentation import instrumentation
 
 
 class SaveLoadSystem:
@@ -18,6 +19,7 @@ class SaveLoadSystem:
         self.file_extension = file_extension
         self.save_folder = save_folder
 
+    @instrumentation.timer("save_load.save_data")
     def save_data(self, data, name):
         """
         Saves data to a file.
@@ -29,6 +31,7 @@ class SaveLoadSystem:
         data_file = open(f"{self.save_folder}/{name}{self.file_extension}", "wb")
         pickle.dump(data, data_file)
 
+    @instrumentation.timer("save_load.load_data")
     def load_data(self, name):
         """
         Loads data from a file.
@@ -0,0 +1,196 @@
+import gc
+import logging
+import os
+import time
+import tracemalloc
+import weakref
+from collections import deque
+from src.enums import GameState
+
+
+class LiveObjects:
+    """
+    Counts the live instances of tracked classes through weak references, so that counting never keeps an object
+    alive.
+    """
+
+    def __init__(self):
+        """
+        Initializes the registry. Objects are only tracked after it has been enabled.
+        """
+        self.enabled = False
+        self.objects = {}
+
+    def track(self, instance):
+        """
+        Tracks an object under the name of its class (does nothing while disabled).
+
+        Args:
+            instance (object): The object to be tracked.
+        """
+        if not self.enabled:
+            return
+        self.objects.setdefault(type(instance).__name__, weakref.WeakSet()).add(instance)
+
+    def count(self):
+        """
+        Counts the live objects of all tracked classes.
+
+        Returns:
+            A dictionary with the number of live objects per class name.
+        """
+        return {name: len(objects) for name, objects in sorted(self.objects.items())}
+
+
+class MemoryTracker:
+    """
+    Optional memory profiler for game runs based on tracemalloc.
+
+    Memory is snapshotted when a run starts, every few seconds while playing and at game over. At the start of a run
+    all sprites of the previous run must be gone, so any remaining obstacles, enemies, power ups and projectiles (and
+    more than one weapon) are reported as stale objects. Memory growing across several consecutive restarts is
+    reported with the allocation sites responsible for the growth.
+    """
+    # Number of live objects per class that are expected at the start of a run.
+    EXPECTED_AT_RUN_START = {"Player": 1, "Weapon": 1}
+
+    def __init__(self, enabled=False, snapshot_interval=30, top_count=10, traceback_frames=1,
+                 growth_threshold_kb=256, growth_runs=3, log_path="cache/memory.log"):
+        """
+        Initializes the memory tracker.
+
+        Args:
+            enabled (bool): Whether memory is tracked at all.
+            snapshot_interval (float): Seconds between two snapshots while playing.
+            top_count (int): Number of allocation sites listed in reports.
+            traceback_frames (int): Number of frames stored per allocation by tracemalloc.
+            growth_threshold_kb (float): Growth between two run starts (in kilobytes) that counts as growth.
+            growth_runs (int): Number of consecutive growing restarts after which growth is reported.
+            log_path (str): The file the reports are written to.
+        """
+        self.enabled = enabled
+        self.snapshot_interval = snapshot_interval
+        self.top_count = top_count
+        self.traceback_frames = traceback_frames
+        self.growth_threshold = growth_threshold_kb * 1024
+        self.growth_runs = growth_runs
+        self.log_path = log_path
+        self.previous_state = None
+        self.run_number = 0
+        self.run_start_snapshot = None
+        self.last_snapshot_time = 0.0
+        # Traced memory and snapshot at the start of the last runs, used to detect growth across restarts.
+        self.run_starts = deque(maxlen=growth_runs + 1)
+        self.logger = logging.getLogger("memory")
+        self.handler = None
+
+        # Sprites are tracked from now on, so the tracker must be created before the first sprite.
+        if self.enabled:
+            live_objects.enabled = True
+
+    def start(self):
+        """
+        Starts tracing allocations (only if the tracker is enabled).
+        """
+        if not self.enabled:
+            return
+        os.makedirs(os.path.dirname(self.log_path) or ".", exist_ok=True)
+        self.logger.setLevel(logging.INFO)
+        self.logger.propagate = False
+        self.handler = logging.FileHandler(self.log_path)
+        self.handler.setFormatter(logging.Formatter("%(asctime)s %(message)s"))
+        self.logger.addHandler(self.handler)
+        tracemalloc.start(self.traceback_frames)
+
+    def update(self, game_state):
+        """
+        Takes the snapshots of the current game state. Must be called once per frame.
+
+        Args:
+            game_state (GameState): The current state of the game.
+        """
+        if not self.enabled:
+            return
+        previous_state, self.previous_state = self.previous_state, game_state
+        if game_state == GameState.PLAYING:
+            if previous_state not in (GameState.PLAYING, GameState.PAUSED):
+                self.start_run()
+            elif time.monotonic() - self.last_snapshot_time > self.snapshot_interval:
+                self.report("periodic snapshot", tracemalloc.take_snapshot())
+        elif game_state == GameState.GAME_OVER and previous_state != GameState.GAME_OVER:
+            self.report("game over", tracemalloc.take_snapshot())
+
+    def start_run(self):
+        """
+        Checks for stale sprites of the previous run and for memory growth across restarts.
+        """
+        self.run_number += 1
+        gc.collect()
+        snapshot = tracemalloc.take_snapshot()
+        self.run_start_snapshot = snapshot
+        self.report("run start", snapshot)
+
+        # All sprites of the previous run must have been released.
+        stale_objects = {name: count - self.EXPECTED_AT_RUN_START.get(name, 0)
+                         for name, count in live_objects.count().items()
+                         if count > self.EXPECTED_AT_RUN_START.get(name, 0)}
+        if stale_objects:
+            stale = ", ".join(f"{name}={count}" for name, count in stale_objects.items())
+            self.logger.warning(f"Run {self.run_number}: stale objects from previous runs: {stale}")
+
+        # Report memory that has grown on every one of the last restarts.
+        self.run_starts.append((tracemalloc.get_traced_memory()[0], snapshot))
+        memory = [traced for traced, _ in self.run_starts]
+        if len(memory) > self.growth_runs and all(current - previous > self.growth_threshold
+                                                  for previous, current in zip(memory, memory[1:])):
+            statistics = snapshot.compare_to(self.run_starts[0][1], "lineno")
+            self.logger.warning(f"Run {self.run_number}: memory grew by {(memory[-1] - memory[0]) / 1024:.1f} KiB "
+                                f"over the last {self.growth_runs} restarts. Top growing allocation sites:\n"
+                                f"{self.format_top(statistics)}")
+
+    def report(self, event, snapshot):
+        """
+        Writes the traced memory, the live objects and the top allocation sites (compared to the run start).
+
+        Args:
+            event (str): The reason of the snapshot.
+            snapshot (tracemalloc.Snapshot): The snapshot.
+        """
+        self.last_snapshot_time = time.monotonic()
+        current, peak = tracemalloc.get_traced_memory()
+        counts = ", ".join(f"{name}={count}" for name, count in live_objects.count().items())
+        if snapshot is self.run_start_snapshot:
+            statistics = snapshot.statistics("lineno")
+        else:
+            statistics = snapshot.compare_to(self.run_start_snapshot, "lineno")
+        self.logger.info(f"Run {self.run_number} {event}: traced {current / 1024:.1f} KiB (peak {peak / 1024:.1f} "
+                         f"KiB), live objects: {counts}\n{self.format_top(statistics)}")
+
+    def format_top(self, statistics):
+        """
+        Formats the top allocation sites.
+
+        Args:
+            statistics (list): tracemalloc statistics or statistic differences.
+
+        Returns:
+            One line per allocation site.
+        """
+        return "\n".join(f"  {statistic}" for statistic in statistics[:self.top_count])
+
+    def stop(self):
+        """
+        Stops tracing allocations and tracking sprites.
+        """
+        if not self.enabled:
+            return
+        live_objects.enabled = False
+        tracemalloc.stop()
+        if self.handler:
+            self.logger.removeHandler(self.handler)
+            self.handler.close()
+            self.handler = None
+
+
+# Registry of live sprites, filled by Entity.
+live_objects = LiveObjects()
@@ -1,7 +1,6 @@
 import pygame
-import pandas as pd
-import numpy as np
 from src.assets import Assets
+from src.table import Table
 
 
 class Menu:
@@ -90,10 +89,7 @@ class Menu:
             in self.buttons)
 
         # Set cursor based on collision with button.
-        if cursor_over_button:
-            pygame.mouse.set_cursor(pygame.SYSTEM_CURSOR_HAND)
-        else:
-            pygame.mouse.set_cursor(pygame.SYSTEM_CURSOR_ARROW)
+        self.set_cursor(pygame.SYSTEM_CURSOR_HAND if cursor_over_button else pygame.SYSTEM_CURSOR_ARROW)
 
         # Handle mouse clicks for buttons.
         if event.type == pygame.MOUSEBUTTONDOWN:
@@ -104,9 +100,19 @@ class Menu:
             for button in self.buttons:
                 if button.rect.collidepoint(mouse_pos) and button.clicked:
                     button.clicked = False
-                    pygame.mouse.set_cursor(pygame.SYSTEM_CURSOR_ARROW)
+                    self.set_cursor(pygame.SYSTEM_CURSOR_ARROW)
                     return button.name
 
+    def set_cursor(self, cursor):
+        """
+        Sets the system cursor. Without a window (headless mode) there is no cursor, so nothing is done.
+
+        Args:
+            cursor (int): The pygame system cursor constant.
+        """
+        if not self.game.headless:
+            pygame.mouse.set_cursor(cursor)
+
 
 class MainMenu(Menu):
     """
@@ -139,7 +145,7 @@ class MainMenu(Menu):
         super().display()
 
         # Update display.
-        pygame.display.flip()
+        self.game.backend.present_screen()
 
     def handle_input(self, event):
         """
@@ -197,7 +203,7 @@ class SettingsMenu(Menu):
         self.game.screen.blit(sound_volume, sound_volume_rect)
 
         # Update display.
-        pygame.display.flip()
+        self.game.backend.present_screen()
 
     def handle_input(self, event):
         """
@@ -245,11 +251,11 @@ class StatsMenu(Menu):
         super().display()
 
         # Get highscore and travelled distance of last 10 runs .
-        highscore, run_distance_df, distance_list = self.get_highscore_and_run_distance()
+        highscore, run_distance_table, distance_list = self.get_highscore_and_run_distance()
 
-        # Display dataframe with travelled distance of last 10 runs as table.
+        # Display travelled distance of last 10 runs as table.
         if self.game.number_of_runs > 0:
-            self.display_table(run_distance_df)
+            self.display_table(run_distance_table)
 
         # Display highscore.
         highscore_text = self.assets.font_small.render("Highscore", True, "cyan")
@@ -263,7 +269,7 @@ class StatsMenu(Menu):
         average_text = self.assets.font_small.render("Average Distance", True, "cyan")
         average_text_rect = average_text.get_rect(center=(self.right[0] + 100, self.right[1] + 35))
         if distance_list:
-            average = int(np.mean(distance_list))
+            average = int(sum(distance_list) / len(distance_list))
         else:
             average = 0
         average_number = self.assets.font_comicsans_middle.render(str(average), True, "dodgerblue")
@@ -272,7 +278,7 @@ class StatsMenu(Menu):
         self.game.screen.blit(average_number, average_number_rect)
 
         # Update display.
-        pygame.display.flip()
+        self.game.backend.present_screen()
 
     def get_highscore_and_run_distance(self):
         """
@@ -280,8 +286,7 @@ class StatsMenu(Menu):
 
         Returns:
             highscore (int): The overall highscore.
-            run_distance_df (pandas.DataFrame): A pandas DataFrame containing the run number and
-                                                distance of the last 10 runs.
+            run_distance_table (Table): A table containing the run number and distance of the last 10 runs.
             distance_list (list): A list of the last 10 distances.
         """
         # Get highscore and distance of last 10 runs.
@@ -297,33 +302,32 @@ class StatsMenu(Menu):
                 else:
                     run_list.append(run_distance)
 
-        # Create DataFrame from distance and run lists for table format.
-        run_distance_dict = {"Run": run_list, "Distance": distance_list}
-        run_distance_df = pd.DataFrame(run_distance_dict)
-        return highscore, run_distance_df, distance_list_all
+        # Create table from distance and run lists.
+        run_distance_table = Table({"Run": run_list, "Distance": distance_list})
+        return highscore, run_distance_table, distance_list_all
 
-    def display_table(self, table_df):
+    def display_table(self, table):
         """
-        Displays the statistics dataframe as table.
+        Displays the statistics table.
 
         Args:
-            table_df (pandas.DataFrame): A pandas DataFrame containing the data for the table.
+            table (Table): A table containing the data.
         """
         # Cell and table settings
         cell_padding = 5
         cell_height = 40
         cell_width = 150
-        table_x, table_y = self.left[0] - 250, self.left[1] - ((table_df.shape[0] + 1) * cell_height / 2)
+        table_x, table_y = self.left[0] - 250, self.left[1] - ((table.shape[0] + 1) * cell_height / 2)
 
         # Draw the table columns.
-        for i, col in enumerate(table_df.columns):
+        for i, col in enumerate(table.columns):
             cell_rect = pygame.Rect(table_x + i * cell_width, table_y, cell_width, cell_height)
             pygame.draw.rect(self.game.screen, (50, 50, 50), cell_rect)
             cell_text = self.assets.font_comicsans_small.render(col, True, "cyan")
             self.game.screen.blit(cell_text, (cell_rect.x + cell_padding, cell_rect.y + cell_padding))
 
         # Draw the table rows.
-        for i, (_, row) in enumerate(table_df.iterrows()):
+        for i, row in enumerate(table.rows):
             for j, value in enumerate(row):
                 cell_rect = pygame.Rect(table_x + j * cell_width, table_y + (i + 1) * cell_height, cell_width,
                                         cell_height)
@@ -346,6 +350,8 @@ class ShopMenu(Menu):
     """
     Represents the shop menu.
     """
+    # Icons of the lazy asset tier, which are only loaded when the shop is displayed for the first time.
+    LAZY_ICONS = ("shop_icon", "heart_icon", "weapon_icon")
 
     def __init__(self, game):
         """
@@ -363,17 +369,15 @@ class ShopMenu(Menu):
         self.buttons = [
             Button("shop_text", self.game.screen, (self.top[0], self.top[1] + 15), "cyan", "shop",
                    "dodgerblue", self.assets.font_middle),
-            Button("shop_icon", self.game.screen, self.center, "blue", None, None, None, self.assets.shop_icon),
+            Button("shop_icon", self.game.screen, self.center, "blue", None, None, None),
             Button("coins_text", self.game.screen, (self.center[0], self.center[1] - 125), "dodgerblue",
                    f"Coins: {self.game.coins}", "cyan", self.assets.font_comicsans_middle),
-            Button("heart_icon", self.game.screen, (self.left[0] - 100, self.left[1]), "red",
-                   None, None, None, self.assets.heart_icon),
+            Button("heart_icon", self.game.screen, (self.left[0] - 100, self.left[1]), "red", None, None, None),
             Button("buy_second_life_button", self.game.screen, (self.left[0] - 100, self.left[1] + 120), "dodgerblue",
                    "buy", "cyan", self.assets.font_small),
             Button("second_life_costs_text", self.game.screen, (self.left[0] - 100, self.left[1] - 90), "dodgerblue",
                    f"Costs: {self.extra_life_costs}", "cyan", self.assets.font_comicsans_middle),
-            Button("weapon_icon", self.game.screen, (self.right[0] + 100, self.right[1]), "grey",
-                   None, None, None, self.assets.weapon_icon),
+            Button("weapon_icon", self.game.screen, (self.right[0] + 100, self.right[1]), "grey", None, None, None),
             Button("buy_weapon_button", self.game.screen, (self.right[0] + 100, self.right[1] + 120), "dodgerblue",
                    "buy", "cyan", self.assets.font_small),
             Button("weapon_costs_text", self.game.screen, (self.right[0] + 100, self.right[1] - 90), "dodgerblue",
@@ -385,6 +389,11 @@ class ShopMenu(Menu):
         """
         Displays the menu on the screen.
         """
+        # Get the icons (loaded from the lazy asset tier on first access).
+        for button in self.buttons:
+            if button.name in self.LAZY_ICONS and button.image is None:
+                button.image = getattr(self.assets, button.name)
+
         super().display()
 
         # Info text for second life item.
@@ -403,7 +412,7 @@ class ShopMenu(Menu):
         self.game.screen.blit(upgrade_weapon_info_2, upgrade_weapon_info_rect2)
 
         # Update display.
-        pygame.display.flip()
+        self.game.backend.present_screen()
 
     def handle_input(self, event):
         """
@@ -459,7 +468,7 @@ class ControlsMenu(Menu):
                                   info_text.get_rect(center=(self.center[0], self.top[1] + (90 * (index + 1)))))
 
         # Update display.
-        pygame.display.flip()
+        self.game.backend.present_screen()
 
     def handle_input(self, event):
         """
@@ -527,7 +536,7 @@ class GameOverMenu(Menu):
         self.game.screen.blit(exp_text, exp_text_rect)
 
         # Update display.
-        pygame.display.flip()
+        self.game.backend.present_screen()
 
     def handle_input(self, event):
         """
@@ -577,7 +586,7 @@ class PauseMenu(Menu):
         self.game.screen.blit(paused, (self.image_rect.centerx - paused.get_width() // 2, 100))
 
         # Update display.
-        pygame.display.flip()
+        self.game.backend.present_screen()
 
     def handle_input(self, event):
         """
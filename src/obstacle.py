@@ -7,7 +7,7 @@ class Obstacle(Entity):
     Class representing obstacles in the game.
     """
 
-    def __init__(self, position, images, obstacle_type, speed, game):
+    def __init__(self, position, images, obstacle_type, speed, game, flip_x=False):
         """
         Initializes an obstacle with a given position, animation images, type and speed.
 
@@ -15,25 +15,33 @@ class Obstacle(Entity):
             position (tuple): The initial position (x, y) of the obstacle.
             images (list): List of images for obstacle animation.
             obstacle_type (ObstacleType): The type of obstacle.
-            speed (int): The movement speed of the obstacle.
+            speed (int): The movement speed of the obstacle in pixels per second.
             game (object): Game object.
+            flip_x (bool): Whether the images are drawn mirrored horizontally.
         """
         super().__init__(position, images, None, game)
+        self.flip_x = flip_x
         self.type = obstacle_type
         self.speed = speed
 
-    def move(self):
+    def move(self, dt):
         """
         Handles the obstacle movement.
+
+        Args:
+            dt (float): The duration of the simulation step in seconds.
         """
-        self.position[0] -= (self.game.scrolling_bg_speed + self.speed)
+        self.position[0] -= (self.game.scrolling_bg_speed + self.speed) * dt
         # Kill obstacle if it moves out of screen.
-        if self.position[0] <= 0 - self.image.get_width():
+        if self.position[0] <= 0 - self.rect.width:
             self.kill()
 
-    def update(self):
+    def update(self, dt):
         """
         Updates obstacle.
+
+        Args:
+            dt (float): The duration of the simulation step in seconds.
         """
-        self.move()
+        self.move(dt)
         super().update()
@@ -0,0 +1,208 @@
+import json
+import os
+import time
+import warnings
+from collections import deque
+import pygame
+
+
+def create_display(size, vsync=False):
+    """
+    Creates the display surface, optionally synchronized with the refresh rate of the monitor.
+
+    Args:
+        size (tuple): The size (width, height) of the display.
+        vsync (bool): Whether vsync is requested. pygame only supports it for scaled (or OpenGL) displays.
+
+    Returns:
+        A tuple of the display surface and whether vsync is active.
+    """
+    if vsync:
+        try:
+            return pygame.display.set_mode(size, pygame.SCALED, vsync=1), True
+        except pygame.error as error:
+            warnings.warn(f"Vsync is not available ({error}), the frame pacer uses another mode instead.")
+    return pygame.display.set_mode(size), False
+
+
+class FramePacer:
+    """
+    Limits the frame rate and measures how evenly the frames are paced.
+
+    The modes differ in how the remaining time of a frame is waited:
+    - "sleep": Clock.tick, which sleeps with the coarse granularity of the operating system.
+    - "busy": Clock.tick_busy_loop, which spins until the frame is over (precise, but keeps a core busy).
+    - "hybrid": sleeps until shortly before the end of the frame and spins for the rest.
+    - "vsync": flipping the display waits for the monitor, so the pacer only measures.
+    - "auto": measures the jitter of sleep, busy and hybrid for a number of frames each, picks the mode with the
+      lowest jitter and caches the choice, so that the calibration only runs once per machine.
+    """
+    MODES = ("sleep", "busy", "hybrid", "vsync")
+    # Modes measured by the automatic calibration (vsync has to be chosen when the display is created).
+    CALIBRATED_MODES = ("sleep", "busy", "hybrid")
+    # Upper bounds (in milliseconds) of the jitter histogram buckets, the last bucket contains all larger deviations.
+    HISTOGRAM_BUCKETS = (0.25, 0.5, 1, 2, 4, 8)
+    # Frames at the start of every calibrated mode that are not measured (the first ones catch up with the switch).
+    WARMUP_FRAMES = 5
+
+    def __init__(self, fps, mode="auto", spin_ms=2.0, calibration_frames=120, cache_file="cache/pacing.json",
+                 history=600):
+        """
+        Initializes the frame pacer.
+
+        Args:
+            fps (int): The target frame rate (0 for an unlimited frame rate).
+            mode (str): "sleep", "busy", "hybrid", "vsync" or "auto".
+            spin_ms (float): Time before the end of a frame (in milliseconds) from which the hybrid mode spins.
+            calibration_frames (int): Number of measured frames per mode during the automatic calibration.
+            cache_file (str): The file in which the automatically chosen mode is cached.
+            history (int): Number of frame intervals kept for the jitter statistics.
+        """
+        self.fps = fps
+        self.target = 1 / fps if fps else 0.0
+        self.spin = spin_ms / 1000
+        self.calibration_frames = calibration_frames
+        self.cache_file = cache_file
+        self.clock = pygame.time.Clock()
+        self.last_tick = time.perf_counter()
+        self.intervals = deque(maxlen=history)
+        # Jitter statistics per calibrated mode and the modes which still have to be measured.
+        self.calibration = {}
+        self.pending_modes = []
+
+        self.mode = mode
+        if mode == "auto":
+            self.mode = self.load_cached_mode()
+            if self.mode is None:
+                self.pending_modes = list(self.CALIBRATED_MODES)
+                self.mode = self.pending_modes[0]
+        elif mode not in self.MODES:
+            raise ValueError(f"Unknown frame pacing mode '{mode}'!")
+
+    def load_cached_mode(self):
+        """
+        Loads the mode chosen by a previous calibration for the target frame rate.
+
+        Returns:
+            The cached mode or None if there is none.
+        """
+        if not os.path.exists(self.cache_file):
+            return None
+        with open(self.cache_file, "r") as file:
+            cached = json.load(file).get(str(self.fps))
+        return cached["mode"] if cached and cached["mode"] in self.CALIBRATED_MODES else None
+
+    def save_cached_mode(self):
+        """
+        Saves the chosen mode and the measured statistics of all modes for the target frame rate.
+        """
+        cache = {}
+        if os.path.exists(self.cache_file):
+            with open(self.cache_file, "r") as file:
+                cache = json.load(file)
+        cache[str(self.fps)] = {"mode": self.mode, "statistics": self.calibration}
+        os.makedirs(os.path.dirname(self.cache_file) or ".", exist_ok=True)
+        with open(self.cache_file, "w") as file:
+            json.dump(cache, file, indent=2)
+
+    def tick(self):
+        """
+        Waits until the current frame has taken the target frame time. Must be called once at the end of every frame.
+
+        Returns:
+            The real time since the previous tick in seconds.
+        """
+        if self.mode == "sleep":
+            self.clock.tick(self.fps)
+        elif self.mode == "busy":
+            self.clock.tick_busy_loop(self.fps)
+        elif self.mode == "hybrid":
+            self.wait_hybrid()
+
+        now = time.perf_counter()
+        elapsed = now - self.last_tick
+        self.last_tick = now
+        self.intervals.append(elapsed)
+        if self.pending_modes:
+            self.calibrate()
+        return elapsed
+
+    def wait_hybrid(self):
+        """
+        Sleeps until shortly before the end of the frame and spins for the remaining time.
+        """
+        deadline = self.last_tick + self.target
+        remaining = deadline - time.perf_counter()
+        if remaining > self.spin:
+            time.sleep(remaining - self.spin)
+        while time.perf_counter() < deadline:
+            pass
+
+    def calibrate(self):
+        """
+        Measures the current mode until enough frames are recorded, then continues with the next mode. After the last
+        mode, the one with the lowest jitter is chosen.
+        """
+        if len(self.intervals) < self.WARMUP_FRAMES + self.calibration_frames:
+            return
+        self.calibration[self.mode] = self.get_jitter_statistics(list(self.intervals)[self.WARMUP_FRAMES:])
+        self.pending_modes.pop(0)
+        self.intervals.clear()
+        if self.pending_modes:
+            self.mode = self.pending_modes[0]
+        else:
+            # Rate the modes by their typical and their worst deviations (the clock based modes round the frame
+            # time to whole milliseconds, which shows in the average, while sleeping too long shows in the worst).
+            self.mode = min(self.calibration, key=lambda mode: self.calibration[mode]["mean_ms"] +
+                            self.calibration[mode]["p99_ms"])
+            self.save_cached_mode()
+            self.print_report()
+
+    def get_jitter_statistics(self, intervals=None):
+        """
+        Computes how much the frame intervals deviate from the target frame time.
+
+        Args:
+            intervals (list): Frame intervals in seconds (default: the recorded history).
+
+        Returns:
+            A dictionary with the mean and the 99th percentile deviation (in milliseconds) and the histogram of the
+            deviations (number of frames per bucket of HISTOGRAM_BUCKETS plus one bucket for larger deviations).
+        """
+        intervals = list(self.intervals) if intervals is None else intervals
+        deviations = sorted(abs(interval - self.target) * 1000 for interval in intervals)
+        histogram = [0] * (len(self.HISTOGRAM_BUCKETS) + 1)
+        for deviation in deviations:
+            bucket = 0
+            while bucket < len(self.HISTOGRAM_BUCKETS) and deviation > self.HISTOGRAM_BUCKETS[bucket]:
+                bucket += 1
+            histogram[bucket] += 1
+        if not deviations:
+            return {"mean_ms": 0.0, "p99_ms": 0.0, "histogram": histogram}
+        return {"mean_ms": sum(deviations) / len(deviations),
+                "p99_ms": deviations[min(len(deviations) - 1, int(len(deviations) * 0.99))],
+                "histogram": histogram}
+
+    @classmethod
+    def format_histogram(cls, statistics):
+        """
+        Formats the jitter histogram of a mode.
+
+        Args:
+            statistics (dict): The jitter statistics from get_jitter_statistics.
+
+        Returns:
+            One line with the number of frames per bucket.
+        """
+        labels = [f"<={bound}" for bound in cls.HISTOGRAM_BUCKETS] + [f">{cls.HISTOGRAM_BUCKETS[-1]}"]
+        return "  ".join(f"{label} ms: {count}" for label, count in zip(labels, statistics["histogram"]))
+
+    def print_report(self):
+        """
+        Prints the jitter statistics of all calibrated modes and the chosen mode.
+        """
+        print(f"Frame pacing calibration at {self.fps} fps (deviation from {self.target * 1000:.2f} ms):")
+        for mode, statistics in self.calibration.items():
+            chosen = " (chosen)" if mode == self.mode else ""
+            print(f"  {mode:<7} mean {statistics['mean_ms']:6.3f} ms  p99 {statistics['p99_ms']:6.3f} ms  "
+                  f"{self.format_histogram(statistics)}{chosen}")
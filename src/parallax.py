@@ -0,0 +1,147 @@
+import math
+import pygame
+
+
+class ParallaxLayer:
+    """
+    A background layer that scrolls at a fraction of the scroll speed. Its image is tiled once into a seamless strip
+    that is one tile wider than the view, so that every scroll position is a single area of the strip.
+    """
+
+    def __init__(self, image, scroll_factor, view_width, y=0):
+        """
+        Builds the strip of the layer.
+
+        Args:
+            image (pygame.Surface): The tile of the layer, repeated horizontally.
+            scroll_factor (float): The part of the scroll distance the layer moves (1 moves with the playfield, layers
+                further away use smaller factors).
+            view_width (int): The width of the visible area.
+            y (float): The vertical position of the layer.
+        """
+        self.image = image
+        self.scroll_factor = scroll_factor
+        self.y = y
+        self.tile_width = image.get_width()
+        self.view_width = view_width
+
+        # Copy the pixels of the tiles unchanged (blending onto the empty strip would alter translucent pixels).
+        tiles = math.ceil(view_width / self.tile_width) + 1
+        self.strip = pygame.Surface((self.tile_width * tiles, image.get_height()), image.get_flags(), image)
+        colorkey = image.get_colorkey()
+        if colorkey:
+            self.strip.fill(colorkey)
+            self.strip.set_colorkey(colorkey, pygame.RLEACCEL)
+        for tile in range(tiles):
+            self.strip.blit(image, (tile * self.tile_width, 0),
+                            special_flags=0 if colorkey else pygame.BLEND_RGBA_MAX)
+
+        # Scroll position within one tile (wrapped, so it does not grow with the distance).
+        self.offset = 0.0
+        self.previous_offset = 0.0
+
+    def scroll(self, distance):
+        """
+        Scrolls the layer to the left.
+
+        Args:
+            distance (float): The scroll distance of the playfield (less than one tile per step).
+        """
+        self.offset = (self.offset + distance * self.scroll_factor) % self.tile_width
+
+    def get_area(self, alpha=1.0):
+        """
+        Gets the visible area of the strip.
+
+        Args:
+            alpha (float): The fraction of the simulation step between the previous and the current offset.
+
+        Returns:
+            The area as pygame.Rect. Its position is snapped to whole pixels, so that the strip is not resampled.
+        """
+        scrolled = self.offset - self.previous_offset
+        # The offset has wrapped around to the start of the tile.
+        if scrolled < 0:
+            scrolled += self.tile_width
+        offset = round(self.previous_offset + scrolled * alpha) % self.tile_width
+        return pygame.Rect(offset, 0, self.view_width, self.strip.get_height())
+
+
+class ParallaxBackground:
+    """
+    Background made of several layers that scroll at different speeds. Each layer costs one blit per frame.
+    """
+
+    def __init__(self, layers):
+        """
+        Initializes the background.
+
+        Args:
+            layers (list): The parallax layers from back to front.
+        """
+        self.layers = layers
+
+    @classmethod
+    def from_config(cls, layer_configs, assets, view_width, scale=1):
+        """
+        Creates the background from the layer configuration.
+
+        Args:
+            layer_configs (list): One dictionary per layer (from back to front) with the name of the image attribute
+                in the assets ("image"), the scroll factor ("scroll_factor") and optionally the vertical position
+                ("y", in world coordinates).
+            assets (Assets): The assets.
+            view_width (int): The width of the visible area in world coordinates.
+            scale (float): The scale of the internal render resolution. The images are scaled accordingly.
+
+        Returns:
+            The parallax background.
+        """
+        layers = []
+        for layer_config in layer_configs:
+            image = getattr(assets, layer_config["image"])
+            if scale != 1:
+                image = pygame.transform.smoothscale_by(image, scale)
+            layers.append(ParallaxLayer(image, layer_config["scroll_factor"], round(view_width * scale),
+                                        layer_config.get("y", 0) * scale))
+        return cls(layers)
+
+    def scroll(self, distance):
+        """
+        Scrolls all layers according to their scroll factor.
+
+        Args:
+            distance (float): The scroll distance of the playfield in pixels of the layer images.
+        """
+        for layer in self.layers:
+            layer.scroll(distance)
+
+    def store_previous_offsets(self):
+        """
+        Stores the current offsets of all layers as their previous offsets.
+        """
+        for layer in self.layers:
+            layer.previous_offset = layer.offset
+
+    def queue(self, render_queue, alpha=1.0, scale=1):
+        """
+        Queues the visible area of every layer on the background layer of the render queue.
+
+        Args:
+            render_queue (RenderQueue): The render queue.
+            alpha (float): The fraction of the simulation step between the previous and the current offsets.
+            scale (float): Scale from the pixels of the layer images to the coordinates of the render target.
+        """
+        for layer in self.layers:
+            render_queue.add("background", layer.strip, (0, layer.y * scale), layer.get_area(alpha))
+
+    def queue_static(self, render_queue, scale=1):
+        """
+        Queues only the tile of the back layer without scrolling.
+
+        Args:
+            render_queue (RenderQueue): The render queue.
+            scale (float): Scale from the pixels of the layer images to the coordinates of the render target.
+        """
+        layer = self.layers[0]
+        render_queue.add("background", layer.image, (0, layer.y * scale))
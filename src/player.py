@@ -31,7 +31,7 @@ class Player(Entity):
         self.health = self.assets.config["initial_player_health"]
 
         self.invincible = False
-        self.invincible_time = self.game.fps * self.assets.config["invincible_time"]
+        self.invincible_time = self.assets.config["invincible_time"]
 
         # Create default weapon for the player.
         self.weapon = Weapon([self.position[0] + self.rect.width, self.position[1] + 30], WeaponType.DEFAULT, game,
@@ -43,10 +43,12 @@ class Player(Entity):
         self.images_jump = images_jump
         self.images_slide = images_slide
 
-        # Movement parameters.
+        # Movement parameters (speeds in pixels per second, times in seconds).
         self.speed = self.assets.config["player_speed"]
         self.jump_height = self.assets.config["player_jump_height"]
-        self.jump_speed = self.jump_height
+        self.jump_duration = self.assets.config["player_jump_duration"]
+        self.jump_time = 0
+        self.jump_start_y = self.position[1]
         self.is_jumping = False
         self.is_sliding = False
         self.slide_height = self.assets.config["player_slide_height"]
@@ -58,7 +60,7 @@ class Player(Entity):
         self.slide_cooldown = 0
         self.slide_cooldown_max = self.assets.config["player_slide_cooldown_max"]
 
-        # Initialize animation-related variables.
+        # Initialize animation-related variables (animation speed in frames per second).
         self.animation_speed = self.assets.config["player_animation_speed"]
         self.current_frame = 0
 
@@ -75,9 +77,12 @@ class Player(Entity):
             PlayerState.SLIDING: self.images_slide
         }
 
-    def handle_input(self):
+    def handle_input(self, dt):
         """
         Handles input for player. Executes specific movement / action according to user input.
+
+        Args:
+            dt (float): The duration of the simulation step in seconds.
         """
         # Get pressed keys.
         keys = pygame.key.get_pressed()
@@ -85,16 +90,16 @@ class Player(Entity):
         if self.game.current_state == GameState.PLAYING:
             # Handle horizontal movement input.
             if keys[pygame.K_RIGHT] and not keys[pygame.K_LEFT] and not self.is_sliding:
-                self.move_right()
+                self.move_right(dt)
             elif keys[pygame.K_LEFT] and not keys[pygame.K_RIGHT] and not self.is_sliding:
-                self.move_left()
+                self.move_left(dt)
             else:
                 self.current_state = PlayerState.IDLE
 
             # Handle jump and slide input.
             if keys[pygame.K_UP]:
                 if not self.is_jumping and not self.is_sliding:
-                    self.assets.sounds["jump"].play()
+                    self.assets.sound_effects.play("jump")
                     self.is_jumping = True
             elif keys[pygame.K_DOWN]:
                 if (keys[pygame.K_LEFT] or keys[pygame.K_RIGHT]) and not self.is_jumping and not self.is_sliding and \
@@ -109,39 +114,50 @@ class Player(Entity):
             elif not keys[pygame.K_SPACE]:
                 self.shoot_pressed = False
 
-    def move_left(self):
+    def move_left(self, dt):
         """
         Move the player to the left.
+
+        Args:
+            dt (float): The duration of the simulation step in seconds.
         """
         self.current_state = PlayerState.WALKING_LEFT
         # Make sure that the new position is within the left boundary.
-        new_x = self.position[0] - (self.speed + self.game.scrolling_bg_speed)
+        new_x = self.position[0] - (self.speed + self.game.scrolling_bg_speed) * dt
         self.position[0] = max(new_x, 0)
 
-    def move_right(self):
+    def move_right(self, dt):
         """
         Move the player to the right.
+
+        Args:
+            dt (float): The duration of the simulation step in seconds.
         """
         self.current_state = PlayerState.WALKING_RIGHT
         # Make sure that the new position is within the right boundary.
-        new_x = self.position[0] + self.speed
+        new_x = self.position[0] + self.speed * dt
         self.position[0] = min(new_x, self.game.width - self.rect.width)
 
-    def jump(self):
+    def jump(self, dt):
         """
         Make the player jump.
+
+        Args:
+            dt (float): The duration of the simulation step in seconds.
         """
         if self.is_jumping:
             self.current_state = PlayerState.JUMPING
+            # Remember the ground position when the jump starts.
+            if self.jump_time == 0:
+                self.jump_start_y = self.position[1]
+            self.jump_time += dt
 
             # Check if the jump is still going.
-            if self.jump_speed >= -self.jump_height:
-                # Determine the direction of the jump.
-                direction = 1 if self.jump_speed >= 0 else -1
-                # Adjust the player's vertical position based on the jump speed.
-                self.position[1] -= self.jump_speed ** 2 * 0.1 * direction
-                # Decrease the jump speed.
-                self.jump_speed -= 1
+            if self.jump_time < self.jump_duration:
+                # Set the player's vertical position on the jump arc, which rises fast, slows down at the top and
+                # falls faster again (progress goes from -1 at the start over 0 at the top to 1 at the end).
+                progress = 2 * self.jump_time / self.jump_duration - 1
+                self.position[1] = self.jump_start_y - self.jump_height * (1 - abs(progress) ** 3)
 
                 # Check for simultaneous key presses during the jump.
                 keys = pygame.key.get_pressed()
@@ -150,28 +166,32 @@ class Player(Entity):
                 elif keys[pygame.K_RIGHT]:
                     self.previous_walking_state = PlayerState.WALKING_RIGHT
             else:
-                # Reset jumping state and jump speed.
+                # Land on the ground and reset jumping state and jump time.
                 self.is_jumping = False
-                self.jump_speed = self.jump_height
+                self.jump_time = 0
+                self.position[1] = self.jump_start_y
 
-    def slide(self):
+    def slide(self, dt):
         """
         Make the player slide.
+
+        Args:
+            dt (float): The duration of the simulation step in seconds.
         """
         if self.is_sliding:
             self.current_state = PlayerState.SLIDING
             self.position[1] = self.slide_height
 
             # Gradually reduce speed during the slide.
-            self.slide_speed -= self.slide_speed_reduction
+            self.slide_speed -= self.slide_speed_reduction * dt
 
             if self.slide_speed > 0:
                 # Calculate new x position of player when he slides to the right.
                 if self.previous_walking_state == PlayerState.WALKING_RIGHT:
-                    new_x = self.position[0] + self.slide_speed
+                    new_x = self.position[0] + self.slide_speed * dt
                 # Calculate new x position of player when he slides to the left.
                 elif self.previous_walking_state == PlayerState.WALKING_LEFT:
-                    new_x = self.position[0] - (self.slide_speed + self.game.scrolling_bg_speed)
+                    new_x = self.position[0] - (self.slide_speed + self.game.scrolling_bg_speed) * dt
 
                 # Make sure that the new x position is within the boundaries.
                 new_x = max(0, min(new_x, self.game.width - self.rect.width))
@@ -182,13 +202,16 @@ class Player(Entity):
                 self.is_sliding = False
                 self.position[1] -= self.slide_end_position
                 if self.previous_walking_state == PlayerState.WALKING_RIGHT:
-                    self.position[0] += self.image.get_width() - self.images_idle[0].get_width()
+                    self.position[0] += (self.image.get_width() - self.images_idle[0].get_width()) / self.render_scale
                 # Reset speed to the default value.
                 self.slide_speed = self.speed
 
-    def update_animation(self):
+    def update_animation(self, dt):
         """
         Update the animation based on the current player state.
+
+        Args:
+            dt (float): The duration of the simulation step in seconds.
         """
         self.image_list = self.animations.get(self.current_state)
         # Check if the player is moving to the left or was moving to the left before jumping / sliding.
@@ -198,20 +221,22 @@ class Player(Entity):
         moving_left_slide = (self.current_state == PlayerState.SLIDING or
                              self.current_state == PlayerState.IDLE) and \
                             self.previous_walking_state == PlayerState.WALKING_LEFT
-        if moving_left or moving_left_jump or moving_left_slide:
-            # Flip images vertically.
-            self.image_list = [pygame.transform.flip(image, True, False) for image in self.image_list]
+        # Mirror the images while drawing when the player looks to the left.
+        self.flip_x = moving_left or moving_left_jump or moving_left_slide
         self.image = self.image_list[0]
 
         # Update the animation frame.
-        self.update_animation_frame()
+        self.update_animation_frame(dt)
 
-    def update_animation_frame(self):
+    def update_animation_frame(self, dt):
         """
         Update the animation frame based on the elapsed time.
+
+        Args:
+            dt (float): The duration of the simulation step in seconds.
         """
         # Calculate the index of the current frame based on the current frame counter and animation speed.
-        self.current_frame = (self.current_frame + self.animation_speed / 100) % len(self.image_list)
+        self.current_frame = (self.current_frame + self.animation_speed * dt) % len(self.image_list)
 
         # Set the image of the sprite to the one corresponding to the calculated index.
         self.image = self.image_list[int(self.current_frame)]
@@ -223,24 +248,27 @@ class Player(Entity):
         if self.weapon is not None and self.weapon.shots >= 1:
             self.weapon.fire()
             # Play shooting sound.
-            self.assets.sounds['shoot'].play()
+            self.assets.sound_effects.play("shoot")
 
-    def update(self):
+    def update(self, dt):
         """
         Updates player.
+
+        Args:
+            dt (float): The duration of the simulation step in seconds.
         """
-        self.handle_input()
-        self.jump()
-        self.slide()
+        self.handle_input(dt)
+        self.jump(dt)
+        self.slide(dt)
         if self.slide_cooldown > 0:
-            self.slide_cooldown -= 1
+            self.slide_cooldown = max(0, self.slide_cooldown - dt)
         if self.invincible:
             if self.invincible_time > 0:
-                self.invincible_time -= 1
+                self.invincible_time -= dt
             else:
                 self.invincible = False
-                self.invincible_time = self.game.fps * self.assets.config["invincible_time"]
-        self.update_animation()
+                self.invincible_time = self.assets.config["invincible_time"]
+        self.update_animation(dt)
         # Set the previous walking state at the end of the update method.
         if self.current_state == PlayerState.WALKING_LEFT or self.current_state == PlayerState.WALKING_RIGHT:
             self.previous_walking_state = self.current_state
@@ -40,20 +40,26 @@ class PowerUp(Entity):
             self.game.player.sprite.weapon.max_shots = self.assets.config["multiple_shots"]
             self.game.player.sprite.weapon.shots = self.assets.config["multiple_shots"]
 
-    def move(self):
+    def move(self, dt):
         """
         Moves the power up down (fall speed) and to the left (scrolling background speed).
+
+        Args:
+            dt (float): The duration of the simulation step in seconds.
         """
-        self.position[0] -= self.game.scrolling_bg_speed
+        self.position[0] -= self.game.scrolling_bg_speed * dt
         if self.position[1] <= self.game.height - 170:
-            self.position[1] += self.fall_speed
+            self.position[1] += self.fall_speed * dt
         # Kill the power up if it moves out of screen.
-        if self.position[0] <= 0 - self.image.get_width():
+        if self.position[0] <= 0 - self.rect.width:
             self.kill()
 
-    def update(self):
+    def update(self, dt):
         """
         Update the power up.
+
+        Args:
+            dt (float): The duration of the simulation step in seconds.
         """
-        self.move()
+        self.move(dt)
         super().update()
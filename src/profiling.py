@@ -0,0 +1,210 @@
+import cProfile
+import os
+import sys
+import threading
+import time
+from abc import ABC, abstractmethod
+
+
+class Profiler(ABC):
+    """
+    Base class of the profilers that can be attached to the game. A profiler either covers the whole session or only
+    the time in which the game is actually played (scope "playing"), so that menus do not distort the results.
+    """
+
+    def __init__(self, output_path, scope="session"):
+        """
+        Initializes the profiler.
+
+        Args:
+            output_path (str): The file the results are written to.
+            scope (str): "session" to profile the whole session or "playing" to profile only the playing state.
+        """
+        self.output_path = output_path
+        self.scope = scope
+        self.running = False
+
+    def update(self, playing):
+        """
+        Starts or stops profiling according to the scope. Must be called once per frame.
+
+        Args:
+            playing (bool): Whether the game is currently in the playing state.
+        """
+        active = self.scope == "session" or playing
+        if active and not self.running:
+            self.running = True
+            self.start()
+        elif not active and self.running:
+            self.running = False
+            self.stop()
+
+    def finish(self):
+        """
+        Stops profiling and writes the results.
+        """
+        if self.running:
+            self.running = False
+            self.stop()
+        os.makedirs(os.path.dirname(self.output_path) or ".", exist_ok=True)
+        self.save()
+        print(f"Profile written to {self.output_path}")
+
+    @abstractmethod
+    def start(self):
+        """
+        Starts or resumes profiling.
+        """
+
+    @abstractmethod
+    def stop(self):
+        """
+        Pauses profiling.
+        """
+
+    @abstractmethod
+    def save(self):
+        """
+        Writes the results to the output file.
+        """
+
+
+class CProfileProfiler(Profiler):
+    """
+    Deterministic profiler based on cProfile. All profiled intervals are accumulated in one .prof file, which can be
+    inspected with pstats or tools like snakeviz.
+    """
+
+    def __init__(self, output_path, scope="session"):
+        """
+        Initializes the cProfile profiler.
+
+        Args:
+            output_path (str): The .prof file the statistics are written to.
+            scope (str): "session" to profile the whole session or "playing" to profile only the playing state.
+        """
+        super().__init__(output_path, scope)
+        self.profile = cProfile.Profile()
+
+    def start(self):
+        """
+        Starts or resumes profiling.
+        """
+        self.profile.enable()
+
+    def stop(self):
+        """
+        Pauses profiling.
+        """
+        self.profile.disable()
+
+    def save(self):
+        """
+        Writes the accumulated statistics to the .prof file.
+        """
+        self.profile.dump_stats(self.output_path)
+
+
+class SamplingProfiler(Profiler):
+    """
+    Low-overhead statistical profiler. A background thread periodically takes the stack of the profiled thread and
+    counts how often every stack occurs. The results are written as collapsed stacks ("frame;frame;frame count"),
+    which can be turned into flame graphs with flamegraph.pl, speedscope or inferno.
+    """
+
+    def __init__(self, output_path, scope="session", interval=0.005, thread_id=None):
+        """
+        Initializes the sampling profiler.
+
+        Args:
+            output_path (str): The file the collapsed stacks are written to.
+            scope (str): "session" to profile the whole session or "playing" to profile only the playing state.
+            interval (float): Seconds between two samples.
+            thread_id (int): The identifier of the profiled thread (defaults to the calling thread).
+        """
+        super().__init__(output_path, scope)
+        self.interval = interval
+        self.thread_id = thread_id if thread_id is not None else threading.get_ident()
+        self.stacks = {}
+        # Guards the stacks, which are counted by the sampler thread while they may be written.
+        self.stacks_lock = threading.Lock()
+        self.sampling = threading.Event()
+        self.sampler_thread = None
+
+    @staticmethod
+    def collapse_stack(frame):
+        """
+        Converts a stack into a single line from the outermost to the innermost frame.
+
+        Args:
+            frame (frame): The innermost frame of the stack.
+
+        Returns:
+            The frames of the stack separated by semicolons.
+        """
+        frames = []
+        while frame is not None:
+            code = frame.f_code
+            frames.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})")
+            frame = frame.f_back
+        return ";".join(reversed(frames))
+
+    def run_sampler(self):
+        """
+        Takes samples of the profiled thread while sampling is active. The thread ends when the profiled thread ends.
+        """
+        while True:
+            self.sampling.wait()
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is None:
+                return
+            stack = self.collapse_stack(frame)
+            del frame
+            with self.stacks_lock:
+                self.stacks[stack] = self.stacks.get(stack, 0) + 1
+            time.sleep(self.interval)
+
+    def start(self):
+        """
+        Starts or resumes sampling.
+        """
+        if not self.sampler_thread:
+            self.sampler_thread = threading.Thread(target=self.run_sampler, name="sampling-profiler", daemon=True)
+            self.sampler_thread.start()
+        self.sampling.set()
+
+    def stop(self):
+        """
+        Pauses sampling.
+        """
+        self.sampling.clear()
+
+    def save(self):
+        """
+        Writes the collapsed stacks with their sample counts.
+        """
+        # Take a snapshot, since the sampler thread may still be counting a sample that was taken before it stopped.
+        with self.stacks_lock:
+            stacks = sorted(self.stacks.items())
+        with open(self.output_path, "w") as file:
+            for stack, count in stacks:
+                file.write(f"{stack} {count}\n")
+
+
+def create_profiler(mode, output_path=None, scope="session"):
+    """
+    Creates a profiler for a command line profiling mode.
+
+    Args:
+        mode (str): "cprofile" or "sample".
+        output_path (str): The output file (defaults to a file in the cache folder).
+        scope (str): "session" to profile the whole session or "playing" to profile only the playing state.
+
+    Returns:
+        The profiler.
+    """
+    if mode == "cprofile":
+        return CProfileProfiler(output_path or "cache/profile.prof", scope)
+    if mode == "sample":
+        return SamplingProfiler(output_path or "cache/profile.folded", scope)
+    raise ValueError(f"Unknown profiling mode '{mode}'")
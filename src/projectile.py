@@ -12,7 +12,7 @@ class Projectile(Entity):
 
         Args:
             position (list): The initial position [x, y] of the power-up.
-            velocity (int): The velocity of the projectile.
+            velocity (list): The velocity [x, y] of the projectile in pixels per second.
             image_list (list): A list of the projectile images.
             shooter (str): The name of the shooter object (player, enemy).
         """
@@ -20,13 +20,15 @@ class Projectile(Entity):
         self.velocity = velocity
         self.shooter = shooter
 
-    def update(self):
+    def update(self, dt):
         """
         Update the projectile.
-        :return:
+
+        Args:
+            dt (float): The duration of the simulation step in seconds.
         """
-        self.position[0] += self.velocity[0]
-        self.position[1] += self.velocity[1]
+        self.position[0] += self.velocity[0] * dt
+        self.position[1] += self.velocity[1] * dt
 
         # If the projectile goes out of the screen, remove it and give player a shot back when he was the shooter.
         if not self.game.screen.get_rect().colliderect(self.rect):
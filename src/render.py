@@ -0,0 +1,109 @@
+import weakref
+import pygame
+from src.timestep import interpolate_position
+
+
+class RenderQueue:
+    """
+    Collects the blits of a frame per layer and submits each layer with a single Surface.blits call, which avoids the
+    overhead of one Python to C call per sprite.
+    """
+    # Layers in drawing order (later layers are drawn on top).
+    LAYERS = ("background", "sprites", "hud")
+
+    def __init__(self, layers=LAYERS, scale=1, flip_at_draw=False):
+        """
+        Initializes an empty render queue.
+
+        Args:
+            layers (tuple): The names of the layers.
+            scale (float): Scale from world coordinates to the surface the sprite groups are drawn on (the internal
+                render resolution).
+            flip_at_draw (bool): Whether the target mirrors sprites while drawing (items of sprites are queued as
+                (surface, destination, None, flip_x)). Otherwise mirrored copies of the images are queued.
+        """
+        self.layers = {layer: [] for layer in layers}
+        self.scale = scale
+        self.flip_at_draw = flip_at_draw
+        # Mirrored copies of images (released together with the image).
+        self.mirrored_images = weakref.WeakKeyDictionary()
+
+    def add(self, layer, surface, destination, area=None):
+        """
+        Queues a surface.
+
+        Args:
+            layer (str): The layer the surface is drawn on.
+            surface (pygame.Surface): The surface to be drawn.
+            destination (tuple | pygame.Rect): The position of the surface.
+            area (pygame.Rect): The part of the surface to be drawn (None for the whole surface).
+        """
+        self.layers[layer].append((surface, destination) if area is None else (surface, destination, area))
+
+    def add_group(self, layer, group, alpha=1.0):
+        """
+        Queues all sprites of a sprite group (like Group.draw, but without drawing immediately).
+
+        Args:
+            layer (str): The layer the sprites are drawn on.
+            group (pygame.sprite.Group): The sprite group. The sprites need a flip_x attribute (see Entity).
+            alpha (float): The fraction of the simulation step between the previous and the current position of the
+                sprites (1 draws them at their current position, otherwise they need a previous_topleft).
+        """
+        if self.flip_at_draw:
+            self.layers[layer].extend(
+                (sprite.image, self.get_position(sprite, alpha), None, sprite.flip_x) for sprite in group)
+        else:
+            self.layers[layer].extend(
+                (self.mirror(sprite.image) if sprite.flip_x else sprite.image, self.get_position(sprite, alpha))
+                for sprite in group)
+
+    def get_position(self, sprite, alpha):
+        """
+        Gets the position a sprite is drawn at.
+
+        Args:
+            sprite (pygame.sprite.Sprite): The sprite.
+            alpha (float): The fraction of the simulation step between the previous and the current position.
+
+        Returns:
+            The interpolated position on the surface the sprite is drawn on.
+        """
+        if alpha == 1.0 and self.scale == 1:
+            return sprite.rect
+        position = interpolate_position(sprite.previous_topleft, sprite.rect.topleft, alpha)
+        if self.scale == 1:
+            return position
+        # Convert the world position to the position on the smaller surface.
+        return position[0] * self.scale, position[1] * self.scale
+
+    def mirror(self, image):
+        """
+        Gets a horizontally mirrored copy of an image, which is created only once.
+
+        Args:
+            image (pygame.Surface): The image.
+
+        Returns:
+            The mirrored image.
+        """
+        mirrored_image = self.mirrored_images.get(image)
+        if mirrored_image is None:
+            mirrored_image = self.mirrored_images[image] = pygame.transform.flip(image, True, False)
+            # The copy keeps the colorkey, but not its run-length encoding.
+            if image.get_colorkey():
+                mirrored_image.set_colorkey(image.get_colorkey(), pygame.RLEACCEL)
+        return mirrored_image
+
+    def flush(self, target, layer):
+        """
+        Draws all queued surfaces of a layer with one call and empties the layer.
+
+        Args:
+            target (pygame.Surface): The surface to draw on.
+            layer (str): The layer.
+        """
+        blit_sequence = self.layers[layer]
+        if blit_sequence:
+            target.blits(blit_sequence, doreturn=False)
+            blit_sequence.clear()
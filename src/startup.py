@@ -0,0 +1,64 @@
+import os
+import time
+
+
+class StartupReport:
+    """
+    Records the duration of the startup phases of the game from process start to the first rendered frame.
+    """
+
+    def __init__(self, enabled=False):
+        """
+        Initializes the startup report. The first phase covers everything since the start of the process
+        (interpreter startup and imports) if the process start time can be determined on this platform.
+
+        Args:
+            enabled (bool): Whether the report is printed after the first frame.
+        """
+        self.enabled = enabled
+        self.phases = []
+        self.last_mark = time.perf_counter()
+        self.process_age = self.get_process_age()
+
+    @staticmethod
+    def get_process_age():
+        """
+        Gets the time since the start of the current process.
+
+        Returns:
+            The age of the process in seconds or None if it cannot be determined on this platform.
+        """
+        try:
+            with open("/proc/self/stat", "r") as file:
+                # The start time is the 22nd field (the process name in the 2nd field may contain spaces).
+                start_ticks = int(file.read().rsplit(")", 1)[1].split()[19])
+            with open("/proc/uptime", "r") as file:
+                uptime = float(file.read().split()[0])
+            return uptime - start_ticks / os.sysconf("SC_CLK_TCK")
+        except (OSError, ValueError, IndexError, AttributeError):
+            return None
+
+    def mark(self, phase):
+        """
+        Ends the current phase.
+
+        Args:
+            phase (str): The name of the phase that has just been completed.
+        """
+        now = time.perf_counter()
+        self.phases.append((phase, now - self.last_mark))
+        self.last_mark = now
+
+    def print_report(self):
+        """
+        Prints the duration of all phases (only if the report is enabled).
+        """
+        if not self.enabled:
+            return
+        phases = list(self.phases)
+        if self.process_age is not None:
+            phases.insert(0, ("process start until report creation", self.process_age))
+        print("Startup report:")
+        for phase, duration in phases:
+            print(f"  {phase:<40} {duration * 1000:9.2f} ms")
+        print(f"  {'total':<40} {sum(duration for _, duration in phases) * 1000:9.2f} ms")
@@ -0,0 +1,39 @@
+class Table:
+    """
+    Lightweight table model with named columns, used instead of a pandas DataFrame for small tables.
+    """
+
+    def __init__(self, data):
+        """
+        Initializes a table from columns.
+
+        Args:
+            data (dict): Maps column names to lists of values (all lists must have the same length).
+        """
+        self.columns = list(data.keys())
+        self.rows = [list(row) for row in zip(*data.values())]
+
+    @property
+    def shape(self):
+        """
+        Gets the number of rows and columns.
+        """
+        return len(self.rows), len(self.columns)
+
+    @property
+    def empty(self):
+        """
+        Checks whether the table has no rows.
+        """
+        return not self.rows
+
+    def to_dataframe(self):
+        """
+        Converts the table into a pandas DataFrame for further analysis. pandas is only imported here, so that it
+        is not loaded during the start of the game.
+
+        Returns:
+            A pandas DataFrame with the same columns and rows.
+        """
+        import pandas as pd
+        return pd.DataFrame(self.rows, columns=self.columns)
@@ -0,0 +1,73 @@
+class FixedTimestep:
+    """
+    Accumulator for a fixed-timestep simulation. The real time of every rendered frame is added to the accumulator,
+    which is then consumed in steps of constant length, so the simulation runs at the same rate on every machine,
+    independent of the rate at which frames are rendered. The remaining fraction of a step is used to interpolate
+    between the last two simulation states while rendering.
+    """
+
+    def __init__(self, tick_rate, max_updates_per_frame=5):
+        """
+        Initializes the timestep with an empty accumulator.
+
+        Args:
+            tick_rate (int): Number of simulation steps per second.
+            max_updates_per_frame (int): Maximum number of steps run before a frame is rendered. If the simulation
+                falls further behind (e.g. after a long hitch), the remaining time is dropped, so that catching up
+                cannot slow down the game even further.
+        """
+        self.step = 1 / tick_rate
+        self.max_updates_per_frame = max_updates_per_frame
+        self.accumulator = 0.0
+
+    def reset(self):
+        """
+        Empties the accumulator (e.g. when the game is resumed).
+        """
+        self.accumulator = 0.0
+
+    def advance(self, elapsed):
+        """
+        Adds the real time of a frame to the accumulator and consumes it in whole simulation steps.
+
+        Args:
+            elapsed (float): The real time since the previous frame in seconds.
+
+        Returns:
+            The number of simulation steps to run before the next frame is rendered.
+        """
+        self.accumulator += elapsed
+        updates = min(int(self.accumulator / self.step), self.max_updates_per_frame)
+        self.accumulator -= updates * self.step
+        # Drop the time that cannot be caught up.
+        if self.accumulator >= self.step:
+            self.accumulator %= self.step
+        return updates
+
+    @property
+    def alpha(self):
+        """
+        The fraction of a simulation step that has passed since the last step (between 0 and 1).
+        """
+        return self.accumulator / self.step
+
+
+def interpolate_position(previous, current, alpha, max_distance=100):
+    """
+    Interpolates a position between two simulation states.
+
+    Args:
+        previous (tuple): The position (x, y) in the previous simulation state.
+        current (tuple): The position (x, y) in the current simulation state.
+        alpha (float): The fraction of the step between both states.
+        max_distance (float): Objects moving further than this within one step have been placed at a new position
+            (e.g. reset) and are drawn at their current position.
+
+    Returns:
+        The interpolated position (x, y).
+    """
+    delta_x = current[0] - previous[0]
+    delta_y = current[1] - previous[1]
+    if abs(delta_x) > max_distance or abs(delta_y) > max_distance:
+        return current
+    return previous[0] + delta_x * alpha, previous[1] + delta_y * alpha
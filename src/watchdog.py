@@ -0,0 +1,157 @@
+import gc
+import logging
+import os
+import queue
+import sys
+import threading
+import time
+import traceback
+from logging.handlers import RotatingFileHandler
+
+
+class HitchDetector:
+    """
+    Watchdog that flags frames exceeding a time budget.
+
+    A helper thread watches the running frame. As soon as the frame exceeds the budget, it takes a snapshot of the
+    main thread's stack, so the log shows what the game was doing during the hitch and not after it. When the frame
+    ends, the hitch is handed to the helper thread, which writes it to a rotating log file. The main thread only
+    measures time and never does any file I/O.
+    """
+
+    def __init__(self, enabled=True, budget_ms=50, log_path="cache/hitches.log", max_bytes=1000000,
+                 backup_count=3):
+        """
+        Initializes the hitch detector. Frames are only watched after it has been started.
+
+        Args:
+            enabled (bool): Whether frames are watched at all.
+            budget_ms (float): Frames taking longer than this (in milliseconds) are logged as hitches.
+            log_path (str): The log file.
+            max_bytes (int): Size of the log file at which it is rotated.
+            backup_count (int): Number of rotated log files kept.
+        """
+        self.enabled = enabled
+        self.budget = budget_ms / 1000
+        self.log_path = log_path
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self.frame_number = 0
+        self.frame_start = None
+        self.gc_time = 0.0
+        self.gc_start = 0.0
+        # Stack snapshot taken by the helper thread as (frame number, elapsed seconds, formatted stack).
+        self.snapshot = None
+        self.hitches = queue.SimpleQueue()
+        self.stop_event = threading.Event()
+        self.main_thread_id = None
+        self.helper_thread = None
+        self.logger = logging.getLogger("hitches")
+        self.handler = None
+
+    def start(self):
+        """
+        Starts watching the frames of the calling thread (only if the hitch detector is enabled).
+        """
+        if not self.enabled or self.helper_thread:
+            return
+
+        # Log hitches to their own rotating file only.
+        os.makedirs(os.path.dirname(self.log_path) or ".", exist_ok=True)
+        self.logger.setLevel(logging.WARNING)
+        self.logger.propagate = False
+        self.handler = RotatingFileHandler(self.log_path, maxBytes=self.max_bytes, backupCount=self.backup_count)
+        self.handler.setFormatter(logging.Formatter("%(asctime)s %(message)s"))
+        self.logger.addHandler(self.handler)
+
+        # Measure time spent in garbage collection, as it is a common cause of hitches.
+        gc.callbacks.append(self.track_gc)
+        self.main_thread_id = threading.get_ident()
+        self.stop_event.clear()
+        self.helper_thread = threading.Thread(target=self.watch, name="hitch-detector", daemon=True)
+        self.helper_thread.start()
+
+    def track_gc(self, phase, info):
+        """
+        Adds the duration of a garbage collection to the current frame (called by the gc module).
+
+        Args:
+            phase (str): "start" or "stop".
+            info (dict): Information about the collection (unused).
+        """
+        if phase == "start":
+            self.gc_start = time.perf_counter()
+        elif threading.get_ident() == self.main_thread_id:
+            self.gc_time += time.perf_counter() - self.gc_start
+
+    def begin_frame(self):
+        """
+        Starts watching a new frame.
+        """
+        if not self.helper_thread:
+            return
+        self.frame_number += 1
+        self.gc_time = 0.0
+        self.frame_start = time.perf_counter()
+
+    def end_frame(self, game_state, count_entities):
+        """
+        Ends the current frame and queues it for logging if it exceeded the budget.
+
+        Args:
+            game_state (GameState): The current state of the game.
+            count_entities (callable): Returns the number of entities per sprite group (only called for hitches).
+        """
+        if self.frame_start is None:
+            return
+        duration = time.perf_counter() - self.frame_start
+        self.frame_start = None
+        if duration <= self.budget:
+            return
+        snapshot = self.snapshot if self.snapshot and self.snapshot[0] == self.frame_number else None
+        self.hitches.put((self.frame_number, duration, self.gc_time, game_state.name, count_entities(), snapshot))
+
+    def watch(self):
+        """
+        Takes stack snapshots of frames exceeding the budget and writes queued hitches (runs in the helper thread).
+        """
+        while not self.stop_event.wait(self.budget / 2):
+            frame_start, frame_number = self.frame_start, self.frame_number
+            if frame_start is not None and (not self.snapshot or self.snapshot[0] != frame_number):
+                elapsed = time.perf_counter() - frame_start
+                if elapsed > self.budget:
+                    frame = sys._current_frames().get(self.main_thread_id)
+                    if frame is not None:
+                        self.snapshot = (frame_number, elapsed, "".join(traceback.format_stack(frame)))
+                    del frame
+            self.write_hitches()
+
+    def write_hitches(self):
+        """
+        Writes all queued hitches to the log file.
+        """
+        while not self.hitches.empty():
+            frame_number, duration, gc_time, game_state, entity_counts, snapshot = self.hitches.get()
+            counts = ", ".join(f"{name}={count}" for name, count in entity_counts.items())
+            message = (f"Hitch in frame {frame_number}: {duration * 1000:.1f} ms "
+                       f"(budget {self.budget * 1000:.0f} ms, gc {gc_time * 1000:.1f} ms), "
+                       f"state {game_state}, entities: {counts}\n")
+            if snapshot:
+                message += f"Main thread stack after {snapshot[1] * 1000:.1f} ms:\n{snapshot[2]}"
+            else:
+                message += "No stack snapshot (the frame ended before the watchdog noticed it).\n"
+            self.logger.warning(message)
+
+    def stop(self):
+        """
+        Stops the helper thread and writes the remaining hitches.
+        """
+        if not self.helper_thread:
+            return
+        self.stop_event.set()
+        self.helper_thread.join()
+        self.helper_thread = None
+        gc.callbacks.remove(self.track_gc)
+        self.write_hitches()
+        self.logger.removeHandler(self.handler)
+        self.handler.close()
@@ -18,6 +18,11 @@ def shared_assets():
     assets.load_assets()  # Ensure assets are loaded
     return assets  # This will be reused in all tests
 
+@pytest.fixture
+def dt(shared_assets):
+    """Returns the duration of a simulation step (in seconds) at the configured simulation rate."""
+    return 1 / shared_assets.config["fps"]
+
 @pytest.fixture
 def mock_player():
     """Creates a mock player object with necessary attributes."""
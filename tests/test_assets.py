@@ -54,3 +54,101 @@ def test_scaled_image(assets_instance, monkeypatch):
     initial_image_size = assets_instance.background_image.get_size()
     scaled_image = pygame.transform.scale_by(assets_instance.background_image, 2)  # Scale background image as example
     assert scaled_image.get_size() == tuple(x * 2 for x in initial_image_size) # Scaled image should be twice as big
+
+@pytest.fixture
+def mock_cache(assets_instance):
+    """Replaces the asset cache with a mock for the duration of a test."""
+    with mock.patch.object(assets_instance, "cache", mock.Mock(), create=True) as cache:
+        yield cache
+
+def fake_decode_images(file, transforms):
+    """Creates placeholder images instead of decoding files (the size is taken from the transform)."""
+    return [(pygame.Surface(transform[1] if transform else (1, 1)), "opaque") for transform in transforms]
+
+@pytest.mark.parametrize("threads", [1, 4])
+def test_load_images(assets_instance, mock_cache, threads):
+    """Tests if images of a manifest are assigned to single attributes and lists (serial and parallel)."""
+    assets_instance.load_config()
+    assets_instance.config["asset_loader_threads"] = threads
+    with mock.patch.object(assets_instance, "decode_images", side_effect=fake_decode_images):
+        assets_instance.load_images({"single_image": ("single.png", None),
+                                     "animation_images": [("frame1.png", ("size", (2, 2))),
+                                                          ("frame2.png", ("size", (3, 3)))]})
+
+    assert assets_instance.single_image.get_size() == (1, 1)
+    assert [image.get_size() for image in assets_instance.animation_images] == [(2, 2), (3, 3)]
+    mock_cache.release.assert_called_once()
+
+def test_load_images_deduplicates_jobs(assets_instance, mock_cache):
+    """Tests if every file is decoded once and identical (file, transform) pairs share one surface."""
+    assets_instance.load_config()
+    with mock.patch.object(assets_instance, "decode_images", side_effect=fake_decode_images) as mock_decode:
+        assets_instance.load_images({"first_image": ("shared.png", ("size", (2, 2))),
+                                     "second_image": ("shared.png", ("size", (2, 2))),
+                                     "third_image": [("shared.png", ("size", (4, 4)))]})
+
+    mock_decode.assert_called_once_with("shared.png", [("size", (2, 2)), ("size", (4, 4))])
+    assert assets_instance.first_image is assets_instance.second_image
+    assert assets_instance.third_image[0].get_size() == (4, 4)
+
+def test_surface_formats():
+    """Tests if images are converted to the cheapest surface format that keeps their transparency."""
+    image = pygame.Surface((3, 1), pygame.SRCALPHA)
+    image.fill((255, 0, 255, 255))
+    assert Assets.get_surface_format(image) == "opaque"
+    assert not Assets.convert_image(image, "opaque").get_flags() & pygame.SRCALPHA
+
+    # The first colorkey candidate is used by an opaque pixel, so the next one is chosen.
+    image.fill((0, 0, 0, 0), (1, 0, 1, 1))
+    assert Assets.get_surface_format(image) == "colorkey"
+    converted_image = Assets.convert_image(image, "colorkey")
+    assert converted_image.get_colorkey()[:3] == Assets.COLORKEYS[1]
+    assert converted_image.get_flags() & pygame.RLEACCELOK  # Encoded on the first blit
+    assert converted_image.get_at((0, 0))[:3] == (255, 0, 255)
+
+    image.fill((0, 0, 0, 128), (2, 0, 1, 1))
+    assert Assets.get_surface_format(image) == "alpha"
+    assert Assets.convert_image(image, "alpha").get_flags() & pygame.SRCALPHA
+
+def test_load_manifest(assets_instance):
+    """Tests if the asset manifest is translated into jobs and split into startup and lazy images."""
+    assets_instance.load_config()
+    startup_images, lazy_images = assets_instance.load_manifest()
+
+    assert startup_images["background_image"] == ("background.png", None)
+    assert startup_images["player_walk"][5] == ("player/walk/walk6.png", ("scale_by", 4))
+    assert startup_images["car_images"] == [("obstacles/car.png", ("scale_by", 1.5))]
+    assert startup_images["freeze_powerup"] == [("power_ups/freeze.png", ("size", (56, 56)))]
+    assert "shop_icon" in lazy_images and "shop_icon" not in startup_images
+
+def test_load_manifest_scales_playfield(assets_instance):
+    """Tests if playfield images are scaled to the internal resolution, while other images keep their size."""
+    assets_instance.load_config()
+    with mock.patch.dict(assets_instance.config["internal_resolution"], {"scale": 0.5}):
+        startup_images, _ = assets_instance.load_manifest()
+
+    assert startup_images["background_image"] == ("background.png", None)
+    assert startup_images["player_walk"][5] == ("player/walk/walk6.png", ("scale_by", 2))
+    assert startup_images["freeze_powerup"] == [("power_ups/freeze.png", ("size", (28, 28)))]
+
+def test_upload_textures(shared_assets):
+    """Tests if all startup images are uploaded to textures."""
+    backend = mock.Mock()
+    shared_assets.upload_textures(backend)
+    uploaded = [call.args[0] for call in backend.get_texture.call_args_list]
+    assert any(image is shared_assets.background_image for image in uploaded)
+    assert all(any(image is frame for image in uploaded) for frame in shared_assets.player_walk)
+
+def test_lazy_image_loaded_on_first_access(assets_instance, mock_cache):
+    """Tests if an image of the lazy tier is loaded when it is accessed the first time."""
+    assets_instance.load_config()
+    lazy_images = {"lazy_test_image": ("lazy.png", ("size", (5, 5)))}
+    with mock.patch.object(assets_instance, "lazy_images", lazy_images, create=True), \
+            mock.patch.object(assets_instance, "decode_images", side_effect=fake_decode_images) as mock_decode:
+        assert assets_instance.lazy_test_image.get_size() == (5, 5)
+        assert assets_instance.lazy_test_image.get_size() == (5, 5)
+        with pytest.raises(AttributeError):
+            assets_instance.unknown_test_image
+
+    mock_decode.assert_called_once()
+    del assets_instance.lazy_test_image
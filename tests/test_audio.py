@@ -0,0 +1,103 @@
+import os
+import pytest
+from unittest import mock
+from src.audio import MusicPlayer, SilentSound, SoundEffects, configure_mixer
+
+
+@pytest.fixture
+def mock_mixer_music():
+    """Replaces the pygame music stream with a mock."""
+    with mock.patch("pygame.mixer.music") as mixer_music:
+        yield mixer_music
+
+@pytest.fixture
+def initialized_mixer():
+    """Reports the mixer as initialized, so that the tests do not depend on an audio device."""
+    with mock.patch("pygame.mixer.get_init", return_value=(44100, -16, 2)):
+        yield
+
+def test_single_track_is_looped(mock_mixer_music, initialized_mixer):
+    """Tests if a playlist with a single track streams and loops it."""
+    music_player = MusicPlayer("assets/audio/", ["music.mp3"], 2000)
+    music_player.set_volume(0.4)
+    music_player.play()
+
+    mock_mixer_music.load.assert_called_once_with("assets/audio/music.mp3")
+    mock_mixer_music.set_volume.assert_called_with(0.4)
+    mock_mixer_music.play.assert_called_once_with(-1)
+
+def test_playlist_advances_with_fade(mock_mixer_music, initialized_mixer):
+    """Tests if the next track of a playlist is faded in after the current one has ended."""
+    music_player = MusicPlayer("audio", ["first.mp3", "second.mp3"], 1500)
+    music_player.play()
+    mock_mixer_music.set_endevent.assert_called_once_with(MusicPlayer.END_EVENT)
+
+    music_player.handle_end_event()
+    music_player.handle_end_event()
+    assert music_player.current_track == 0, "Playlist should wrap around!"
+    assert mock_mixer_music.load.call_args_list[-2] == mock.call(os.path.join("audio", "second.mp3"))
+    mock_mixer_music.play.assert_called_with(fade_ms=1500)
+
+def test_volume_before_playing(mock_mixer_music):
+    """Tests if the volume can be set and read before any track is loaded."""
+    music_player = MusicPlayer("assets/audio/", ["music.mp3"], 2000)
+    music_player.set_volume(0.25)
+
+    assert music_player.get_volume() == 0.25
+    mock_mixer_music.load.assert_not_called()
+
+def test_sound_effects_reserve_channel_pools(initialized_mixer):
+    """Tests if every sound effect gets its own pool of reserved channels."""
+    with mock.patch("pygame.mixer.set_reserved") as mock_set_reserved, \
+            mock.patch("pygame.mixer.Channel", side_effect=lambda channel_id: channel_id):
+        sound_effects = SoundEffects({"jump": mock.Mock(), "shoot": mock.Mock()}, {"jump": 1, "shoot": 3})
+
+    mock_set_reserved.assert_called_once_with(4)
+    assert sound_effects.channel_pools == {"jump": [0], "shoot": [1, 2, 3]}
+
+def test_sound_effects_play_round_robin(initialized_mixer):
+    """Tests if rapid-fire sounds cycle through the channels of their pool."""
+    channels = [mock.Mock(), mock.Mock()]
+    shoot_sound = mock.Mock()
+    with mock.patch("pygame.mixer.set_reserved"), mock.patch("pygame.mixer.Channel", side_effect=channels):
+        sound_effects = SoundEffects({"shoot": shoot_sound}, {"shoot": 2})
+
+    for _ in range(3):
+        sound_effects.play("shoot")
+    assert channels[0].play.call_count == 2
+    assert channels[1].play.call_count == 1
+    channels[0].play.assert_called_with(shoot_sound)
+
+def test_sound_effects_without_pool():
+    """Tests if a sound without reserved channels is played on any free channel."""
+    click_sound = mock.Mock()
+    with mock.patch("pygame.mixer.set_reserved"):
+        sound_effects = SoundEffects({"click": click_sound}, {})
+    sound_effects.play("click")
+    click_sound.play.assert_called_once()
+
+def test_configure_mixer():
+    """Tests if the audio configuration is passed to the mixer before initialization."""
+    with mock.patch("pygame.mixer.pre_init") as mock_pre_init:
+        configure_mixer({"frequency": 44100, "size": -16, "channels": 2, "buffer": 512})
+    mock_pre_init.assert_called_once_with(frequency=44100, size=-16, channels=2, buffer=512)
+
+def test_music_without_mixer(mock_mixer_music):
+    """Tests if the music player does nothing when the mixer is not initialized."""
+    music_player = MusicPlayer("assets/audio/", ["music.mp3"], 2000)
+    with mock.patch("pygame.mixer.get_init", return_value=None):
+        music_player.play()
+        music_player.set_volume(0.5)
+
+    mock_mixer_music.load.assert_not_called()
+    assert music_player.get_volume() == 0.5
+
+def test_sound_effects_without_mixer():
+    """Tests if sound effects fall back to silent sounds without reserving channels when there is no mixer."""
+    with mock.patch("pygame.mixer.get_init", return_value=None), \
+            mock.patch("pygame.mixer.set_reserved") as mock_set_reserved:
+        sound_effects = SoundEffects({"jump": SilentSound()}, {"jump": 1})
+        sound_effects.play("jump")
+
+    mock_set_reserved.assert_not_called()
+    assert sound_effects.channel_pools == {}
@@ -0,0 +1,49 @@
+import pytest
+import pygame
+from unittest import mock
+from src.backend import SoftwareBackend, TextureBackend, create_backend
+
+
+@pytest.fixture
+def texture_backend():
+    """Creates a texture backend with the software renderer of SDL and restores the display afterwards."""
+    backend = TextureBackend((20, 10), "test", accelerated=False)
+    yield backend
+    backend.window.destroy()
+    pygame.display.set_mode((800, 600))
+
+def test_texture_backend_draws_frame(texture_backend):
+    """Tests if surfaces are drawn as textures, mirrored with the flip flag and stretched to world size."""
+    image = pygame.Surface((2, 1))
+    image.fill("red")
+    image.fill("green", (1, 0, 1, 1))
+    target = texture_backend.get_target()
+    target.blits([(image, (0, 0)), (image, (0, 2), None, True), (image, (4, 0), pygame.Rect(1, 0, 1, 1))],
+                 doreturn=False)
+    texture_backend.get_target(0.5).blit(image, (10, 0))
+    texture_backend.present()
+    texture_backend.capture_frame()
+
+    screen = texture_backend.screen
+    assert screen.get_at((0, 0)) == pygame.Color("red")
+    assert screen.get_at((0, 2)) == pygame.Color("green")
+    assert screen.get_at((4, 0)) == pygame.Color("green")
+    assert screen.get_at((5, 0)) == pygame.Color("black")
+    assert screen.get_at((11, 1)) == pygame.Color("red")
+    assert screen.get_at((12, 1)) == pygame.Color("green")
+    # Every surface is uploaded only once.
+    assert len(texture_backend.textures) == 1
+
+def test_create_backend_falls_back_to_software():
+    """Tests if the software backend is used when no accelerated renderer is available."""
+    with mock.patch("src.backend.TextureBackend", side_effect=pygame.error("no renderer")), \
+            mock.patch("pygame.display.set_mode"):
+        with pytest.warns(UserWarning):
+            backend = create_backend("texture", (800, 600), "test")
+    assert isinstance(backend, SoftwareBackend)
+    assert not backend.uses_textures
+
+def test_unknown_backend():
+    """Tests if an unknown backend is rejected."""
+    with pytest.raises(ValueError):
+        create_backend("vulkan", (800, 600), "test")
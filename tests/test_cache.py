@@ -0,0 +1,75 @@
+import os
+import pytest
+import pygame
+from src.cache import AssetCache
+
+
+@pytest.fixture
+def source_image(tmp_path):
+    """Creates a small source image on disk."""
+    path = str(tmp_path / "source.png")
+    image = pygame.Surface((4, 2), pygame.SRCALPHA)
+    image.fill((10, 20, 30, 255))
+    pygame.image.save(image, path)
+    return path
+
+@pytest.fixture
+def asset_cache(tmp_path):
+    """Creates an AssetCache instance using a temporary directory."""
+    return AssetCache(str(tmp_path / "cache"))
+
+def test_cache_miss(asset_cache, source_image):
+    """Tests if an image that has not been stored yet is not found."""
+    assert asset_cache.load(source_image, "scale_by=2") is None
+
+def test_store_and_load(asset_cache, source_image):
+    """Tests if a stored image is loaded with the same size and pixels."""
+    image = pygame.transform.scale_by(pygame.image.load(source_image), 2)
+    asset_cache.store(source_image, "scale_by=2", image, "opaque")
+    cached_image, surface_format = asset_cache.load(source_image, "scale_by=2")
+
+    assert surface_format == "opaque"
+    assert cached_image.get_size() == (8, 4)
+    assert cached_image.get_at((0, 0)) == pygame.Color(10, 20, 30, 255)
+    assert asset_cache.load(source_image, "scale_by=3") is None, "Transform should be part of the key!"
+
+def test_changed_source_invalidates_entry(asset_cache, source_image):
+    """Tests if changing the source file invalidates and removes the old entry."""
+    asset_cache.store(source_image, "none", pygame.image.load(source_image), "opaque")
+    asset_cache.release()
+
+    changed_image = pygame.Surface((4, 2), pygame.SRCALPHA)
+    changed_image.fill((200, 0, 0, 255))
+    pygame.image.save(changed_image, source_image)
+    assert asset_cache.load(source_image, "none") is None, "Changed source should result in a cache miss!"
+
+    asset_cache.store(source_image, "none", changed_image, "opaque")
+    assert len(os.listdir(asset_cache.cache_folder)) == 1, "Outdated entry should be removed!"
+
+def test_disabled_cache(tmp_path, source_image):
+    """Tests if a disabled cache neither stores nor loads images."""
+    asset_cache = AssetCache(str(tmp_path / "disabled"), enabled=False)
+    asset_cache.store(source_image, "none", pygame.image.load(source_image), "opaque")
+
+    assert asset_cache.load(source_image, "none") is None
+    assert not os.path.exists(asset_cache.cache_folder)
+
+def test_entry_without_surface_format(asset_cache, source_image):
+    """Tests if an entry written without a surface format is treated as a cache miss."""
+    asset_cache.store(source_image, "none", pygame.image.load(source_image), "alpha")
+    entry_path = os.path.join(asset_cache.cache_folder, os.listdir(asset_cache.cache_folder)[0])
+    with open(entry_path, "r+b") as file:
+        file.write(AssetCache.HEADER.pack(AssetCache.MAGIC, 4, 2, 0))
+    assert asset_cache.load(source_image, "none") is None
+    assert not os.path.exists(entry_path), "Invalid entry should be removed!"
+
+@pytest.mark.parametrize("size", [0, AssetCache.HEADER.size - 1, AssetCache.HEADER.size + 5])
+def test_truncated_entry(asset_cache, source_image, size):
+    """Tests if an empty or truncated entry is removed and treated as a cache miss."""
+    asset_cache.store(source_image, "none", pygame.image.load(source_image), "alpha")
+    entry_path = os.path.join(asset_cache.cache_folder, os.listdir(asset_cache.cache_folder)[0])
+    with open(entry_path, "r+b") as file:
+        file.truncate(size)
+
+    assert asset_cache.load(source_image, "none") is None
+    assert not os.path.exists(entry_path), "Truncated entry should be removed!"
@@ -28,3 +28,10 @@ def test_entity_update(entity_instance):
     entity_instance.update()
 
     assert entity_instance.rect.topleft == (300, 400)  # rect should match new position
+
+def test_entity_world_rect(entity_instance):
+    """Tests if the rect keeps the size in world coordinates when the image is scaled to the internal resolution."""
+    entity_instance.render_scale = 0.5
+    entity_instance.image = pygame.Surface((25, 10))
+    entity_instance.update()
+    assert entity_instance.rect == pygame.Rect(100, 200, 50, 20)
@@ -0,0 +1,57 @@
+import os
+import pytest
+import pygame
+from unittest import mock
+from src.fonts import FontRegistry
+
+
+@pytest.fixture
+def font_registry(tmp_path):
+    """Creates a FontRegistry with the bundled fonts and a temporary cache file."""
+    return FontRegistry("assets/fonts", str(tmp_path / "fonts.json"))
+
+def test_bundled_font_preferred(font_registry):
+    """Tests if a bundled font file is used without searching the system fonts."""
+    with mock.patch("pygame.font.match_font") as mock_match_font:
+        path = font_registry.resolve("stacker")
+
+    assert path == os.path.join("assets/fonts", "stacker.ttf")
+    mock_match_font.assert_not_called()
+
+def test_system_font_resolved_once(font_registry):
+    """Tests if a system font is looked up only once for all sizes."""
+    with mock.patch("pygame.font.match_font", return_value=None) as mock_match_font, \
+            pytest.warns(UserWarning):
+        fonts = [font_registry.get_font("unknownfamily", size) for size in (22, 30, 40)]
+
+    mock_match_font.assert_called_once_with("unknownfamily")
+    assert all(isinstance(font, pygame.font.Font) for font in fonts)
+
+def test_resolved_paths_cached_between_launches(font_registry, tmp_path):
+    """Tests if a new registry uses the cached path instead of searching again."""
+    font_path = os.path.join("assets/fonts", "stacker.ttf")
+    with mock.patch("pygame.font.match_font", return_value=font_path):
+        font_registry.resolve("somefamily")
+
+    new_registry = FontRegistry("assets/fonts", str(tmp_path / "fonts.json"))
+    with mock.patch("pygame.font.match_font") as mock_match_font:
+        assert new_registry.resolve("somefamily") == font_path
+    mock_match_font.assert_not_called()
+
+def test_missing_cached_path_resolved_again(font_registry):
+    """Tests if a cached path that does not exist anymore is resolved again."""
+    font_registry.resolved_paths["somefamily"] = "missing/font.ttf"
+    with mock.patch("pygame.font.match_font", return_value=None) as mock_match_font, \
+            pytest.warns(UserWarning):
+        assert font_registry.resolve("somefamily") is None
+    mock_match_font.assert_called_once()
+
+def test_missing_font_not_cached_between_launches(font_registry, tmp_path):
+    """Tests if a font that was not available is searched again on the next launch (e.g. after installing it)."""
+    with mock.patch("pygame.font.match_font", return_value=None), pytest.warns(UserWarning):
+        assert font_registry.resolve("laterfamily") is None
+
+    font_path = os.path.join("assets/fonts", "stacker.ttf")
+    new_registry = FontRegistry("assets/fonts", str(tmp_path / "fonts.json"))
+    with mock.patch("pygame.font.match_font", return_value=font_path):
+        assert new_registry.resolve("laterfamily") == font_path
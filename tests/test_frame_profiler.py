@@ -0,0 +1,72 @@
+import pytest
+import pygame
+from unittest import mock
+from src.frame_profiler import FrameProfiler
+
+
+@pytest.fixture
+def frame_profiler():
+    """Creates a visible FrameProfiler with a small ring buffer."""
+    frame_profiler = FrameProfiler(pygame.font.Font(None, 16), 60, history=4, refresh_interval=2)
+    frame_profiler.toggle()
+    return frame_profiler
+
+def test_sections_are_accumulated(frame_profiler):
+    """Tests if marks add the time since the previous mark to their section, also when marked multiple times."""
+    with mock.patch("time.perf_counter", side_effect=[0.0, 0.001, 0.003, 0.006, 0.010]):
+        frame_profiler.begin_frame()
+        frame_profiler.mark("events")
+        frame_profiler.mark("hud")
+        frame_profiler.mark("hud")
+        frame_profiler.end_frame()
+
+    assert frame_profiler.frame_times[-1] == pytest.approx(10)
+    assert frame_profiler.section_times["events"][-1] == pytest.approx(1)
+    assert frame_profiler.section_times["hud"][-1] == pytest.approx(5)
+    assert frame_profiler.section_times["flip"][-1] == 0
+
+def test_ring_buffer_size(frame_profiler):
+    """Tests if only the configured number of frames is kept."""
+    for _ in range(10):
+        frame_profiler.begin_frame()
+        frame_profiler.end_frame()
+
+    assert len(frame_profiler.frame_times) == 4
+    assert all(len(times) == 4 for times in frame_profiler.section_times.values())
+
+def test_get_statistics():
+    """Tests if minimum, average and 99th percentile are calculated correctly."""
+    assert FrameProfiler.get_statistics(range(1, 101)) == (1, 50.5, 99)
+    assert FrameProfiler.get_statistics([]) == (0.0, 0.0, 0.0)
+
+def test_overlay_is_cached(frame_profiler):
+    """Tests if the overlay surface is only rebuilt after the refresh interval."""
+    with mock.patch.object(frame_profiler, "build_overlay", wraps=frame_profiler.build_overlay) as mock_build:
+        for _ in range(4):
+            frame_profiler.begin_frame()
+            frame_profiler.end_frame()
+            frame_profiler.draw(pygame.Surface((800, 600)))
+
+    assert mock_build.call_count == 2
+
+def test_hidden_profiler_does_not_measure():
+    """Tests if a hidden profiler neither records frames nor draws anything."""
+    frame_profiler = FrameProfiler(pygame.font.Font(None, 16), 60)
+    screen = mock.Mock()
+    frame_profiler.begin_frame()
+    frame_profiler.mark("events")
+    frame_profiler.end_frame()
+    frame_profiler.draw(screen)
+
+    assert len(frame_profiler.frame_times) == 0
+    screen.blit.assert_not_called()
+
+def test_recording_without_overlay():
+    """Tests if a profiler without refresh interval records frame times but never builds an overlay."""
+    frame_profiler = FrameProfiler(pygame.font.Font(None, 16), 60, refresh_interval=None)
+    frame_profiler.toggle()
+    frame_profiler.begin_frame()
+    frame_profiler.end_frame()
+
+    assert len(frame_profiler.frame_times) == 1
+    assert frame_profiler.overlay is None
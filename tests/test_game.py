@@ -6,6 +6,7 @@ from src.enums import GameState, WeaponType, EnemyType, PowerUpType
 from src.player import Player
 from src.projectile import Projectile
 from src.enemy import Enemy
+from src.startup import StartupReport
 
 
 @pytest.fixture
@@ -22,6 +23,48 @@ def test_game_initialization(mock_game):
     assert mock_game.current_state == GameState.MAIN_MENU
     assert isinstance(mock_game.player.sprite, Player)
 
+def test_headless_game_skips_mixer():
+    """Tests if a headless game initializes only display and font and records its startup phases."""
+    startup_report = StartupReport()
+    with mock.patch("pygame.display.set_mode"), mock.patch("pygame.mixer.init") as mock_mixer_init:
+        Game(size=[800, 600], headless=True, startup_report=startup_report)
+
+    mock_mixer_init.assert_not_called()
+    assert [phase for phase, _ in startup_report.phases][:3] == ["pygame initialization", "display", "assets"]
+
+def test_game_without_audio_device():
+    """Tests if the game starts without sound when the mixer cannot be initialized."""
+    with mock.patch("pygame.display.set_mode"), mock.patch.dict("os.environ", {"SDL_VIDEODRIVER": "windows"}), \
+            mock.patch("pygame.mixer.init", side_effect=pygame.error("no audio device")), \
+            pytest.warns(UserWarning, match="without sound"):
+        game = Game(size=[800, 600], headless=False)
+    assert game.current_state == GameState.MAIN_MENU
+
+def test_game_does_not_load_lazy_images(shared_assets):
+    """Tests if creating the game leaves the images of the lazy tier (the shop icons) unloaded."""
+    # Unload the lazy images, since other tests may have loaded them already.
+    _, shared_assets.lazy_images = shared_assets.load_manifest()
+    for name in shared_assets.lazy_images:
+        shared_assets.__dict__.pop(name, None)
+
+    with mock.patch("pygame.display.set_mode"):
+        Game(size=[800, 600])
+    assert all(name not in shared_assets.__dict__ for name in shared_assets.lazy_images)
+    assert {"shop_icon", "heart_icon", "weapon_icon"} <= set(shared_assets.lazy_images)
+
+def test_toggle_frame_profiler(mock_game):
+    """Tests if the frame profiler key shows and hides the overlay."""
+    mock_game.current_state = GameState.PLAYING
+    event = pygame.event.Event(pygame.KEYDOWN, {"key": mock_game.frame_profiler_key})
+    mock_game.handle_states_and_events(event)
+    assert mock_game.frame_profiler.visible
+    mock_game.handle_states_and_events(event)
+    assert not mock_game.frame_profiler.visible
+
+def test_frame_profiler_budget(mock_game):
+    """Tests if the frame profiler measures rendered frames against the budget of the render rate."""
+    assert mock_game.frame_profiler.budget == pytest.approx(1000 / mock_game.render_fps)
+
 def test_game_set_up_run(mock_game):
     """Tests if the game setup initializes correct values."""
     mock_game.set_up_run()
@@ -101,13 +144,13 @@ def test_handle_shop_purchase(mock_game, item_name, item_cost, expected_health,
         assert mock_game.player.sprite.health == expected_health, "Player should receive extra life!"
         assert mock_game.player.sprite.weapon.type == expected_weapon, "Player weapon should be upgraded!"
 
-def test_game_update(mock_game):
+def test_game_update(mock_game, dt):
     """Tests if the game update function calls necessary updates."""
     with mock.patch.object(mock_game.player, "update") as mock_player_update, \
             mock.patch.object(mock_game.obstacles, "update") as mock_obstacles_update, \
             mock.patch.object(mock_game.enemies, "update") as mock_enemies_update, \
             mock.patch.object(mock_game.projectiles, "update") as mock_projectiles_update:
-        mock_game.update()
+        mock_game.update(dt)
 
         mock_player_update.assert_called_once()
         mock_obstacles_update.assert_called_once()
@@ -115,12 +158,101 @@ def test_game_update(mock_game):
         mock_projectiles_update.assert_called_once()
 
 def test_game_render(mock_game):
-    """Tests if the game render function calls necessary blit operations."""
-    with mock.patch.object(mock_game.screen, "blit") as mock_blit, \
+    """Tests if the game render function draws every layer with a single blits call."""
+    with mock.patch.object(mock_game.screen, "blits") as mock_blits, \
             mock.patch("pygame.display.flip") as mock_flip:
         mock_game.render()
-        assert mock_blit.call_count > 0  # Ensure something was drawn
+        assert mock_blits.call_count == 3  # Background, sprites and HUD
         mock_flip.assert_called_once()
+    assert not any(mock_game.render_queue.layers.values())
+
+def test_render_internal_resolution(mock_game):
+    """Tests if the playfield is drawn on a smaller canvas, scaled to the window and overlaid by the HUD."""
+    with mock.patch.object(mock_game.assets, "render_scale", 0.5), \
+            mock.patch("pygame.display.set_mode"), mock.patch("pygame.init"):
+        game = Game(size=[800, 600])
+    assert game.canvas.get_size() == (400, 300)
+    assert game.parallax.layers[0].image.get_height() == game.assets.background_image.get_height() // 2
+
+    with mock.patch.object(game, "canvas") as mock_canvas, \
+            mock.patch.object(game, "present_canvas") as mock_present, \
+            mock.patch("pygame.display.flip"):
+        game.render()
+    assert mock_canvas.blits.call_count == 2  # Background and sprites
+    mock_present.assert_called_once_with(mock_canvas, (800, 600), game.screen)
+    assert game.screen.blits.call_count == 1  # HUD
+    # Power up icons are shown in full resolution on the HUD.
+    icon = game.assets.freeze_powerup_inactive[0]
+    assert game.get_hud_image(icon).get_width() == icon.get_width() * 2
+
+def test_render_hud_text(mock_game):
+    """Tests if HUD texts are only rendered again when they change, unless the HUD refresh rate is reduced."""
+    font = mock.Mock()
+    first = mock_game.render_hud_text("score", font, "Score: 1", "green")
+    assert mock_game.render_hud_text("score", font, "Score: 1", "green") is first
+    assert font.render.call_count == 1
+    mock_game.render_hud_text("score", font, "Score: 2", "green")
+    assert font.render.call_count == 2
+
+    with mock.patch.object(mock_game.frame_governor, "refresh_hud", return_value=False):
+        mock_game.render_hud_text("score", font, "Score: 3", "green")
+    assert font.render.call_count == 2
+
+def test_render_static_background(mock_game):
+    """Tests if the background is drawn with a single blit when the governor has made it static."""
+    mock_game.frame_governor.level = mock_game.frame_governor.degradation_order.index("static_background") + 1
+    with mock.patch.object(mock_game.render_queue, "flush"):
+        mock_game.render()
+    assert mock_game.render_queue.layers["background"] == [(mock_game.assets.background_image, (0, 0))]
+
+def test_render_parallax_layers(mock_game):
+    """Tests if every parallax layer is drawn with a single blit of its strip."""
+    with mock.patch.object(mock_game.render_queue, "flush"):
+        mock_game.render()
+    assert mock_game.render_queue.layers["background"] == [
+        (layer.strip, (0, layer.y), layer.get_area()) for layer in mock_game.parallax.layers]
+
+def test_update_stores_previous_positions(mock_game, dt):
+    """Tests if an update keeps the positions of the previous step for interpolation."""
+    player = mock_game.player.sprite
+    player.rect.topleft = (100, 200)
+    layer = mock_game.parallax.layers[0]
+    layer.offset = 30
+    with mock.patch.object(player, "update"):
+        mock_game.update(dt)
+    assert player.previous_topleft == (100, 200)
+    assert layer.previous_offset == 30
+    assert layer.offset == pytest.approx(30 + mock_game.scrolling_bg_speed * layer.scroll_factor * dt)
+
+@pytest.mark.parametrize("rate", [30, 144, 240])
+def test_update_independent_of_rate(mock_game, rate):
+    """Tests if the distance and the background scroll by the same amount per second at different simulation rates."""
+    with mock.patch.object(mock_game.player.sprite, "update"):
+        for _ in range(rate):
+            mock_game.update(1 / rate)
+    assert mock_game.distance == pytest.approx(mock_game.assets.config["score_per_second"], abs=1)
+    layer = mock_game.parallax.layers[0]
+    assert layer.offset == pytest.approx(mock_game.scrolling_bg_speed * layer.scroll_factor % layer.tile_width)
+
+def test_run_simulation_steps_stops_after_game_over(mock_game):
+    """Tests if the remaining simulation steps of a frame are dropped once a step ends the run."""
+    mock_game.current_state = GameState.PLAYING
+    mock_game.timestep.reset()
+
+    def end_run(dt):
+        mock_game.current_state = GameState.GAME_OVER
+
+    with mock.patch.object(mock_game, "update", side_effect=end_run) as mock_update:
+        mock_game.run_simulation_steps(mock_game.timestep.step * 3)
+    mock_update.assert_called_once_with(mock_game.timestep.step)
+
+def test_run_simulation_steps_while_playing(mock_game):
+    """Tests if all due simulation steps run while the game is playing."""
+    mock_game.current_state = GameState.PLAYING
+    mock_game.timestep.reset()
+    with mock.patch.object(mock_game, "update") as mock_update:
+        mock_game.run_simulation_steps(mock_game.timestep.step * 3.5)
+    assert mock_update.call_count == 3
 
 def test_restart_game(mock_game):
     """Tests if restart_game resets game objects and timers."""
@@ -251,6 +383,14 @@ def test_end_game(mock_game):
         mock_quit.assert_called_once()
         mock_exit.assert_called_once()
 
+@pytest.mark.parametrize("degraded", [False, True])
+def test_end_game_governor_report(mock_game, capsys, degraded):
+    """Tests if the frame governor report is only printed when the governor has degraded frames."""
+    with mock.patch("pygame.quit"), mock.patch("sys.exit"), \
+            mock.patch.object(mock_game.frame_governor, "has_degraded", return_value=degraded):
+        mock_game.end_game()
+    assert ("Frame governor" in capsys.readouterr().out) == degraded
+
 def test_reset_timers(mock_game):
     """Tests if `reset_timers` correctly sets the timers."""
     with mock.patch("pygame.time.set_timer") as mock_set_timer:
@@ -279,10 +419,10 @@ def test_update_and_save_run_data(mock_game):
 ])
 def test_display_power_ups(mock_game, power_up_type, expected_active):
     """Tests if the correct power-up icon is rendered based on its active state."""
-    with mock.patch.object(mock_game.screen, "blit") as mock_blit:
-        is_active = expected_active(mock_game)
-        mock_game.display_power_ups()
-        if is_active:
-            assert mock_blit.call_count > 0, f"Active power-up {power_up_type} should be rendered."
-        else:
-            assert mock_blit.call_count > 0, f"Inactive power-up {power_up_type} should still be rendered in grey."
\ No newline at end of file
+    is_active = expected_active(mock_game)
+    mock_game.display_power_ups()
+    hud = mock_game.render_queue.layers["hud"]
+    if is_active:
+        assert len(hud) > 0, f"Active power-up {power_up_type} should be rendered."
+    else:
+        assert len(hud) > 0, f"Inactive power-up {power_up_type} should still be rendered in grey."
\ No newline at end of file
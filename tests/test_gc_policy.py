@@ -0,0 +1,56 @@
+import gc
+import pytest
+from unittest import mock
+from src.enums import GameState
+from src.gc_policy import GCPolicy
+
+
+@pytest.fixture(autouse=True)
+def restore_gc():
+    """Restores the state of the garbage collector after each test."""
+    thresholds = gc.get_threshold()
+    yield
+    gc.set_threshold(*thresholds)
+    gc.enable()
+
+def test_thresholds_raised_while_playing():
+    """Tests if the thresholds are raised while playing and restored with a collection afterwards."""
+    gc_policy = GCPolicy(playing_mode="thresholds", playing_thresholds=[10000, 20, 30])
+    default_thresholds = gc.get_threshold()
+
+    gc_policy.update(GameState.PLAYING)
+    assert gc.get_threshold() == (10000, 20, 30)
+
+    with mock.patch("gc.collect") as mock_collect:
+        gc_policy.update(GameState.PAUSED)
+        gc_policy.update(GameState.MAIN_MENU)
+    assert gc.get_threshold() == default_thresholds
+    mock_collect.assert_called_once_with()
+
+def test_collection_disabled_while_playing():
+    """Tests if automatic collection is disabled while playing and re-enabled on a transition."""
+    gc_policy = GCPolicy(playing_mode="disable")
+
+    gc_policy.update(GameState.PLAYING)
+    assert not gc.isenabled()
+
+    gc_policy.update(GameState.GAME_OVER)
+    assert gc.isenabled()
+
+def test_pending_allocations_are_limited():
+    """Tests if the youngest generation is collected when too many allocations are pending with gc disabled."""
+    gc_policy = GCPolicy(playing_mode="disable", max_pending_allocations=100)
+    gc_policy.update(GameState.PLAYING)
+
+    with mock.patch("gc.get_count", return_value=(101, 0, 0)), mock.patch("gc.collect") as mock_collect:
+        gc_policy.update(GameState.PLAYING)
+    mock_collect.assert_called_once_with(0)
+
+def test_finish_startup_freezes_objects():
+    """Tests if objects existing after startup are frozen."""
+    with mock.patch("gc.collect"), mock.patch("gc.freeze") as mock_freeze:
+        GCPolicy().finish_startup()
+        GCPolicy(freeze_after_startup=False).finish_startup()
+        GCPolicy(enabled=False).finish_startup()
+
+    mock_freeze.assert_called_once()
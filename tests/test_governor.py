@@ -0,0 +1,68 @@
+import pytest
+from unittest import mock
+from src.governor import FrameGovernor
+
+
+def render_frames(frame_governor, count, render_time):
+    """Simulates rendered frames that take the given time (in seconds)."""
+    for _ in range(count):
+        with mock.patch("time.perf_counter", side_effect=[0.0, render_time]):
+            frame_governor.begin_render()
+            frame_governor.end_render()
+
+def test_degrades_in_order_and_recovers():
+    """Tests if steps are activated in the configured order while over budget and deactivated when below it."""
+    frame_governor = FrameGovernor(budget_ms=8, degradation_order=["static_background", "hud_refresh"], window=3)
+    render_frames(frame_governor, 2, 0.010)
+    assert frame_governor.level == 0  # The window is not complete yet
+    render_frames(frame_governor, 1, 0.010)
+    assert frame_governor.is_active("static_background") and not frame_governor.is_active("hud_refresh")
+    render_frames(frame_governor, 6, 0.010)
+    assert frame_governor.level == 2
+    render_frames(frame_governor, 3, 0.006)  # Below budget, but above the recover ratio
+    assert frame_governor.level == 2
+    render_frames(frame_governor, 3, 0.002)
+    assert frame_governor.level == 1
+
+def test_disabled_governor_does_not_degrade():
+    """Tests if a disabled governor only measures."""
+    frame_governor = FrameGovernor(enabled=False, window=3)
+    render_frames(frame_governor, 6, 0.1)
+    assert frame_governor.level == 0
+
+def test_frame_skip():
+    """Tests if frames are skipped after every rendered frame while frame skipping is active and counted."""
+    frame_governor = FrameGovernor(degradation_order=["frame_skip"], skipped_frames=2)
+    assert frame_governor.should_render()
+    frame_governor.level = 1
+    assert [frame_governor.should_render() for _ in range(6)] == [False, False, True, False, False, True]
+    assert frame_governor.skipped_renders == 4
+    assert frame_governor.active_frames["frame_skip"] == 6
+    assert "4 renders skipped" in frame_governor.get_report()
+    assert frame_governor.has_degraded()
+
+def test_has_degraded():
+    """Tests if only an enabled governor that has degraded frames reports that it has degraded."""
+    frame_governor = FrameGovernor(degradation_order=["frame_skip"])
+    frame_governor.should_render()
+    assert not frame_governor.has_degraded()
+    frame_governor.level = 1
+    frame_governor.should_render()
+    assert frame_governor.has_degraded()
+    frame_governor.enabled = False
+    assert not frame_governor.has_degraded()
+
+def test_refresh_hud():
+    """Tests if HUD texts are only refreshed every few rendered frames while the HUD refresh rate is reduced."""
+    frame_governor = FrameGovernor(degradation_order=["hud_refresh"], hud_refresh_interval=5)
+    frame_governor.rendered_frames = 3
+    assert frame_governor.refresh_hud()
+    frame_governor.level = 1
+    assert not frame_governor.refresh_hud()
+    frame_governor.rendered_frames = 5
+    assert frame_governor.refresh_hud()
+
+def test_unknown_step():
+    """Tests if an unknown degradation step is rejected."""
+    with pytest.raises(ValueError):
+        FrameGovernor(degradation_order=["particles"])
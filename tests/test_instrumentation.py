@@ -0,0 +1,106 @@
+import json
+import os
+import subprocess
+import sys
+import pytest
+from unittest import mock
+from src.instrumentation import Instrumentation
+
+
+# Instrumentation used by the decorators below, which are applied while it is disabled (as at import of the game).
+decorated_instrumentation = Instrumentation()
+
+
+class Decorated:
+    """Class with a method decorated while instrumentation is disabled."""
+
+    @decorated_instrumentation.timer("decorated.method")
+    def method(self):
+        return 42
+
+
+@decorated_instrumentation.counter("decorated.function")
+def counted_function():
+    """Function decorated while instrumentation is disabled."""
+
+
+@pytest.fixture
+def enabled_instrumentation(tmp_path):
+    """Creates an enabled Instrumentation instance writing to a temporary file."""
+    return Instrumentation(True, str(tmp_path / "instrumentation.jsonl"), flush_interval=0.01, build_label="test")
+
+def test_disabled_instrumentation_is_no_op():
+    """Tests if disabled timers and counters leave functions untouched and record nothing."""
+    instrumentation = Instrumentation(enabled=False)
+
+    def function():
+        return 42
+
+    assert instrumentation.timer("function")(function) is function
+    assert instrumentation.counter("function")(function) is function
+    with instrumentation.timer("block"), instrumentation.counter("block"):
+        pass
+    assert instrumentation.timers == {} and instrumentation.counters == {}
+
+def test_configure_replaces_decorated_functions(tmp_path):
+    """Tests if functions decorated while disabled are measured once enabled and restored once disabled again."""
+    undecorated_method = vars(Decorated)["method"]
+    Decorated().method()
+
+    decorated_instrumentation.configure(enabled=True, output_path=str(tmp_path / "instrumentation.jsonl"))
+    try:
+        assert Decorated().method() == 42
+        counted_function()
+        record = decorated_instrumentation.collect()
+        assert record["timers"]["decorated.method"]["count"] == 1
+        assert record["counters"] == {"decorated.function": 1}
+    finally:
+        decorated_instrumentation.configure(enabled=False)
+    assert vars(Decorated)["method"] is undecorated_method
+    assert not hasattr(counted_function, "__wrapped__")
+
+def test_timer_aggregates_durations(enabled_instrumentation):
+    """Tests if a timer records count, total, minimum and maximum as decorator and as context manager."""
+    @enabled_instrumentation.timer("function")
+    def function(value):
+        return value * 2
+
+    with mock.patch("time.perf_counter", side_effect=[0.0, 0.002, 1.0, 1.004]):
+        assert function(21) == 42
+        with enabled_instrumentation.timer("function"):
+            pass
+
+    statistics = enabled_instrumentation.collect()["timers"]["function"]
+    assert statistics["count"] == 2
+    assert statistics["total_ms"] == pytest.approx(6)
+    assert statistics["min_ms"] == pytest.approx(2)
+    assert statistics["max_ms"] == pytest.approx(4)
+
+def test_counter(enabled_instrumentation):
+    """Tests if counters count decorated calls and entered blocks."""
+    counted_function = enabled_instrumentation.counter("calls")(lambda: None)
+    counted_function()
+    counted_function()
+    with enabled_instrumentation.counter("calls"):
+        pass
+
+    assert enabled_instrumentation.collect()["counters"] == {"calls": 3}
+    assert enabled_instrumentation.collect()["counters"] == {}, "Statistics should be reset after collecting!"
+
+def test_flush_thread_writes_json_lines(enabled_instrumentation):
+    """Tests if the background thread appends records and the remaining statistics are written on stop."""
+    enabled_instrumentation.start()
+    enabled_instrumentation.add_count("spawns", 5)
+    enabled_instrumentation.stop()
+
+    with open(enabled_instrumentation.output_path, "r") as file:
+        records = [json.loads(line) for line in file]
+    assert sum(record["counters"].get("spawns", 0) for record in records) == 5
+    assert all(record["build"] == "test" for record in records)
+
+def test_import_outside_of_repository(tmp_path):
+    """Tests if the instrumented modules can be imported from another working directory (without config.json)."""
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    result = subprocess.run([sys.executable, "-c", "import src.game, src.manager"], cwd=tmp_path,
+                            env={**os.environ, "PYTHONPATH": root}, capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr
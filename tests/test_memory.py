@@ -0,0 +1,72 @@
+import gc
+import pytest
+from unittest import mock
+from src.enums import GameState
+from src.memory import LiveObjects, MemoryTracker, live_objects
+
+
+class Enemy:
+    """Stand-in for a sprite class, tracked under its class name."""
+
+@pytest.fixture
+def memory_tracker(tmp_path):
+    """Creates a started MemoryTracker with a fresh live object registry and stops it after the test."""
+    with mock.patch.object(live_objects, "objects", {}):
+        memory_tracker = MemoryTracker(enabled=True, growth_threshold_kb=1, growth_runs=2,
+                                       log_path=str(tmp_path / "memory.log"))
+        memory_tracker.start()
+        yield memory_tracker
+        memory_tracker.stop()
+
+def read_log(memory_tracker):
+    """Returns the content of the memory log."""
+    with open(memory_tracker.log_path, "r") as file:
+        return file.read()
+
+def test_live_objects_are_counted_weakly():
+    """Tests if live objects are counted per class and released objects are no longer counted."""
+    registry = LiveObjects()
+    registry.track(Enemy())
+    assert registry.count() == {}, "Disabled registry should not track objects!"
+
+    registry.enabled = True
+    enemies = [Enemy(), Enemy()]
+    for enemy in enemies:
+        registry.track(enemy)
+    assert registry.count() == {"Enemy": 2}
+
+    del enemies[0]
+    gc.collect()
+    assert registry.count() == {"Enemy": 1}
+
+def test_stale_sprites_are_reported(memory_tracker):
+    """Tests if sprites still alive at the start of a run are reported."""
+    stale_enemy = Enemy()
+    live_objects.track(stale_enemy)
+    memory_tracker.update(GameState.MAIN_MENU)
+    memory_tracker.update(GameState.PLAYING)
+
+    log = read_log(memory_tracker)
+    assert "Run 1 run start" in log
+    assert "stale objects from previous runs: Enemy=1" in log
+
+def test_pause_does_not_start_a_run(memory_tracker):
+    """Tests if resuming from pause continues the run and game over is snapshotted once."""
+    for game_state in [GameState.PLAYING, GameState.PAUSED, GameState.PLAYING, GameState.GAME_OVER,
+                       GameState.GAME_OVER]:
+        memory_tracker.update(game_state)
+
+    log = read_log(memory_tracker)
+    assert memory_tracker.run_number == 1
+    assert log.count("game over") == 1
+
+def test_growth_across_restarts(memory_tracker):
+    """Tests if memory growing on every one of the last restarts is reported."""
+    # The traced memory is read for the run start report, the growth check and the game over report of each run.
+    traced_memory = iter([(size * 1024, size * 1024) for size in [100, 100, 105, 110, 110, 115, 120, 120, 125]])
+    with mock.patch("tracemalloc.get_traced_memory", side_effect=lambda: next(traced_memory)):
+        for _ in range(3):
+            memory_tracker.update(GameState.PLAYING)
+            memory_tracker.update(GameState.GAME_OVER)
+
+    assert "memory grew by 20.0 KiB over the last 2 restarts" in read_log(memory_tracker)
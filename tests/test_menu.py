@@ -1,7 +1,7 @@
 import pytest
 import pygame
 from unittest import mock
-from src.menu import Menu, MainMenu, SettingsMenu, StatsMenu, GameOverMenu, PauseMenu
+from src.menu import Menu, MainMenu, SettingsMenu, StatsMenu, GameOverMenu, PauseMenu, ShopMenu
 
 
 @pytest.fixture
@@ -120,3 +120,15 @@ def test_pause_menu_buttons(pause_menu):
     assert "resume_button" in button_names
     assert "main_menu_button" in button_names
     assert "quit_button" in button_names
+
+def test_shop_menu_loads_icons_on_display(mock_game):
+    """Tests if the shop menu gets its icons of the lazy tier only when it is displayed."""
+    mock_game.screen = pygame.Surface((1344, 768))
+    mock_game.coins = 0
+    shop_menu = ShopMenu(mock_game)
+    icons = [button for button in shop_menu.buttons if button.name in ShopMenu.LAZY_ICONS]
+    assert len(icons) == 3 and all(button.image is None for button in icons)
+
+    shop_menu.display()
+    assert [button.image for button in icons] == [mock_game.assets.shop_icon, mock_game.assets.heart_icon,
+                                                  mock_game.assets.weapon_icon]
@@ -30,18 +30,28 @@ def test_obstacle_initialization(mock_game, obstacle_type, speed):
     assert obstacle.image_list == images
     assert obstacle.image == images[0]
 
-def test_obstacle_moves_correctly(sample_obstacle, mock_game):
+def test_obstacle_moves_correctly(sample_obstacle, mock_game, dt):
     """Tests if the obstacle moves left according to its speed and background speed."""
     initial_x = sample_obstacle.position[0]
-    sample_obstacle.move()
+    sample_obstacle.move(dt)
 
-    expected_x = initial_x - (mock_game.scrolling_bg_speed + sample_obstacle.speed)
-    assert sample_obstacle.position[0] == expected_x, "Obstacle did not move correctly!"
+    expected_x = initial_x - (mock_game.scrolling_bg_speed + sample_obstacle.speed) * dt
+    assert sample_obstacle.position[0] == pytest.approx(expected_x), "Obstacle did not move correctly!"
 
-def test_obstacle_kills_itself_when_off_screen(sample_obstacle):
+@pytest.mark.parametrize("rate", [30, 144, 240])
+def test_obstacle_move_independent_of_rate(mock_game, rate):
+    """Tests if a car moves the same distance per second at different simulation rates."""
+    speed = mock_game.assets.config["car_speed"]
+    obstacle = Obstacle([5000, 480], [pygame.Surface((50, 50))], 'car', speed, mock_game)
+    for _ in range(rate):
+        obstacle.move(1 / rate)
+
+    assert obstacle.position[0] == pytest.approx(5000 - (mock_game.scrolling_bg_speed + speed))
+
+def test_obstacle_kills_itself_when_off_screen(sample_obstacle, dt):
     """Tests if the obstacle is removed when it moves out of the screen."""
     sample_obstacle.position = [-sample_obstacle.image.get_width() - 1, 300]  # Move off-screen left
 
     with mock.patch.object(sample_obstacle, "kill") as mock_kill:
-        sample_obstacle.move()
+        sample_obstacle.move(dt)
         mock_kill.assert_called_once()
@@ -0,0 +1,58 @@
+import json
+import pytest
+import pygame
+from unittest import mock
+from src.pacing import FramePacer, create_display
+
+
+@pytest.mark.parametrize("mode, clock_method", [("sleep", "tick"), ("busy", "tick_busy_loop")])
+def test_tick_uses_clock(mode, clock_method):
+    """Tests if the sleep and busy modes wait with the corresponding clock method."""
+    frame_pacer = FramePacer(60, mode)
+    frame_pacer.clock = mock.Mock()
+    frame_pacer.tick()
+    getattr(frame_pacer.clock, clock_method).assert_called_once_with(60)
+
+def test_hybrid_waits_for_frame_time():
+    """Tests if the hybrid mode waits until the frame time has passed."""
+    frame_pacer = FramePacer(100, "hybrid", spin_ms=2)
+    frame_pacer.tick()
+    assert frame_pacer.tick() >= 0.01
+
+def test_jitter_statistics():
+    """Tests if the deviations from the target frame time are sorted into the histogram buckets."""
+    frame_pacer = FramePacer(100, "sleep")
+    statistics = frame_pacer.get_jitter_statistics([0.010, 0.0104, 0.012, 0.030])
+    assert statistics["histogram"] == [1, 1, 0, 1, 0, 0, 1]
+    assert statistics["mean_ms"] == pytest.approx(5.6)
+    assert statistics["p99_ms"] == pytest.approx(20)
+
+def test_calibration_chooses_lowest_jitter(tmp_path):
+    """Tests if the automatic mode measures every mode, chooses the most even one and caches the choice."""
+    cache_file = tmp_path / "pacing.json"
+    frame_pacer = FramePacer(100, "auto", calibration_frames=4, cache_file=str(cache_file))
+    jitter = {"sleep": 0.004, "busy": 0.0001, "hybrid": 0.0005}
+    for mode in FramePacer.CALIBRATED_MODES:
+        assert frame_pacer.mode == mode
+        frame_pacer.intervals.extend([0.01 + jitter[mode]] * (FramePacer.WARMUP_FRAMES + 4))
+        frame_pacer.calibrate()
+
+    assert frame_pacer.mode == "busy"
+    assert not frame_pacer.pending_modes
+    assert json.loads(cache_file.read_text())["100"]["mode"] == "busy"
+    # The next start uses the cached mode without calibrating again.
+    frame_pacer = FramePacer(100, "auto", cache_file=str(cache_file))
+    assert frame_pacer.mode == "busy"
+    assert not frame_pacer.pending_modes
+
+def test_unknown_mode():
+    """Tests if an unknown mode is rejected."""
+    with pytest.raises(ValueError):
+        FramePacer(60, "fast")
+
+def test_create_display_without_vsync_support():
+    """Tests if the display is created without vsync when the driver does not support it."""
+    surface = mock.Mock()
+    with mock.patch("pygame.display.set_mode", side_effect=[pygame.error("no renderer"), surface]):
+        with pytest.warns(UserWarning):
+            assert create_display((800, 600), vsync=True) == (surface, False)
@@ -0,0 +1,52 @@
+import pytest
+import pygame
+from unittest import mock
+from src.parallax import ParallaxBackground, ParallaxLayer
+from src.render import RenderQueue
+
+
+@pytest.fixture
+def tile():
+    """Creates a tile with a translucent, a transparent and an opaque column."""
+    tile = pygame.Surface((3, 1), pygame.SRCALPHA)
+    tile.fill((255, 0, 0, 128), (0, 0, 1, 1))
+    tile.fill((0, 0, 255, 255), (2, 0, 1, 1))
+    return tile
+
+def test_strip_is_seamless(tile):
+    """Tests if the tile is repeated unchanged until one tile more than the view is covered."""
+    layer = ParallaxLayer(tile, 1.0, 5)
+    assert layer.strip.get_width() == 9
+    for x in range(9):
+        assert layer.strip.get_at((x, 0)) == tile.get_at((x % 3, 0))
+
+def test_scroll_wraps_offset(tile):
+    """Tests if the offset is scaled by the scroll factor and stays within one tile."""
+    layer = ParallaxLayer(tile, 0.5, 5)
+    layer.scroll(4)
+    assert layer.offset == 2
+    layer.scroll(4)
+    assert layer.offset == 1
+
+@pytest.mark.parametrize("previous_offset, offset, expected_x", [
+    (0.4, 1.4, 1),  # Scrolling (snapped to whole pixels)
+    (2.0, 1.0, 0),  # Wrapped around to the start of the tile
+])
+def test_get_area_interpolates(tile, previous_offset, offset, expected_x):
+    """Tests if the visible area is interpolated between the offsets, also when the offset has wrapped around."""
+    layer = ParallaxLayer(tile, 1.0, 5)
+    layer.previous_offset = previous_offset
+    layer.offset = offset
+    assert layer.get_area(0.5) == pygame.Rect(expected_x, 0, 5, 1)
+
+def test_queue_layers(tile):
+    """Tests if each layer is queued as a single area of its strip."""
+    assets = mock.Mock(far=tile, near=tile)
+    background = ParallaxBackground.from_config([{"image": "far", "scroll_factor": 0.25},
+                                                 {"image": "near", "scroll_factor": 1.0, "y": 4}], assets, 5)
+    background.scroll(2)
+    render_queue = RenderQueue()
+    background.queue(render_queue)
+    assert render_queue.layers["background"] == [
+        (background.layers[0].strip, (0, 0), pygame.Rect(0, 0, 5, 1)),
+        (background.layers[1].strip, (0, 4), pygame.Rect(2, 0, 5, 1))]
@@ -33,53 +33,69 @@ def test_player_initialization(sample_player, mock_game):
     assert not sample_player.is_jumping
     assert not sample_player.is_sliding
 
-def test_player_move_left(sample_player, mock_game):
+def test_player_move_left(sample_player, mock_game, dt):
     """Tests if the player moves left correctly within boundaries."""
     initial_x = sample_player.position[0]
-    sample_player.move_left()
+    sample_player.move_left(dt)
 
     assert sample_player.position[0] < initial_x, "Player should move left!"
     sample_player.position[0] = 0
-    sample_player.move_left()
+    sample_player.move_left(dt)
     assert sample_player.position[0] == 0, "Player should not move beyond left boundary!"
 
-def test_player_move_right(sample_player, mock_game):
+def test_player_move_right(sample_player, mock_game, dt):
     """Tests if the player moves right correctly within boundaries."""
     initial_x = sample_player.position[0]
-    sample_player.move_right()
+    sample_player.move_right(dt)
 
     assert sample_player.position[0] > initial_x, "Player should move right!"
     sample_player.position[0] = mock_game.width - sample_player.rect.width
-    sample_player.move_right()
+    sample_player.move_right(dt)
     assert sample_player.position[
                0] == mock_game.width - sample_player.rect.width, "Player should not move beyond right boundary!"
 
-def test_player_jump(sample_player):
+def test_player_jump(sample_player, dt):
     """Tests if the player jumps correctly and follows the jump mechanics."""
     sample_player.is_jumping = True
     initial_y = sample_player.position[1]
 
-    sample_player.jump()
+    sample_player.jump(dt)
     assert sample_player.position[1] < initial_y, "Player should move up when jumping!"
 
     while sample_player.is_jumping:
-        sample_player.jump()
+        sample_player.jump(dt)
 
     assert sample_player.position[1] == initial_y, "Player should be at the ground after landing!"
     assert not sample_player.is_jumping, "Player should not be jumping after landing!"
 
-def test_player_slide(sample_player):
+@pytest.mark.parametrize("rate", [30, 60, 144, 240])
+def test_player_jump_independent_of_rate(sample_player, rate):
+    """Tests if the jump takes the same time and reaches the same height at different simulation rates."""
+    sample_player.is_jumping = True
+    initial_y = sample_player.position[1]
+    highest_y = initial_y
+    steps = 0
+    while sample_player.is_jumping:
+        sample_player.jump(1 / rate)
+        highest_y = min(highest_y, sample_player.position[1])
+        steps += 1
+
+    assert steps / rate == pytest.approx(sample_player.jump_duration, abs=2 / rate)
+    assert initial_y - highest_y == pytest.approx(sample_player.jump_height, rel=0.01)
+    assert sample_player.position[1] == initial_y
+
+def test_player_slide(sample_player, dt):
     """Tests if the player slides correctly and speed decreases over time."""
     sample_player.previous_walking_state = PlayerState.WALKING_RIGHT
     sample_player.is_sliding = True
     initial_x = sample_player.position[0]
 
-    sample_player.slide()
+    sample_player.slide(dt)
     assert sample_player.position[0] > initial_x, "Player should move to the side while sliding!"
     assert sample_player.position[1] == sample_player.slide_height, "Player should change height while sliding!"
 
     while sample_player.is_sliding:
-        sample_player.slide()
+        sample_player.slide(dt)
 
     assert not sample_player.is_sliding, "Player should stop sliding when speed reaches zero!"
     assert sample_player.position[1] == sample_player.rect.top, "Player should be at same height after sliding!"
@@ -96,14 +112,14 @@ def test_player_shoot(sample_player):
         sample_player.shoot()
         mock_fire.assert_not_called()
 
-def test_player_update(sample_player):
+def test_player_update(sample_player, dt):
     """Tests if update correctly calls the necessary functions."""
     with mock.patch.object(sample_player, "handle_input") as mock_handle_input, \
             mock.patch.object(sample_player, "jump") as mock_jump, \
             mock.patch.object(sample_player, "slide") as mock_slide, \
             mock.patch.object(sample_player, "update_animation") as mock_update_animation, \
             mock.patch.object(sample_player.weapon, "update") as mock_weapon_update:
-        sample_player.update()
+        sample_player.update(dt)
 
         mock_handle_input.assert_called_once()
         mock_jump.assert_called_once()
@@ -124,35 +140,35 @@ def test_player_reset(sample_player):
     assert not sample_player.is_jumping, "Player should not be jumping after reset!"
     assert not sample_player.is_sliding, "Player should not be sliding after reset!"
 
-def test_handle_input_movement(sample_player):
+def test_handle_input_movement(sample_player, dt):
     """Tests if the player handles movement inputs correctly."""
     sample_player.game.current_state = GameState.PLAYING
 
     with mock.patch("pygame.key.get_pressed", return_value={
         pygame.K_RIGHT: True, pygame.K_LEFT: False, pygame.K_UP: False, pygame.K_DOWN: False, pygame.K_SPACE: False}):
-        sample_player.handle_input()
+        sample_player.handle_input(dt)
         assert sample_player.current_state == PlayerState.WALKING_RIGHT, "Player should move right!"
 
     with mock.patch("pygame.key.get_pressed", return_value={
         pygame.K_LEFT: True, pygame.K_RIGHT: False, pygame.K_UP: False, pygame.K_DOWN: False, pygame.K_SPACE: False}):
-        sample_player.handle_input()
+        sample_player.handle_input(dt)
         assert sample_player.current_state == PlayerState.WALKING_LEFT, "Player should move left!"
 
     with mock.patch("pygame.key.get_pressed", return_value={
         pygame.K_LEFT: False, pygame.K_RIGHT: False, pygame.K_UP: False, pygame.K_DOWN: False, pygame.K_SPACE: False}):
-        sample_player.handle_input()
+        sample_player.handle_input(dt)
         assert sample_player.current_state == PlayerState.IDLE, "Player should be idle when no keys are pressed!"
 
-def test_handle_input_jump(sample_player):
+def test_handle_input_jump(sample_player, dt):
     """Tests if the player correctly starts jumping when pressing UP."""
     sample_player.game.current_state = GameState.PLAYING
 
     with mock.patch("pygame.key.get_pressed", return_value={
         pygame.K_UP: True, pygame.K_LEFT: False, pygame.K_RIGHT: False, pygame.K_DOWN: False, pygame.K_SPACE: False}):
-        sample_player.handle_input()
+        sample_player.handle_input(dt)
         assert sample_player.is_jumping, "Player should start jumping when UP key is pressed!"
 
-def test_handle_input_slide(sample_player):
+def test_handle_input_slide(sample_player, dt):
     """Tests if the player correctly starts sliding when pressing DOWN while moving."""
     sample_player.game.current_state = GameState.PLAYING
     sample_player.previous_walking_state = PlayerState.WALKING_RIGHT
@@ -160,10 +176,10 @@ def test_handle_input_slide(sample_player):
 
     with mock.patch("pygame.key.get_pressed", return_value={
         pygame.K_DOWN: True, pygame.K_RIGHT: True, pygame.K_UP: False, pygame.K_LEFT: False, pygame.K_SPACE: False}):
-        sample_player.handle_input()
+        sample_player.handle_input(dt)
         assert sample_player.is_sliding, "Player should start sliding when DOWN is pressed while moving!"
 
-def test_handle_input_shoot(sample_player):
+def test_handle_input_shoot(sample_player, dt):
     """Tests if the player correctly shoots when pressing SPACE."""
     sample_player.game.current_state = GameState.PLAYING
     sample_player.shoot_pressed = False
@@ -171,7 +187,7 @@ def test_handle_input_shoot(sample_player):
     with mock.patch("pygame.key.get_pressed", return_value={
         pygame.K_SPACE: True, pygame.K_UP: False, pygame.K_LEFT: False, pygame.K_RIGHT: False, pygame.K_DOWN: False}):
         with mock.patch.object(sample_player, "shoot") as mock_shoot:
-            sample_player.handle_input()
+            sample_player.handle_input(dt)
             mock_shoot.assert_called_once()
             assert sample_player.shoot_pressed, "Player should not continuously fire when holding SPACE!"
 
@@ -182,42 +198,35 @@ def test_handle_input_shoot(sample_player):
     (PlayerState.JUMPING, True),  # If previous walking state was left
     (PlayerState.SLIDING, True)   # If previous walking state was left
 ])
-def test_update_animation(sample_player, player_state, should_flip):
+def test_update_animation(sample_player, player_state, should_flip, dt):
     """Tests if the animation updates correctly based on the player's state."""
     sample_player.current_state = player_state
     # Simulate previous walking state for jumping / sliding
     if player_state in [PlayerState.JUMPING, PlayerState.SLIDING]:
         sample_player.previous_walking_state = PlayerState.WALKING_LEFT if should_flip else PlayerState.WALKING_RIGHT
 
-    sample_player.update_animation()
-    expected_images = sample_player.animations[player_state]
-
-    # If necessary, flip images (like function would)
-    if should_flip:
-        expected_images = [pygame.transform.flip(img, True, False) for img in expected_images]
-
-    # Compare pixel-arrays (actual and expected images)
-    for actual_img, expected_img in zip(sample_player.image_list, expected_images):
-        actual_pixels = pygame.surfarray.array3d(actual_img)
-        expected_pixels = pygame.surfarray.array3d(expected_img)
+    sample_player.update_animation(dt)
 
-        assert (actual_pixels == expected_pixels).all(), f"Animation mismatch for state {player_state}!"
+    # The images are mirrored while drawing, so the animation keeps the original images.
+    assert sample_player.image_list is sample_player.animations[player_state], \
+        f"Animation mismatch for state {player_state}!"
+    assert sample_player.flip_x == should_flip
 
-def test_update_animation_frame(sample_player):
+def test_update_animation_frame(sample_player, dt):
     """Tests if the animation frame updates correctly."""
     initial_frame = sample_player.current_frame
-    sample_player.update_animation_frame()
+    sample_player.update_animation_frame(dt)
 
     assert sample_player.current_frame != initial_frame, "Animation frame should change!"
     assert 0 <= int(sample_player.current_frame) < len(sample_player.image_list), "Frame index should stay within bounds!"
 
-def test_player_invincibility(sample_player):
+def test_player_invincibility(sample_player, dt):
     """Tests if the player correctly handles invincibility duration."""
     sample_player.invincible = True
-    sample_player.invincible_time = 1  # Simulate 1 frame remaining
+    sample_player.invincible_time = dt / 2  # Simulate less than one simulation step remaining
 
-    sample_player.update()  # 1. Update
+    sample_player.update(dt)  # 1. Update
     assert sample_player.invincible is True, "Player should still be invincible!"
 
-    sample_player.update()  # 2. Update (Timer should be 0 now)
+    sample_player.update(dt)  # 2. Update (Timer should be 0 now)
     assert sample_player.invincible is False, "Player should no longer be invincible!"
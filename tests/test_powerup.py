@@ -45,22 +45,22 @@ def test_apply_powerup(sample_powerup, mock_game, powerup_type, expected_effect)
     (700, 0, True),  # Power-up starts high and should move left + down
     (700, 500, False),  # Power-up reaches max fall height and should only move left
 ])
-def test_powerup_moves_correctly(sample_powerup, mock_game, initial_x, initial_y, move_down):
+def test_powerup_moves_correctly(sample_powerup, mock_game, initial_x, initial_y, move_down, dt):
     """Tests if the power-up moves left and (conditionally) down correctly."""
     sample_powerup.position = [initial_x, initial_y]  # Set initial test position
-    sample_powerup.move()
+    sample_powerup.move(dt)
 
     # Expected movement
-    expected_x = initial_x - mock_game.scrolling_bg_speed
-    expected_y = initial_y + sample_powerup.fall_speed if move_down else initial_y
+    expected_x = initial_x - mock_game.scrolling_bg_speed * dt
+    expected_y = initial_y + sample_powerup.fall_speed * dt if move_down else initial_y
 
-    assert sample_powerup.position == [expected_x, expected_y], (f"PowerUp did not move correctly "
+    assert sample_powerup.position == pytest.approx([expected_x, expected_y]), (f"PowerUp did not move correctly "
                                                                  f"from X={initial_x} and Y={initial_y}!")
 
-def test_powerup_kills_itself_when_off_screen(sample_powerup):
+def test_powerup_kills_itself_when_off_screen(sample_powerup, dt):
     """Tests if the power-up is removed when it moves out of the screen."""
     sample_powerup.position = [-sample_powerup.image.get_width() - 1, 100]  # Move off-screen left
 
     with mock.patch.object(sample_powerup, "kill") as mock_kill:
-        sample_powerup.move()
+        sample_powerup.move(dt)
         mock_kill.assert_called_once()
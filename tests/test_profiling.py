@@ -0,0 +1,84 @@
+import pstats
+import sys
+import time
+import pytest
+from unittest import mock
+from src.profiling import CProfileProfiler, Profiler, SamplingProfiler, create_profiler
+
+
+def busy_loop(duration):
+    """Keeps the calling thread busy for the given duration."""
+    end = time.perf_counter() + duration
+    while time.perf_counter() < end:
+        pass
+
+def profiled_function():
+    """Function that is only called while the profiler is running."""
+    return sum(range(100))
+
+def test_playing_scope():
+    """Tests if a profiler with scope "playing" only runs in the playing state."""
+    profiler = SamplingProfiler("profile.folded", "playing")
+    with mock.patch.object(profiler, "start") as mock_start, mock.patch.object(profiler, "stop") as mock_stop:
+        profiler.update(False)
+        profiler.update(True)
+        profiler.update(True)
+        profiler.update(False)
+
+    mock_start.assert_called_once()
+    mock_stop.assert_called_once()
+
+def test_cprofile_profiler(tmp_path):
+    """Tests if the cProfile profiler writes a .prof file containing the profiled calls."""
+    profiler = CProfileProfiler(str(tmp_path / "profile.prof"))
+    profiler.update(False)
+    profiled_function()
+    profiler.finish()
+
+    function_names = [function[2] for function in pstats.Stats(profiler.output_path).stats]
+    assert "profiled_function" in function_names
+
+def test_sampling_profiler(tmp_path):
+    """Tests if the sampling profiler writes collapsed stacks of the profiled thread."""
+    profiler = SamplingProfiler(str(tmp_path / "profile.folded"), interval=0.001)
+    profiler.update(False)
+    busy_loop(0.2)
+    profiler.finish()
+
+    with open(profiler.output_path, "r") as file:
+        lines = file.read().splitlines()
+    assert any("test_sampling_profiler" in line and line.split(";")[-1].startswith("busy_loop") for line in lines)
+    assert all(line.rsplit(" ", 1)[1].isdigit() for line in lines)
+
+def test_sampling_profiler_save_while_sampling(tmp_path):
+    """Tests if the stacks are saved while the sampler thread still counts samples."""
+    profiler = SamplingProfiler(str(tmp_path / "profile.folded"), interval=0)
+    profiler.start()
+    busy_loop(0.05)
+    for _ in range(20):
+        profiler.save()
+    profiler.finish()
+
+    with open(profiler.output_path, "r") as file:
+        assert file.read()
+
+def test_profiler_is_abstract():
+    """Tests if the base class cannot be used without implementing start, stop and save."""
+    with pytest.raises(TypeError):
+        Profiler("profile.prof")
+
+def test_collapse_stack():
+    """Tests if stacks are collapsed from the outermost to the innermost frame."""
+    def inner():
+        return SamplingProfiler.collapse_stack(sys._getframe())
+
+    frames = inner().split(";")
+    assert frames[-2].startswith("test_collapse_stack (test_profiling.py:")
+    assert frames[-1].startswith("inner (test_profiling.py:")
+
+def test_create_profiler():
+    """Tests if the profiling modes create the matching profilers."""
+    assert isinstance(create_profiler("cprofile"), CProfileProfiler)
+    assert isinstance(create_profiler("sample", scope="playing"), SamplingProfiler)
+    with pytest.raises(ValueError):
+        create_profiler("perf")
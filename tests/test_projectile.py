@@ -23,32 +23,32 @@ def test_projectile_initialization(sample_projectile):
     assert len(sample_projectile.image_list) > 0
     assert sample_projectile.image == sample_projectile.image_list[0]
 
-def test_projectile_movement(sample_projectile):
+def test_projectile_movement(sample_projectile, dt):
     """Tests if the projectile moves correctly according to its velocity."""
     initial_position = sample_projectile.position.copy()
-    sample_projectile.update()
+    sample_projectile.update(dt)
 
-    expected_x = initial_position[0] + sample_projectile.velocity[0]
-    expected_y = initial_position[1] + sample_projectile.velocity[1]
+    expected_x = initial_position[0] + sample_projectile.velocity[0] * dt
+    expected_y = initial_position[1] + sample_projectile.velocity[1] * dt
 
-    assert sample_projectile.position == [expected_x, expected_y], "Projectile did not move correctly!"
+    assert sample_projectile.position == pytest.approx([expected_x, expected_y]), "Projectile did not move correctly!"
 
-def test_projectile_removal_off_screen(sample_projectile):
+def test_projectile_removal_off_screen(sample_projectile, dt):
     """Tests if the projectile is removed when it moves out of the screen."""
     sample_projectile.position = [-10, -10]  # set projectile position outside the screen
     sample_projectile.rect.topleft = (-10, -10)  # Update rect position to match
 
     with mock.patch.object(sample_projectile, "kill") as mock_kill:
-        sample_projectile.update()
+        sample_projectile.update(dt)
         mock_kill.assert_called_once()  # Check, if `kill()` was called
 
-def test_projectile_gives_shot_back_to_player(sample_projectile, mock_game):
+def test_projectile_gives_shot_back_to_player(sample_projectile, mock_game, dt):
     """Tests if a player gets a shot back when the projectile is removed."""
     sample_projectile.position = [-10, -10]  # set projectile position outside the screen
     sample_projectile.rect.topleft = (-10, -10)  # Update rect position to match
     initial_shots = mock_game.player.sprite.weapon.shots
 
-    sample_projectile.update()
+    sample_projectile.update(dt)
 
     assert mock_game.player.sprite.weapon.shots == initial_shots + 1, "Player should have received a shot back!"
 
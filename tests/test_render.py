@@ -0,0 +1,87 @@
+import pygame
+from unittest import mock
+from src.render import RenderQueue
+
+
+def test_flush_draws_layer_with_single_call():
+    """Tests if a layer is drawn with one blits call in the order it was queued and emptied afterwards."""
+    render_queue = RenderQueue()
+    group = pygame.sprite.Group()
+    for x in (0, 10):
+        sprite = pygame.sprite.Sprite(group)
+        sprite.image = pygame.Surface((5, 5))
+        sprite.rect = sprite.image.get_rect(topleft=(x, 0))
+        sprite.flip_x = False
+    icon = pygame.Surface((2, 2))
+    render_queue.add_group("sprites", group)
+    render_queue.add("sprites", icon, (1, 2))
+
+    # The queue is reused for the next frame, so record a copy of the blit sequence.
+    blit_sequences = []
+    target = mock.Mock()
+    target.blits.side_effect = lambda blit_sequence, doreturn: blit_sequences.append(list(blit_sequence))
+    render_queue.flush(target, "sprites")
+
+    target.blits.assert_called_once()
+    blit_sequence, = blit_sequences
+    assert [destination for _, destination in blit_sequence] == [sprite.rect for sprite in group] + [(1, 2)]
+    assert target.blits.call_args.kwargs == {"doreturn": False}
+    assert render_queue.layers["sprites"] == []
+
+def test_add_group_interpolates_positions():
+    """Tests if sprites are queued between their previous and current position."""
+    sprite = pygame.sprite.Sprite()
+    sprite.image = pygame.Surface((5, 5))
+    sprite.rect = sprite.image.get_rect(topleft=(10, 20))
+    sprite.previous_topleft = (0, 20)
+    sprite.flip_x = False
+    render_queue = RenderQueue()
+    render_queue.add_group("sprites", [sprite], alpha=0.5)
+    assert render_queue.layers["sprites"] == [(sprite.image, (5, 20))]
+
+def test_add_group_scales_positions():
+    """Tests if world positions are converted to positions on a canvas with internal resolution."""
+    sprite = pygame.sprite.Sprite()
+    sprite.image = pygame.Surface((5, 5))
+    sprite.rect = sprite.image.get_rect(topleft=(10, 20))
+    sprite.previous_topleft = (0, 20)
+    sprite.flip_x = False
+    render_queue = RenderQueue(scale=0.5)
+    render_queue.add_group("sprites", [sprite])
+    render_queue.add_group("sprites", [sprite], alpha=0.5)
+    assert render_queue.layers["sprites"] == [(sprite.image, (5, 10)), (sprite.image, (2.5, 10))]
+
+def test_add_group_mirrors_sprites():
+    """Tests if mirrored sprites are queued with a cached mirrored image or with a flip flag for the target."""
+    sprite = pygame.sprite.Sprite()
+    sprite.image = pygame.Surface((2, 1))
+    sprite.image.fill("red", (0, 0, 1, 1))
+    sprite.rect = sprite.image.get_rect()
+    sprite.flip_x = True
+    render_queue = RenderQueue()
+    render_queue.add_group("sprites", [sprite])
+    render_queue.add_group("sprites", [sprite])
+    (first_image, _), (second_image, _) = render_queue.layers["sprites"]
+    assert first_image is second_image
+    assert first_image.get_at((1, 0)) == pygame.Color("red")
+
+    render_queue = RenderQueue(flip_at_draw=True)
+    render_queue.add_group("sprites", [sprite])
+    assert render_queue.layers["sprites"] == [(sprite.image, sprite.rect, None, True)]
+
+def test_flush_empty_layer():
+    """Tests if an empty layer does not draw anything."""
+    target = mock.Mock()
+    RenderQueue().flush(target, "hud")
+    target.blits.assert_not_called()
+
+def test_flush_draws_on_surface():
+    """Tests if the queued surfaces end up on the target surface."""
+    target = pygame.Surface((4, 4))
+    red = pygame.Surface((2, 2))
+    red.fill("red")
+    render_queue = RenderQueue()
+    render_queue.add("hud", red, (2, 2))
+    render_queue.flush(target, "hud")
+    assert target.get_at((3, 3)) == pygame.Color("red")
+    assert target.get_at((0, 0)) == pygame.Color("black")
@@ -0,0 +1,32 @@
+from unittest import mock
+from src.startup import StartupReport
+
+
+def test_mark_records_phases():
+    """Tests if every mark ends a phase with the time since the previous mark."""
+    with mock.patch("time.perf_counter", side_effect=[1.0, 1.5, 2.25]):
+        startup_report = StartupReport()
+        startup_report.mark("display")
+        startup_report.mark("assets")
+
+    assert startup_report.phases == [("display", 0.5), ("assets", 0.75)]
+
+def test_print_report(capsys):
+    """Tests if the report prints all phases and the total, including the time before the report was created."""
+    with mock.patch.object(StartupReport, "get_process_age", return_value=0.25):
+        startup_report = StartupReport(enabled=True)
+    startup_report.phases = [("display", 0.5), ("first frame", 0.25)]
+    startup_report.print_report()
+
+    output = capsys.readouterr().out
+    assert "process start until report creation" in output
+    assert "display" in output and "500.00 ms" in output
+    assert "total" in output and "1000.00 ms" in output
+
+def test_disabled_report_prints_nothing(capsys):
+    """Tests if a disabled report does not print anything."""
+    startup_report = StartupReport()
+    startup_report.mark("display")
+    startup_report.print_report()
+
+    assert capsys.readouterr().out == ""
@@ -0,0 +1,26 @@
+import subprocess
+import sys
+from src.table import Table
+
+
+def test_table_from_columns():
+    """Tests if a table is created with columns, rows and shape."""
+    table = Table({"Run": [1, 2, 3], "Distance": [10, 20, 30]})
+
+    assert table.columns == ["Run", "Distance"]
+    assert table.rows == [[1, 10], [2, 20], [3, 30]]
+    assert table.shape == (3, 2)
+    assert not table.empty
+
+def test_empty_table():
+    """Tests if a table without rows is empty."""
+    table = Table({"Run": [], "Distance": []})
+
+    assert table.empty
+    assert table.shape == (0, 2)
+
+def test_menu_does_not_import_pandas():
+    """Tests if importing the menus does not load pandas (checked in a fresh interpreter)."""
+    result = subprocess.run([sys.executable, "-c", "import sys, src.menu; print('pandas' in sys.modules)"],
+                            capture_output=True, text=True, check=True)
+    assert result.stdout.split()[-1] == "False"
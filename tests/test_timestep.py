@@ -0,0 +1,32 @@
+import pytest
+from src.timestep import FixedTimestep, interpolate_position
+
+
+def test_advance_runs_whole_steps():
+    """Tests if the accumulated time is consumed in whole steps and the remainder is kept for the next frame."""
+    timestep = FixedTimestep(100)
+    assert timestep.advance(0.025) == 2
+    assert timestep.alpha == pytest.approx(0.5)
+    assert timestep.advance(0.004) == 0
+    assert timestep.alpha == pytest.approx(0.9)
+    assert timestep.advance(0.002) == 1
+    assert timestep.alpha == pytest.approx(0.1)
+
+def test_advance_drops_time_after_hitch():
+    """Tests if a long frame runs at most the maximum number of steps and drops the time that cannot be caught up."""
+    timestep = FixedTimestep(100, max_updates_per_frame=5)
+    assert timestep.advance(1.0) == 5
+    assert 0 <= timestep.alpha < 1
+    assert timestep.advance(0.01) == 1
+
+def test_reset():
+    """Tests if reset empties the accumulator."""
+    timestep = FixedTimestep(100)
+    timestep.advance(0.005)
+    timestep.reset()
+    assert timestep.alpha == 0
+
+def test_interpolate_position():
+    """Tests if positions are interpolated, unless the object has been placed at a new position."""
+    assert interpolate_position((0, 10), (10, 30), 0.25) == (2.5, 15)
+    assert interpolate_position((0, 10), (500, 10), 0.25) == (500, 10)
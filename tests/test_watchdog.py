@@ -0,0 +1,63 @@
+import gc
+import time
+import pytest
+from unittest import mock
+from src.enums import GameState
+from src.watchdog import HitchDetector
+
+
+@pytest.fixture
+def hitch_detector(tmp_path):
+    """Creates a started HitchDetector with a small budget and stops it after the test."""
+    hitch_detector = HitchDetector(budget_ms=20, log_path=str(tmp_path / "hitches.log"))
+    hitch_detector.start()
+    yield hitch_detector
+    hitch_detector.stop()
+
+def slow_function():
+    """Blocks the main thread long enough for the watchdog to take a stack snapshot."""
+    time.sleep(0.1)
+
+def read_log(hitch_detector):
+    """Stops the hitch detector and returns the content of its log file."""
+    hitch_detector.stop()
+    with open(hitch_detector.log_path, "r") as file:
+        return file.read()
+
+def test_hitch_is_logged_with_stack(hitch_detector):
+    """Tests if a frame exceeding the budget is logged with state, entity counts and the stack during the hitch."""
+    count_entities = mock.Mock(return_value={"enemies": 3})
+    hitch_detector.begin_frame()
+    slow_function()
+    hitch_detector.end_frame(GameState.PLAYING, count_entities)
+
+    log = read_log(hitch_detector)
+    assert "Hitch in frame 1" in log
+    assert "state PLAYING" in log and "enemies=3" in log
+    assert "in slow_function" in log
+
+def test_short_frame_is_not_logged(hitch_detector):
+    """Tests if frames within the budget are not logged and entities are not counted."""
+    count_entities = mock.Mock()
+    hitch_detector.begin_frame()
+    hitch_detector.end_frame(GameState.PLAYING, count_entities)
+
+    assert read_log(hitch_detector) == ""
+    count_entities.assert_not_called()
+
+def test_gc_time_is_tracked(hitch_detector):
+    """Tests if garbage collections during a frame are added to the frame's gc time."""
+    hitch_detector.begin_frame()
+    gc.collect()
+
+    assert hitch_detector.gc_time > 0
+
+def test_disabled_hitch_detector(tmp_path):
+    """Tests if a disabled hitch detector neither starts a thread nor watches frames."""
+    hitch_detector = HitchDetector(enabled=False, log_path=str(tmp_path / "hitches.log"))
+    hitch_detector.start()
+    hitch_detector.begin_frame()
+    hitch_detector.end_frame(GameState.PLAYING, mock.Mock())
+
+    assert hitch_detector.helper_thread is None
+    assert hitch_detector.hitches.empty()